@@ -1,54 +1,108 @@
-import pandas as pd
-import networkx as nx
-import math
+import argparse
+import os
+from collections import namedtuple
+
+from kci_authors import build_author_index
+from kci_coauthor import CoauthorTimeline
+from kci_dataset import CHUNK_ROWS, detect_encoding, load_articles, read_columns
+from kci_search_index import open_index
+from kci_stream import analyze_stream
+
+# AI/XR 관련 확장 키워드 목록 (제목 + 초록 + 키워드_상세에서 검색)
+AI_XR_KEYWORDS = [
+    'ai', '인공지능', 'artificial intelligence', 'xr', '확장현실', 'extended reality',
+    'vr', '가상현실', 'virtual reality', 'ar', '증강현실', 'augmented reality',
+    'digital twin', '디지털 트윈', 'llm', '대규모 언어 모델', 'large language model',
+    'deep learning', '딥러닝', 'machine learning', '머신러닝'
+]
+
+STUDY_YEARS = (2015, 2024)
+COAUTHOR_PERIODS = [(2015, 2019), (2020, 2024)]
+# 이보다 큰 CSV는 기본으로 조각 단위(스트리밍)로 분석
+STREAM_MIN_BYTES = int(os.environ.get('KCI_STREAM_MIN_BYTES', str(1024 ** 3)))
+
+# 두 분석 방식이 함께 출력하는 결과: 연도별 논문 수(2015-2024), 연도별 AI/XR 포함 논문 수, 기간별 공저 네트워크 밀도
+AnalysisSummary = namedtuple('AnalysisSummary', ['yearly_counts', 'ai_xr_counts', 'densities'])
+
+def check_required_columns(columns):
+    """필요한 컬럼이 존재하는지 확인하고, 없으면 안내를 출력한 뒤 False 를 반환합니다."""
+    required_cols = {'발행년도', '저자', '제목', '저자_상세', '초록', '키워드_상세'} # '초록', '키워드_상세' 추가
+    if not required_cols.issubset(columns):
+        missing_cols = required_cols - set(columns)
+        print(f"오류: 필수 컬럼이 파일에 없습니다. 누락된 컬럼: {', '.join(missing_cols)}")
+        print("파일의 실제 컬럼명:", list(columns))
+        return False
+    return True
+
+def summarize_in_memory(file_path):
+    """CSV 전체를 DataFrame 으로 읽어(캐시 재사용) 지표를 계산합니다. 필수 컬럼이 없으면 None."""
+    # 인코딩 판별, 타입 변환, 저자 목록 분리는 kci_dataset 에서 처리 (캐시 재사용)
+    df_kci = load_articles(file_path)
+
+    # 컬럼 이름 매핑 (사용자 제공 컬럼 이름에 맞춤)
+    # 필요한 컬럼이 존재하는지 먼저 확인하는 로직 추가
+    if not check_required_columns(df_kci.columns):
+        return None
 
-def analyze_kci_data(file_path):
+    # 2015-2024년 데이터 필터링
+    start, end = STUDY_YEARS
+    df_kci_filtered = df_kci[(df_kci['발행년도'] >= start) & (df_kci['발행년도'] <= end)].copy() # .copy()를 추가하여 SettingWithCopyWarning 방지
+    df_grp_kci_yearly = df_kci_filtered.groupby("발행년도").size().reindex(range(start, end + 1), fill_value=0)
+
+    # 제목 + 초록 + 키워드_상세 전문 검색 색인으로 연도별 포함 논문 수 조회 (대소문자 무시, 부분 문자열 일치)
+    # 색인은 처음 한 번 만들고 이후에는 새로 추가/변경된 논문만 반영
+    with open_index(df_kci) as search_index:
+        ai_xr_counts = search_index.year_counts(AI_XR_KEYWORDS, start=start, end=end)
+
+    # 연도별 공저 행렬을 한 번만 만들고 기간별 네트워크는 해당 연도 행렬의 합으로 계산
+    # (nx.density 와 같은 값, 노드 1개 이하이면 0)
+    timeline = CoauthorTimeline(build_author_index(df_kci_filtered, '저자_상세'))
+    densities = [timeline.window(period_start, period_end).density() for period_start, period_end in COAUTHOR_PERIODS]
+    return AnalysisSummary(df_grp_kci_yearly, ai_xr_counts, densities)
+
+def summarize_stream(file_path, chunk_rows=CHUNK_ROWS):
+    """
+    CSV 를 chunk_rows 행씩 한 번만 읽으며 같은 지표를 누적합니다. (kci_stream, 메모리 사용량이 본문 크기와 무관)
+    결과는 summarize_in_memory 와 같습니다. 필수 컬럼이 없으면 None.
+    """
+    encoding = detect_encoding(file_path)
+    if not check_required_columns(read_columns(file_path, encoding)):
+        return None
+
+    start, end = STUDY_YEARS
+    analysis = analyze_stream(file_path, AI_XR_KEYWORDS, COAUTHOR_PERIODS, chunk_rows, encoding)
+    densities = [analysis.period_network(period_start, period_end).density
+                 for period_start, period_end in COAUTHOR_PERIODS]
+    return AnalysisSummary(analysis.yearly_counts(start, end), analysis.keyword_year_counts(start, end), densities)
+
+def analyze_kci_data(file_path, stream=None, chunk_rows=CHUNK_ROWS):
     """
     KCI 데이터를 분석하여 논문 수, CAGR, AI/XR 키워드 비율, 공저 네트워크 밀도를 계산합니다.
 
     Args:
         file_path (str): KCI CSV 파일의 경로.
+        stream (bool): True 이면 CSV 를 조각 단위로 한 번만 읽어 분석합니다. (결과는 같음)
+            None 이면 파일 크기가 STREAM_MIN_BYTES 이상일 때만 스트리밍으로 분석합니다.
+        chunk_rows (int): 스트리밍 분석에서 한 번에 읽을 행 수.
     """
     try:
-        # 파일 인코딩 문제 해결을 위해 'cp949' 또는 'euc-kr' 시도
-        df_kci = pd.read_csv(file_path, encoding='utf-8')
-    except UnicodeDecodeError:
-        try:
-            df_kci = pd.read_csv(file_path, encoding='cp949')
-        except UnicodeDecodeError:
-            df_kci = pd.read_csv(file_path, encoding='euc-kr')
+        if stream is None:
+            stream = os.path.getsize(file_path) >= STREAM_MIN_BYTES
+        summary = summarize_stream(file_path, chunk_rows) if stream else summarize_in_memory(file_path)
     except FileNotFoundError:
         print(f"오류: '{file_path}' 파일을 찾을 수 없습니다. 파일 경로를 확인해주세요.")
         return
-
-    # 컬럼 이름 매핑 (사용자 제공 컬럼 이름에 맞춤)
-    # 필요한 컬럼이 존재하는지 먼저 확인하는 로직 추가
-    required_cols = {'발행년도', '저자', '제목', '저자_상세', '초록', '키워드_상세'} # '초록', '키워드_상세' 추가
-    if not required_cols.issubset(df_kci.columns):
-        missing_cols = required_cols - set(df_kci.columns)
-        print(f"오류: 필수 컬럼이 파일에 없습니다. 누락된 컬럼: {', '.join(missing_cols)}")
-        print("파일의 실제 컬럼명:", df_kci.columns.tolist())
+    if summary is None:
         return
 
-    # 데이터 타입 변환 및 누락 값 처리 (수정된 컬럼명 사용)
-    df_kci['발행년도'] = pd.to_numeric(df_kci['발행년도'], errors='coerce').fillna(0).astype(int)
-    df_kci['저자'] = df_kci['저자'].astype(str)
-    df_kci['저자_상세'] = df_kci['저자_상세'].astype(str).fillna('') # '저자_상세' 추가
-    df_kci['제목'] = df_kci['제목'].astype(str).fillna('')
-    df_kci['초록'] = df_kci['초록'].astype(str).fillna('') # '초록' 추가
-    df_kci['키워드_상세'] = df_kci['키워드_상세'].astype(str).fillna('') # '키워드_상세' 추가
-
-    # 2015-2024년 데이터 필터링
-    df_kci_filtered = df_kci[(df_kci['발행년도'] >= 2015) & (df_kci['발행년도'] <= 2024)].copy() # .copy()를 추가하여 SettingWithCopyWarning 방지
-
     print("--- KCI 데이터 분석 결과 ---")
 
     # --- 1. 총 논문 수 (2015-2024) ---
-    total_kci_articles = len(df_kci_filtered)
+    df_grp_kci_yearly = summary.yearly_counts
+    total_kci_articles = int(df_grp_kci_yearly.sum())
     print(f"\n1. 총 KCI 논문 수 (2015-2024): {total_kci_articles}편")
 
     # --- 2. 연도별 출판량 및 CAGR ---
-    df_grp_kci_yearly = df_kci_filtered.groupby("발행년도").size().reindex(range(2015, 2025), fill_value=0)
     print("\n2. KCI 논문 연도별 출판량 (2015-2024):\n", df_grp_kci_yearly)
 
     articles_2015 = df_grp_kci_yearly.loc[2015] if 2015 in df_grp_kci_yearly.index else 0
@@ -71,38 +125,16 @@ def analyze_kci_data(file_path):
     print(f"   - KCI 연평균 성장률(CAGR, 2019-2024): {round(cagr_kci_2019_2024*100, 2)} %")
 
     # --- 3. AI/XR 키워드 포함 비율 (2015 vs 2024) ---
-    def contains_keywords_in_combined_text(text_combined, keywords):
-        text_lower = str(text_combined).lower() # Ensure text is string and lowercased
-        return any(kw.lower() in text_lower for kw in keywords)
-
-    # 확장된 키워드 목록
-    ai_xr_keywords = [
-        'ai', '인공지능', 'artificial intelligence', 'xr', '확장현실', 'extended reality',
-        'vr', '가상현실', 'virtual reality', 'ar', '증강현실', 'augmented reality',
-        'digital twin', '디지털 트윈', 'llm', '대규모 언어 모델', 'large language model',
-        'deep learning', '딥러닝', 'machine learning', '머신러닝'
-    ]
-
-    # 각 연도별 AI/XR 관련 논문 필터링
-    df_kci_2015_only = df_kci_filtered[df_kci_filtered['발행년도'] == 2015]
-    df_kci_2024_only = df_kci_filtered[df_kci_filtered['발행년도'] == 2024]
+    ai_xr_counts = summary.ai_xr_counts
 
     # 2015년 AI/XR 관련 논문 수 (제목 + 초록 + 키워드_상세 기준)
-    ai_xr_count_2015 = df_kci_2015_only[
-        df_kci_2015_only.apply(lambda row: contains_keywords_in_combined_text(
-            str(row['제목']) + ' ' + str(row['초록']) + ' ' + str(row['키워드_상세']), ai_xr_keywords
-        ), axis=1)
-    ].shape[0]
-    total_articles_2015_for_ratio = len(df_kci_2015_only)
+    ai_xr_count_2015 = int(ai_xr_counts.get(2015, 0))
+    total_articles_2015_for_ratio = int(df_grp_kci_yearly.loc[2015])
     ai_xr_ratio_2015 = (ai_xr_count_2015 / total_articles_2015_for_ratio * 100) if total_articles_2015_for_ratio > 0 else 0
 
     # 2024년 AI/XR 관련 논문 수 (제목 + 초록 + 키워드_상세 기준)
-    ai_xr_count_2024 = df_kci_2024_only[
-        df_kci_2024_only.apply(lambda row: contains_keywords_in_combined_text(
-            str(row['제목']) + ' ' + str(row['초록']) + ' ' + str(row['키워드_상세']), ai_xr_keywords
-        ), axis=1)
-    ].shape[0]
-    total_articles_2024_for_ratio = len(df_kci_2024_only)
+    ai_xr_count_2024 = int(ai_xr_counts.get(2024, 0))
+    total_articles_2024_for_ratio = int(df_grp_kci_yearly.loc[2024])
     ai_xr_ratio_2024 = (ai_xr_count_2024 / total_articles_2024_for_ratio * 100) if total_articles_2024_for_ratio > 0 else 0
 
     print(f"\n3. AI/XR 키워드 포함 논문 비율 (제목 + 초록 + 키워드_상세 기준):")
@@ -110,32 +142,7 @@ def analyze_kci_data(file_path):
     print(f"   - 2024년: {ai_xr_count_2024} / {total_articles_2024_for_ratio} ({round(ai_xr_ratio_2024, 2)} %)")
 
     # --- 4. 공저 네트워크 밀도 (2015-2019 vs 2020-2024) ---
-    def calculate_network_density(df_subset_network):
-        edges = []
-        for _, r in df_subset_network.iterrows():
-            # '저자_상세' 컬럼을 사용하여 공저자 분석
-            authors_raw = str(r["저자_상세"]).split(";")
-            authors = [a.strip() for a in authors_raw if a.strip()]
-            
-            # KCI 데이터에서 '저자_상세'에 중복 저자명이 '; '로 연결되어 있을 수 있으므로 set으로 중복 제거
-            authors = list(set(authors)) # 중복 제거
-            
-            if len(authors) > 1: # 공저 논문만 고려
-                for i in range(len(authors)):
-                    for j in range(i+1, len(authors)):
-                        if authors[i] and authors[j]:
-                            edges.append(tuple(sorted((authors[i], authors[j])))) # 엣지 정렬하여 추가
-        G = nx.Graph()
-        G.add_edges_from(edges)
-        if G.number_of_nodes() > 1:
-            return nx.density(G)
-        return 0.0 # 노드가 0개 또는 1개인 경우 밀도는 0
-
-    df_kci_2015_2019 = df_kci_filtered[(df_kci_filtered['발행년도'] >= 2015) & (df_kci_filtered['발행년도'] <= 2019)]
-    df_kci_2020_2024 = df_kci_filtered[(df_kci_filtered['발행년도'] >= 2020) & (df_kci_filtered['발행년도'] <= 2024)]
-
-    density_2015_2019 = calculate_network_density(df_kci_2015_2019)
-    density_2020_2024 = calculate_network_density(df_kci_2020_2024)
+    density_2015_2019, density_2020_2024 = summary.densities
 
     print(f"\n4. KCI 공저 네트워크 밀도 ('저자_상세' 컬럼 기반):")
     print(f"   - 2015-2019년 기간: {round(density_2015_2019, 4)}") # 소수점 자리수 늘림
@@ -143,5 +150,12 @@ def analyze_kci_data(file_path):
 
 # 스크립트 실행 부분
 if __name__ == "__main__":
-    kci_file_name = "kci_articles_all_fields_with_details.csv"
-    analyze_kci_data(kci_file_name)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='KCI 논문 데이터 분석')
+    parser.add_argument('csv', nargs='?', default="kci_articles_all_fields_with_details.csv")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--stream', dest='stream', action='store_const', const=True,
+                      help='CSV 를 조각 단위로 한 번만 읽어 분석 (기본: 파일 크기가 KCI_STREAM_MIN_BYTES 이상일 때)')
+    mode.add_argument('--in-memory', dest='stream', action='store_const', const=False, help='CSV 전체를 메모리에 읽어 분석')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='스트리밍 분석에서 한 번에 읽을 행 수')
+    args = parser.parse_args()
+    analyze_kci_data(args.csv, args.stream, args.chunk_rows)
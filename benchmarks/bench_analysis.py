@@ -0,0 +1,259 @@
+"""
+가상 데이터(kci_synthetic)로 분석 단계별 실행 시간과 최대 메모리를 규모별로 측정하는 벤치마크입니다.
+
+측정 단계: load(CSV 파싱/타입 정리), analyze(analyze_kci_data 전체), analyze_stream(조각 단위 스트리밍 분석),
+keywords(AI/XR 키워드 판정),
+search_index(전문 검색 색인 생성 + 연도별 질의), coauthor(저자 사전, 공저 네트워크, 시기별/이동 구간 지표),
+tokenize(한국어 토큰화), trends(TF-IDF 트렌드), layout(공저 네트워크 배치)
+
+- 시간: 캐시를 비운 상태에서 --repeat 번 실행한 최솟값
+- 메모리: 따로 한 번 더 실행하며 tracemalloc 으로 잰 최대 할당량 (파이썬/numpy 할당만, Arrow/SQLite 내부와 자식 프로세스 제외)
+- 회귀 판정 (하나라도 넘으면 종료 코드 1)
+  · --save-baseline 으로 저장한 기준보다 시간이 --time-tolerance, 메모리가 --memory-tolerance 이상 늘어난 경우
+  · 가장 작은 규모와 가장 큰 규모 사이의 시간 증가 지수(log 시간비 / log 규모비)가 --max-exponent 를 넘는 경우
+    (기계와 관계없이 O(n²) 같은 비용 증가를 잡아냄, 1.0 이면 선형)
+
+측정 중 만드는 캐시(Parquet, 검색 색인, 토큰 캐시)는 임시 디렉토리를 쓰므로 실제 데이터의 캐시는 바뀌지 않습니다.
+    python benchmarks/bench_analysis.py --papers 10000 50000
+    python benchmarks/bench_analysis.py --papers 10000 100000 --save-baseline
+    python benchmarks/bench_analysis.py --papers 10000 100000 --stages coauthor trends
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# 저장소 모듈을 불러오기 전에 캐시 위치를 임시 디렉토리로 바꿈
+BENCH_CACHE_DIR = tempfile.mkdtemp(prefix='kci_bench_')
+os.environ['KCI_CACHE_DIR'] = BENCH_CACHE_DIR
+for name in ('KCI_SEARCH_INDEX', 'KCI_TOKEN_CACHE', 'KCI_LAYOUT_CACHE'):
+    os.environ.pop(name, None)
+
+from analyze_kci import AI_XR_KEYWORDS, analyze_kci_data
+from kci_authors import build_author_index
+from kci_coauthor import CoauthorTimeline, build_coauthor_network
+from kci_dataset import load_articles
+from kci_keywords import TARGET_KEYWORDS, KeywordMatcher, combine_columns
+from kci_layout import layout_network
+from kci_search_index import open_index
+from kci_synthetic import synthetic_csv
+from kci_tokenize import PRETOKENIZED_PATTERN, tokenize_articles
+from kci_trends import TrendEngine
+
+CORPUS_DIR = os.path.join(ROOT, '.kci_cache', 'synthetic')
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'analysis_baseline.json')
+TIME_TOLERANCE = 0.5
+MEMORY_TOLERANCE = 0.25
+MAX_SCALING_EXPONENT = 1.5
+# 이보다 짧은 측정값은 잡음이 커서 회귀 판정에 쓰지 않음
+MIN_SECONDS = 0.2
+MIN_MEGABYTES = 5.0
+
+Corpus = namedtuple('Corpus', ['papers', 'csv_path', 'df', 'tokens', 'network'])
+Measurement = namedtuple('Measurement', ['seconds', 'peak_mb'])
+
+
+def stage_load(corpus):
+    load_articles(corpus.csv_path)
+
+def stage_analyze(corpus):
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyze_kci_data(corpus.csv_path)
+
+def stage_analyze_stream(corpus):
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyze_kci_data(corpus.csv_path, stream=True)
+
+def stage_keywords(corpus):
+    KeywordMatcher(AI_XR_KEYWORDS).any(combine_columns(corpus.df))
+
+def stage_search_index(corpus):
+    with open_index(corpus.df) as search_index:
+        search_index.year_counts(AI_XR_KEYWORDS, start=2015, end=2024)
+
+def stage_coauthor(corpus):
+    author_index = build_author_index(corpus.df, '저자_상세')
+    build_coauthor_network(author_index).top_authors(30)
+    timeline = CoauthorTimeline(author_index)
+    timeline.window(2015, 2019).density()
+    timeline.window(2020, 2024).density()
+    list(timeline.rolling(size=5, start=2011, end=2024, top_k=3))
+
+def stage_tokenize(corpus):
+    tokenize_articles(corpus.df, ['키워드_상세', '초록'])
+
+def stage_trends(corpus):
+    engine = TrendEngine(corpus.tokens['키워드_상세'] + ' ' + corpus.tokens['초록'], corpus.df['발행년도'].astype(str),
+                         token_pattern=PRETOKENIZED_PATTERN)
+    engine.keyword_counts(TARGET_KEYWORDS)
+    engine.top_terms_by_year(k=10)
+
+def stage_layout(corpus):
+    layout_network(corpus.network, cache_dir=None)
+
+STAGES = {
+    'load': stage_load,
+    'analyze': stage_analyze,
+    'analyze_stream': stage_analyze_stream,
+    'keywords': stage_keywords,
+    'search_index': stage_search_index,
+    'coauthor': stage_coauthor,
+    'tokenize': stage_tokenize,
+    'trends': stage_trends,
+    'layout': stage_layout,
+}
+
+
+def reset_cache():
+    """각 측정을 캐시가 없는 상태에서 시작"""
+    shutil.rmtree(BENCH_CACHE_DIR, ignore_errors=True)
+    os.makedirs(BENCH_CACHE_DIR, exist_ok=True)
+
+def prepare_corpus(papers, seed):
+    csv_path = synthetic_csv(papers, seed, CORPUS_DIR)
+    df = load_articles(csv_path)
+    tokens = tokenize_articles(df, ['키워드_상세', '초록'])
+    network = build_coauthor_network(build_author_index(df, '저자_상세'))
+    reset_cache()
+    return Corpus(papers, csv_path, df, tokens, network)
+
+def measure(stage, corpus, repeat, memory=True):
+    best = float('inf')
+    for _ in range(repeat):
+        reset_cache()
+        started = time.perf_counter()
+        stage(corpus)
+        best = min(best, time.perf_counter() - started)
+
+    peak_mb = None
+    if memory:
+        reset_cache()
+        tracemalloc.start()
+        try:
+            stage(corpus)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+    return Measurement(best, peak_mb)
+
+
+def load_baseline(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(path, results):
+    baseline = load_baseline(path)
+    for papers, stages in results.items():
+        baseline.setdefault(str(papers), {}).update(
+            {name: {'seconds': round(m.seconds, 4), 'peak_mb': m.peak_mb and round(m.peak_mb, 2)}
+             for name, m in stages.items()}
+        )
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 기준 저장: {path}")
+
+def baseline_regressions(results, baseline, time_tolerance, memory_tolerance):
+    failures = []
+    for papers, stages in results.items():
+        for name, m in stages.items():
+            base = baseline.get(str(papers), {}).get(name)
+            if not base:
+                continue
+            if m.seconds >= MIN_SECONDS and m.seconds > base['seconds'] * (1 + time_tolerance):
+                failures.append(f"{name} @ {papers:,}편: 시간 {base['seconds']:.2f}s → {m.seconds:.2f}s")
+            if (m.peak_mb is not None and base.get('peak_mb') is not None and m.peak_mb >= MIN_MEGABYTES
+                    and m.peak_mb > base['peak_mb'] * (1 + memory_tolerance)):
+                failures.append(f"{name} @ {papers:,}편: 메모리 {base['peak_mb']:.1f}MB → {m.peak_mb:.1f}MB")
+    return failures
+
+def scaling_exponents(results):
+    """단계별 (가장 작은 규모 → 가장 큰 규모) 시간 증가 지수. 작은 규모 측정이 너무 짧으면 None"""
+    scales = sorted(results)
+    if len(scales) < 2:
+        return {}
+    small, large = scales[0], scales[-1]
+    exponents = {}
+    for name, m in results[large].items():
+        before = results[small].get(name)
+        if before is None or before.seconds < MIN_SECONDS / 4:
+            exponents[name] = None
+        else:
+            exponents[name] = math.log(m.seconds / before.seconds) / math.log(large / small)
+    return exponents
+
+
+def main(papers_list, stage_names, repeat, seed, memory, baseline_path, save, time_tolerance, memory_tolerance,
+         max_exponent):
+    results = {}
+    for papers in sorted(papers_list):
+        corpus = prepare_corpus(papers, seed)
+        print(f"\n📚 가상 데이터 {papers:,}편 ({len(corpus.df):,}행, 저자 {corpus.network.number_of_nodes():,}명)")
+        results[papers] = {}
+        for name in stage_names:
+            m = measure(STAGES[name], corpus, repeat, memory)
+            results[papers][name] = m
+            peak = f"{m.peak_mb:8.1f} MB" if m.peak_mb is not None else ''
+            print(f"   {name:<13} {m.seconds:8.2f} s  {peak}")
+
+    failures = []
+    exponents = scaling_exponents(results)
+    if exponents:
+        scales = sorted(results)
+        print(f"\n📈 시간 증가 지수 ({scales[0]:,} → {scales[-1]:,}편, 1.0 = 선형)")
+        for name, exponent in exponents.items():
+            if exponent is None:
+                print(f"   {name:<13}     -  (측정 시간이 짧아 생략)")
+                continue
+            flag = '❌' if exponent > max_exponent else '✅'
+            print(f"   {name:<13} {exponent:5.2f} {flag}")
+            if exponent > max_exponent and results[scales[-1]][name].seconds >= MIN_SECONDS:
+                failures.append(f"{name}: 시간 증가 지수 {exponent:.2f} > {max_exponent}")
+
+    baseline = load_baseline(baseline_path)
+    if baseline:
+        failures += baseline_regressions(results, baseline, time_tolerance, memory_tolerance)
+    elif not save:
+        print(f"\n참고: 기준 파일이 없습니다 ({baseline_path}). --save-baseline 으로 저장하면 다음 실행부터 비교합니다.")
+    if save:
+        save_baseline(baseline_path, results)
+
+    shutil.rmtree(BENCH_CACHE_DIR, ignore_errors=True)
+    if failures:
+        print("\n❌ 성능 회귀:")
+        for failure in failures:
+            print(f"   - {failure}")
+        return 1
+    print("\n✅ 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='분석 단계별 시간/메모리 벤치마크 (가상 데이터)')
+    parser.add_argument('--papers', type=int, nargs='+', default=[10000, 50000], help='측정할 규모 (논문 수)')
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES))
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준으로 저장')
+    parser.add_argument('--time-tolerance', type=float, default=TIME_TOLERANCE, help='허용 시간 증가율 (0.5 = 50%%)')
+    parser.add_argument('--memory-tolerance', type=float, default=MEMORY_TOLERANCE)
+    parser.add_argument('--max-exponent', type=float, default=MAX_SCALING_EXPONENT)
+    args = parser.parse_args()
+    sys.exit(main(args.papers, args.stages, args.repeat, args.seed, not args.no_memory, args.baseline,
+                  args.save_baseline, args.time_tolerance, args.memory_tolerance, args.max_exponent))
@@ -0,0 +1,175 @@
+"""
+상세 페이지/검색 결과 행 추출의 브라우저 왕복(round trip) 횟수와 논문당 처리 시간을 비교하는 마이크로 벤치마크입니다.
+
+- before: 요소마다 locator.count() / nth(i).text_content() / get_attribute() 를 await 하던 기존 방식
+- after : scrape_kci_details 의 evaluate 한 번으로 모두 모으는 방식
+
+kci_fixture_server 로컬 서버를 사용하므로 네트워크 없이 실행됩니다.
+    python benchmarks/bench_extraction.py --articles 50
+"""
+
+import argparse
+import asyncio
+import inspect
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import ElementHandle, Locator, Page, async_playwright
+
+from kci_detail_parser import build_article_record, clean_author_name, combine_keywords, join_abstracts
+from kci_fixture_server import detail_url, load_articles, render_search_rows_html, start_fixture_server
+from scrape_kci_details import SEARCH_ROWS_JS, extract_detail_info
+
+
+class RoundTripCounter:
+    """Page/Locator 를 감싸서 await 되는 호출(= 브라우저 왕복) 횟수를 셉니다."""
+
+    def __init__(self, target, counter=None):
+        self._target = target
+        self._counter = counter if counter is not None else [0]
+
+    @property
+    def count(self):
+        return self._counter[0]
+
+    def _wrap(self, value):
+        if isinstance(value, (Page, Locator, ElementHandle)):
+            return RoundTripCounter(value, self._counter)
+        return value
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return self._wrap(attr)
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if inspect.isawaitable(result):
+                async def counted():
+                    self._counter[0] += 1
+                    return self._wrap(await result)
+                return counted()
+            return self._wrap(result)
+        return call
+
+
+# --- before: 기존 요소별 locator 방식 (비교용으로 그대로 옮김) ---
+
+async def legacy_extract_detail_info(detail_page):
+    abstract_locators = detail_page.locator('p#korAbst, p#folaAbst')
+    extracted_abstracts = []
+    for i in range(await abstract_locators.count()):
+        extracted_abstracts.append(await abstract_locators.nth(i).text_content())
+
+    author_links = detail_page.locator('div.author a')
+    all_authors = []
+    if await author_links.count() > 0:
+        for i in range(await author_links.count()):
+            name = clean_author_name(await author_links.nth(i).text_content())
+            if name:
+                all_authors.append(name)
+
+    keywords_combined = ""
+    keywords_section_locator = detail_page.locator(
+        'div.innerBox.open:has(p:has-text("키워드")), '
+        'div.innerBox.open:has(p:has-text("Keywords")), '
+        'div.innerBox.open:has(a#keywd)'
+    )
+    if await keywords_section_locator.count() > 0:
+        section = keywords_section_locator.first
+        english_keywords = []
+        english_keywd_locators = section.locator('a#keywd')
+        for i in range(await english_keywd_locators.count()):
+            english_keywords.append(await english_keywd_locators.nth(i).text_content())
+        p_texts = []
+        p_locators = section.locator('p')
+        for i in range(await p_locators.count()):
+            p_texts.append(await p_locators.nth(i).text_content())
+        keywords_combined = combine_keywords(english_keywords, p_texts)
+
+    return join_abstracts(extracted_abstracts), "; ".join(sorted(set(all_authors))), keywords_combined
+
+async def legacy_extract_rows(page):
+    rows = page.locator('table.search-answer-tbl > tbody > tr')
+    records = []
+    for i in range(await rows.count()):
+        row = rows.nth(i)
+        link = row.locator('a.subject')
+        if await link.count() == 0:
+            link = row.locator('a[href*="ciSereArtiView"]')
+        await link.first.wait_for(state='visible', timeout=20000)
+        await link.first.get_attribute('href')
+        title = await link.first.text_content()
+        inputs = row.locator("input[type='hidden']")
+        data_dict = {}
+        for j in range(await inputs.count()):
+            data_dict[await inputs.nth(j).get_attribute('name')] = await inputs.nth(j).get_attribute('value')
+        records.append(build_article_record(data_dict, title))
+    return records
+
+# --- after: 한 번의 evaluate 로 추출 ---
+
+async def batched_extract_rows(page):
+    rows = page.locator('table.search-answer-tbl > tbody > tr')
+    await rows.locator('a.subject, a[href*="ciSereArtiView"]').first.wait_for(state='visible', timeout=20000)
+    return [build_article_record(f['inputs'], f['title']) for f in await rows.evaluate_all(SEARCH_ROWS_JS)]
+
+
+async def measure(label, page, extract, repeat):
+    counted = RoundTripCounter(page)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = await extract(counted)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return label, counted.count / repeat, elapsed_ms / repeat, result
+
+
+async def main(article_count, repeat):
+    server, base_url = start_fixture_server()
+    articles = list(load_articles().values())[:article_count]
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+
+        detail_rows = []
+        mismatches = 0
+        for article in articles:
+            await page.goto(detail_url(base_url, article['논문ID']), wait_until='domcontentloaded')
+            before = await measure('before', page, legacy_extract_detail_info, repeat)
+            after = await measure('after', page, extract_detail_info, repeat)
+            mismatches += before[3] != after[3]
+            detail_rows.append((before, after))
+
+        await page.set_content(render_search_rows_html(articles[:10]))
+        rows_before = await measure('before', page, legacy_extract_rows, repeat)
+        rows_after = await measure('after', page, batched_extract_rows, repeat)
+
+        await browser.close()
+    server.shutdown()
+
+    def avg(values):
+        return sum(values) / len(values) if values else 0.0
+
+    print(f"\n📊 상세 페이지 추출 ({len(detail_rows)}편, 반복 {repeat}회)")
+    for index, label in enumerate(['before', 'after']):
+        trips = avg([pair[index][1] for pair in detail_rows])
+        ms = avg([pair[index][2] for pair in detail_rows])
+        print(f"   - {label:6s}: 논문당 왕복 {trips:6.1f}회, {ms:7.2f} ms")
+    print(f"   - 결과 불일치: {mismatches}건")
+
+    print(f"\n📊 검색 결과 행 추출 (행 {min(10, len(articles))}개)")
+    for label, trips, ms, _ in (rows_before, rows_after):
+        print(f"   - {label:6s}: 페이지당 왕복 {trips:6.1f}회, {ms:7.2f} ms")
+    print(f"   - 결과 일치: {rows_before[3] == rows_after[3]}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='상세/검색 행 추출 왕복 횟수 벤치마크')
+    parser.add_argument('--articles', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.articles, args.repeat))
@@ -0,0 +1,103 @@
+"""
+AI/XR 키워드 포함 여부 판정 속도를 비교하는 벤치마크입니다.
+
+- before: 행마다 DataFrame.apply(axis=1) 로 제목/초록/키워드_상세를 합치고 키워드마다 `in` 으로 검사하던 기존 방식
+- after : kci_keywords.KeywordMatcher 로 합친 문서 전체를 한 번만 훑는 방식
+
+번들 CSV를 --copies 배로 늘려 측정하며, 두 방식의 결과가 같은지도 확인합니다.
+AI/XR 키워드 21개와, 여기에 자주 쓰인 저자 키워드(키워드_상세) --extra 개를 더한 목록으로 각각 측정합니다.
+(기존 방식은 키워드 수에 비례해 느려지고, 매처는 키워드 수와 관계없이 말뭉치를 한 번만 훑음)
+    python benchmarks/bench_keywords.py --copies 50 --extra 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from kci_dataset import DATASET_CSV_PATH, load_articles
+from kci_keywords import KeywordMatcher, ahocorasick, combine_columns
+
+AI_XR_KEYWORDS = [
+    'ai', '인공지능', 'artificial intelligence', 'xr', '확장현실', 'extended reality',
+    'vr', '가상현실', 'virtual reality', 'ar', '증강현실', 'augmented reality',
+    'digital twin', '디지털 트윈', 'llm', '대규모 언어 모델', 'large language model',
+    'deep learning', '딥러닝', 'machine learning', '머신러닝'
+]
+
+
+def legacy_flags(df, keywords):
+    def contains_keywords_in_combined_text(text_combined, keywords):
+        text_lower = str(text_combined).lower()
+        return any(kw.lower() in text_lower for kw in keywords)
+
+    return df.apply(lambda row: contains_keywords_in_combined_text(
+        str(row['제목']) + ' ' + str(row['초록']) + ' ' + str(row['키워드_상세']), keywords
+    ), axis=1).to_numpy()
+
+def legacy_hit_matrix(df, keywords):
+    """키워드별 포함 여부까지 필요할 때의 기존 방식 (문서 × 키워드 `in` 검사)"""
+    texts = (df['제목'] + ' ' + df['초록'] + ' ' + df['키워드_상세']).str.lower()
+    return np.array([[kw in text for kw in keywords] for text in texts])
+
+def timed(func, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def frequent_keywords(df, count):
+    """키워드_상세에서 자주 쓰인 키워드 count 개 (소문자)"""
+    terms = df['키워드_상세'].str.lower().str.split(';').explode().str.strip()
+    return terms[terms != ''].value_counts().index[:count].tolist()
+
+def run_cases(df, keywords, repeat):
+    matcher = KeywordMatcher(keywords)
+    cases = [
+        ('포함 여부 (any)',
+         lambda: legacy_flags(df, keywords),
+         lambda: matcher.any(combine_columns(df))),
+        ('키워드별 포함 (hits)',
+         lambda: legacy_hit_matrix(df, keywords),
+         lambda: matcher.hits(combine_columns(df))),
+    ]
+    for name, before, after in cases:
+        before_time, before_result = timed(before, repeat)
+        after_time, after_result = timed(after, repeat)
+        same = np.array_equal(before_result, after_result)
+        print(f"\n🔎 {name}")
+        print(f"   before: {before_time * 1000:8.1f} ms")
+        print(f"   after : {after_time * 1000:8.1f} ms  (x{before_time / after_time:.1f})")
+        print(f"   결과 일치: {'✅' if same else '❌'}")
+
+def main(copies, repeat, extra):
+    base = load_articles(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), DATASET_CSV_PATH))
+    df = pd.concat([base] * copies, ignore_index=True)
+    large_keywords = AI_XR_KEYWORDS + [k for k in frequent_keywords(base, extra) if k not in AI_XR_KEYWORDS]
+    print(f"📚 문서 {len(df)}건 (반복 {repeat}회 중 최솟값), 매칭 엔진: "
+          f"{'Aho-Corasick (pyahocorasick)' if ahocorasick is not None else 'str.find'}")
+
+    for keywords in (AI_XR_KEYWORDS, large_keywords):
+        print(f"\n===== 키워드 {len(keywords)}개 =====")
+        run_cases(df, keywords, repeat)
+
+    bounded = KeywordMatcher(AI_XR_KEYWORDS, word_boundary=True).any(combine_columns(base))
+    plain = KeywordMatcher(AI_XR_KEYWORDS).any(combine_columns(base))
+    print(f"\n참고: 원본 {len(base)}건 중 AI/XR 포함 - 부분 문자열 {plain.sum()}건, 영문 단어 경계 적용 {bounded.sum()}건")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='키워드 매칭 벤치마크')
+    parser.add_argument('--copies', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--extra', type=int, default=200, help='추가로 사용할 빈도 상위 저자 키워드 수')
+    args = parser.parse_args()
+    main(args.copies, args.repeat, args.extra)
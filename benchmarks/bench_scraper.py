@@ -0,0 +1,234 @@
+"""
+저장된(또는 CSV 로 만든) KCI 검색 결과/상세 페이지와 로컬 대체 서버(kci_fixture_server)로
+네트워크 없이 스크래퍼 처리량을 재는 벤치마크입니다. 동시 처리 수(--concurrency)별로
+초당 논문 수, 논문당 처리 시간 p50/p95, 최대 메모리(tracemalloc, 파이썬 할당만)를 출력합니다.
+
+- parse: 서버 없이 검색 결과 행/상세 페이지 HTML 파싱만 측정 (kci_detail_parser, 동시 처리 수와 무관)
+- http : 지연을 넣은 서버에서 검색 결과 페이지를 차례로 받고, 페이지마다 상세 페이지를
+         scrape_kci_details.fetch_one_article (HTTP 백엔드) 로 동시에 처리 (extract_page_articles 의 HTTP 경로와 같음)
+- run  : scrape_kci_details.run() 전체를 서버에 대고 실행 (Playwright 와 Chromium 필요, --backend 로 상세 처리 방식 선택)
+
+fixtures/ 에 저장된 페이지(kci_fixture_server.py --save)가 있으면 그 페이지를, 없으면 CSV 로 만든 페이지를 사용합니다.
+    python benchmarks/bench_scraper.py --mode http --articles 200 --latency 0.05 --jitter 0.02 --concurrency 1 4 8
+    python benchmarks/bench_scraper.py --mode run --backend http --articles 50 --concurrency 2 4
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from kci_detail_parser import build_article_record, create_http_client, parse_detail_html, parse_search_rows_html
+from kci_fixture_server import (
+    CSV_PATH, FIXTURE_DIR, SEARCH_PAGE_SIZE, SEARCH_PATH, FixtureRequestHandler, load_articles, start_fixture_server,
+)
+
+Result = namedtuple('Result', ['label', 'articles', 'seconds', 'p50', 'p95', 'peak_mb', 'failures'])
+
+
+@contextlib.contextmanager
+def measured(memory):
+    """with 블록의 최대 메모리(MB)를 peak[0] 에 기록합니다."""
+    peak = [None]
+    if memory:
+        tracemalloc.start()
+    try:
+        yield peak
+    finally:
+        if memory:
+            peak[0] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+
+def summarize(label, latencies, seconds, peak_mb, failures=0):
+    latencies = np.asarray(latencies, dtype=float)
+    p50, p95 = np.percentile(latencies, [50, 95]) if len(latencies) else (0.0, 0.0)
+    return Result(label, len(latencies), seconds, p50, p95, peak_mb, failures)
+
+
+# --- parse: HTML 파싱만 ---
+
+def fixture_pages(article_count, csv_path, fixture_dir):
+    """(검색 결과 페이지 HTML 목록, {상세 경로: 상세 HTML}) - 서버와 같은 응답을 직접 만듦"""
+    handler = type('Handler', (FixtureRequestHandler,), {
+        'articles': load_articles(csv_path), 'fixture_dir': fixture_dir,
+    })
+    handler_instance = handler.__new__(handler)
+    pages = []
+    for page_num in range(1, -(-article_count // SEARCH_PAGE_SIZE) + 1):
+        body = handler_instance.search_body('fixture', str(page_num))
+        if body is None:
+            break
+        pages.append(body.decode('utf-8'))
+    details = {}
+    for page in pages:
+        for fields in parse_search_rows_html(page)[:article_count - len(details)]:
+            article_id = fields['inputs'].get('R_SYST_LOCA_ID1', '')
+            body = handler_instance.detail_body(article_id)
+            if body is not None:
+                details[fields['href']] = body.decode('utf-8')
+    return pages, details
+
+def bench_parse(article_count, csv_path, fixture_dir, memory):
+    pages, details = fixture_pages(article_count, csv_path, fixture_dir)
+    latencies = []
+    with measured(memory) as peak:
+        started = time.perf_counter()
+        for page in pages:
+            page_started = time.perf_counter()
+            rows = [(fields, build_article_record(fields['inputs'], fields['title']))
+                    for fields in parse_search_rows_html(page)]
+            # 검색 결과 행 파싱 시간은 그 페이지의 논문들이 나눠 가짐
+            row_share = (time.perf_counter() - page_started) / max(1, len(rows))
+            for fields, record in rows:
+                html = details.get(fields['href'])
+                if html is None:
+                    continue
+                article_started = time.perf_counter()
+                record['초록'], record['저자_상세'], record['키워드_상세'] = parse_detail_html(html)
+                latencies.append(row_share + time.perf_counter() - article_started)
+        seconds = time.perf_counter() - started
+    return [summarize('parse', latencies, seconds, peak[0])]
+
+
+# --- http: 검색 결과 페이지 + 상세 페이지 HTTP 동시 처리 ---
+
+async def crawl_http(base_url, article_count, concurrency, rate_limit):
+    import scrape_kci_details
+    from kci_throttle import AdaptiveRateLimiter
+
+    latencies, failures = [], []
+    rate_limiter = AdaptiveRateLimiter(concurrency) if rate_limit else None
+    http_client = create_http_client(concurrency)
+
+    async def timed_fetch(index, record, detail_url):
+        started = time.perf_counter()
+        # 이 모드에는 브라우저 탭 풀이 없으므로 HTTP 로 처리하지 못한 논문은 재시도 없이 실패로 셈
+        succeeded = await scrape_kci_details.fetch_one_article(
+            None, None, http_client, None, rate_limiter, index, record, detail_url, browser_fallback=False)
+        if succeeded:
+            latencies.append(time.perf_counter() - started)
+        else:
+            failures.append(index)
+
+    try:
+        remaining, page_num = article_count, 1
+        while remaining > 0:
+            response = await http_client.get(f'{base_url}{SEARCH_PATH}?query=fixture&page={page_num}')
+            if response.status_code == 404:
+                break
+            rows = parse_search_rows_html(response.text)[:remaining]
+            await asyncio.gather(*(
+                timed_fetch(index, build_article_record(fields['inputs'], fields['title']), base_url + fields['href'])
+                for index, fields in enumerate(rows)
+            ))
+            remaining -= len(rows)
+            page_num += 1
+    finally:
+        await http_client.aclose()
+    return latencies, len(failures)
+
+def bench_http(base_url, article_count, concurrency_list, rate_limit, memory):
+    import scrape_kci_details  # noqa: F401  첫 설정의 측정에 모듈 불러오기 비용이 섞이지 않도록 미리 불러옴
+
+    results = []
+    for concurrency in concurrency_list:
+        with measured(memory) as peak, contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            latencies, failures = asyncio.run(crawl_http(base_url, article_count, concurrency, rate_limit))
+            seconds = time.perf_counter() - started
+        results.append(summarize(f'http x{concurrency}', latencies, seconds, peak[0], failures))
+    return results
+
+
+# --- run: scrape_kci_details.run() 전체 ---
+
+def bench_run(article_count, concurrency_list, backend, memory):
+    import scrape_kci_details
+
+    results = []
+    original_fetch = scrape_kci_details.fetch_one_article
+    for concurrency in concurrency_list:
+        latencies = []
+
+        async def timed_fetch(*args, **kwargs):
+            started = time.perf_counter()
+            succeeded = await original_fetch(*args, **kwargs)
+            if succeeded:
+                latencies.append(time.perf_counter() - started)
+            return succeeded
+
+        scrape_kci_details.fetch_one_article = timed_fetch
+        scrape_kci_details.DETAIL_CONCURRENCY = concurrency
+        scrape_kci_details.DETAIL_BACKEND = backend
+        with tempfile.TemporaryDirectory() as work_dir:
+            with measured(memory) as peak, contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                asyncio.run(scrape_kci_details.run(
+                    query='fixture', max_pages=-(-article_count // SEARCH_PAGE_SIZE),
+                    output_csv=os.path.join(work_dir, 'articles.csv'),
+                    crawl_state_path=os.path.join(work_dir, 'state.sqlite')))
+                seconds = time.perf_counter() - started
+        scrape_kci_details.fetch_one_article = original_fetch
+        results.append(summarize(f'run/{backend} x{concurrency}', latencies, seconds, peak[0]))
+    return results
+
+
+def print_results(results):
+    print(f"\n{'설정':<18} {'논문':>5} {'시간(s)':>8} {'논문/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'메모리(MB)':>10}")
+    for r in results:
+        rate = r.articles / r.seconds if r.seconds > 0 else 0.0
+        peak = f'{r.peak_mb:10.1f}' if r.peak_mb is not None else f"{'-':>10}"
+        print(f"{r.label:<18} {r.articles:>5} {r.seconds:8.2f} {rate:8.1f} {r.p50 * 1000:9.1f} {r.p95 * 1000:9.1f} {peak}")
+    failures = max(r.failures for r in results)
+    if failures:
+        print(f"\n⚠️ HTTP 요청이 실패했거나 상세 페이지 구조가 없어 처리하지 못한 논문 {failures}편은 시간 집계에서 제외했습니다. "
+              "(브라우저 재시도를 포함한 측정은 --mode run)")
+
+def main(mode, article_count, concurrency_list, latency, jitter, backend, rate_limit, memory, csv_path, fixture_dir):
+    source = '저장된 페이지' if os.path.isdir(os.path.join(fixture_dir, 'detail')) else 'CSV 로 만든 페이지'
+    if mode == 'parse':
+        print(f"🧪 parse 모드, 논문 {article_count}편 ({source})")
+        print_results(bench_parse(article_count, csv_path, fixture_dir, memory))
+        return
+
+    print(f"🧪 {mode} 모드, 논문 {article_count}편 ({source}), 응답 지연 {latency * 1000:.0f}±{jitter * 1000:.0f} ms")
+    server, base_url = start_fixture_server(csv_path=csv_path, fixture_dir=fixture_dir, latency=latency, jitter=jitter)
+    # scrape_kci_details 는 불러올 때 환경 변수를 읽으므로 서버를 띄운 뒤에 불러옴 (페이지 캐시와 계측 기록은 끔)
+    os.environ['KCI_BASE_URL'] = base_url
+    os.environ['KCI_PAGE_CACHE_ENABLED'] = '0'
+    os.environ['KCI_METRICS'] = ''
+    try:
+        if mode == 'http':
+            results = bench_http(base_url, article_count, concurrency_list, rate_limit, memory)
+        else:
+            results = bench_run(article_count, concurrency_list, backend, memory)
+    finally:
+        server.shutdown()
+    print_results(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='오프라인 스크래퍼 처리량 벤치마크 (로컬 대체 서버)')
+    parser.add_argument('--mode', choices=['parse', 'http', 'run'], default='http')
+    parser.add_argument('--articles', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--latency', type=float, default=0.05, help='서버 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.02, help='서버 응답 지연 변동 폭 (초, ±)')
+    parser.add_argument('--backend', choices=['http', 'playwright'], default='playwright', help='run 모드의 상세 처리 방식')
+    parser.add_argument('--rate-limit', action='store_true', help='http 모드에서 AdaptiveRateLimiter 사용 (run 모드는 항상 사용)')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+    parser.add_argument('--csv', default=CSV_PATH)
+    parser.add_argument('--fixtures', default=FIXTURE_DIR)
+    args = parser.parse_args()
+    main(args.mode, args.articles, args.concurrency, args.latency, args.jitter, args.backend, args.rate_limit,
+         not args.no_memory, args.csv, args.fixtures)
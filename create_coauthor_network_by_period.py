@@ -1,57 +1,51 @@
 import pandas as pd
 import networkx as nx
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 import seaborn as sns
-import re
 from collections import Counter
 
-# CSV 파일 로드
-df = pd.read_csv("kci_articles_all_fields_with_details.csv")
+from kci_authors import build_author_index
+from kci_coauthor import CoauthorTimeline
+from kci_dataset import load_articles
+from kci_fonts import apply_korean_font
+from kci_layout import layout_periods
 
-# 저자 필드 정제
-df["저자_목록"] = df["저자"].fillna("").apply(
-    lambda x: [j.strip() for j in re.split(r"[|,;]", str(x)) if j.strip()]
-)
+# 데이터 로드 후 저자 ID 사전 / 논문-저자 연결 테이블 생성 ('저자' 기준)
+df = load_articles()
+author_index = build_author_index(df, "저자")
 
-# 시기별 분할
-early_df = df[df["발행년도"].astype(str).str[:4].astype(int) <= 2019]
-late_df = df[df["발행년도"].astype(str).str[:4].astype(int) >= 2020]
+# 연도별 공저 행렬 (희소 행렬 기반, 한 번만 생성)
+timeline = CoauthorTimeline(author_index)
 
-# 공저 네트워크 생성 함수
-def build_graph(df_subset):
-    G = nx.Graph()
-    for authors in df_subset["저자_목록"]:
-        if len(authors) < 2:
-            continue
-        for i in range(len(authors)):
-            for j in range(i + 1, len(authors)):
-                a, b = authors[i], authors[j]
-                if G.has_edge(a, b):
-                    G[a][b]["weight"] += 1
-                else:
-                    G.add_edge(a, b, weight=1)
-    return G
-
-# 그래프 생성
-G_early = build_graph(early_df)
-G_late = build_graph(late_df)
+# 시기별 공저 네트워크
+network_early = timeline.window(end=2019)
+network_late = timeline.window(start=2020)
 
 # 밀도 계산
-density_early = nx.density(G_early)
-density_late = nx.density(G_late)
+density_early = network_early.density()
+density_late = network_late.density()
+
+# 5년 이동 구간별 네트워크 지표 (연도 행렬을 더하고 빼며 갱신)
+print("📈 5년 이동 구간별 공저 네트워크 지표")
+for metrics in timeline.rolling(size=5, start=2011, end=2024, top_k=3):
+    top = ", ".join(f"{name}({degree})" for name, degree in metrics.top_authors)
+    print(f"   {metrics.start}–{metrics.end}: 노드 {metrics.nodes}, 엣지 {metrics.edges}, "
+          f"밀도 {metrics.density:.4f}, 최대 연결 요소 {metrics.largest_component} | {top}")
+
+# 그림용 networkx 그래프
+G_early = network_early.to_networkx()
+G_late = network_late.to_networkx()
+
+# 배치: 후기 네트워크는 전기 배치에서 이어서 계산해 같은 저자가 비슷한 위치에 놓임 (위치는 캐시에 저장)
+pos_early, pos_late = layout_periods([network_early, network_late])
 
 # 한글 폰트 설정
-font_path = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
-if not fm.findSystemFonts(fontpaths=None, fontext="ttf"):
-    print("⚠️ 한글 폰트가 없습니다.")
-font_prop = fm.FontProperties(fname=font_path)
+font_prop = apply_korean_font()
 
 # 시각화
-fig, axes = plt.subplots(1, 2, figsize=(18, 9))
+fig, axes = plt.subplots(1, 2, figsize=(18, 9), sharex=True, sharey=True)
 
 if len(G_early.nodes) > 0:
-    pos_early = nx.spring_layout(G_early, seed=42)
     nx.draw_networkx(
         G_early,
         pos=pos_early,
@@ -65,7 +59,6 @@ if len(G_early.nodes) > 0:
 axes[0].set_title(f"2015–2019 공저 네트워크 (밀도: {density_early:.4f})", fontproperties=font_prop)
 
 if len(G_late.nodes) > 0:
-    pos_late = nx.spring_layout(G_late, seed=42)
     nx.draw_networkx(
         G_late,
         pos=pos_late,
@@ -85,7 +78,7 @@ plt.savefig("kci_coauthor_comparison.png", dpi=300)
 plt.show()
 
 # 단독저자 vs 공저자 히스토그램 시각화
-df["저자수"] = df["저자_목록"].apply(len)
+df["저자수"] = author_index.authors_per_paper().to_numpy()
 df["저자유형"] = df["저자수"].apply(lambda x: "단독 저자" if x == 1 else "공저")
 
 plt.figure(figsize=(8, 6))
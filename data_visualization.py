@@ -4,15 +4,16 @@ import seaborn as sns
 import re
 # 시각화 관련 코드 전
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 
-plt.rcParams["font.family"] = "AppleGothic"  # 한글 폰트 설정
+from kci_dataset import load_articles
+from kci_fonts import apply_korean_font
+from kci_keywords import TECH_KEYWORDS
+from kci_search_index import open_index
 
-# CSV 로드
-df = pd.read_csv("kci_articles_all_fields_with_details.csv")
+apply_korean_font()  # 한글 폰트 설정
 
-# 발행년도 정리
-df["발행년도"] = df["발행년도"].astype(str).str[:4].astype(int)
+# 데이터 로드 ('발행년도'는 정수형으로 정리되어 있음)
+df = load_articles()
 
 # 연도별 논문 수
 yearly_counts = df["발행년도"].value_counts().sort_index()
@@ -23,14 +24,11 @@ n_start = yearly_counts.get(start, 1)
 n_end = yearly_counts.get(end, 1)
 cagr = ((n_end / n_start) ** (1 / (end - start))) - 1
 
-# 기술 키워드 포함 여부 판단
-tech_keywords = ["AI", "XR", "VR", "AR", "메타버스", "인공지능", "가상현실", "확장현실", "디지털트윈"]
-df["기술포함"] = df["제목"].fillna("").apply(
-    lambda x: any(kw.lower() in x.lower() for kw in tech_keywords)
-)
-
-# 연도별 기술 포함 비율
-tech_ratio_by_year = df.groupby("발행년도")["기술포함"].mean().mul(100).round(2)
+# 기술 키워드 포함 여부 판단 (키워드 목록은 kci_keywords.TECH_KEYWORDS)
+# 연도별 기술 포함 비율 (제목 전문 검색 색인에서 연도별 포함 논문 수 조회)
+with open_index(df) as search_index:
+    tech_counts = search_index.year_counts(TECH_KEYWORDS, columns=["제목"])
+tech_ratio_by_year = tech_counts.reindex(yearly_counts.index, fill_value=0).div(yearly_counts).mul(100).round(2)
 
 # 시각화
 fig, axes = plt.subplots(2, 1, figsize=(10, 10))
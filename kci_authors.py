@@ -0,0 +1,101 @@
+"""
+저자 이름 ↔ 정수 ID 사전과 (paper_id, author_id, year) 형태의 논문-저자 연결 테이블입니다.
+
+'; '로 연결된 저자 문자열을 한 번만 분리/정규화해 두고, 공저/편수/기간별 분석은 이 테이블을 사용합니다.
+paper_id 는 입력 DataFrame의 행 위치(0부터)이며, 한 논문에 같은 저자가 여러 번 나오면 한 번만 기록합니다.
+
+    from kci_authors import build_author_index
+    index = build_author_index(df)               # '저자_상세' 기준
+    links = index.filter_years(2015, 2019)
+    for author_ids in index.paper_author_ids(links): ...
+"""
+
+import re
+import unicodedata
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+from kci_dataset import AUTHOR_LIST_COLUMNS, split_authors
+
+AUTHOR_SOURCE_COLUMN = '저자_상세'
+
+
+def normalize_author_name(name):
+    """유니코드(NFC) 정규화 후 앞뒤 공백을 지우고 연속 공백을 하나로 줄입니다."""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', str(name))).strip()
+
+
+class AuthorIndex:
+    def __init__(self, names, links, paper_count):
+        self.names = names                    # author_id → 정규화된 이름
+        self.ids = {name: author_id for author_id, name in enumerate(names)}
+        self.links = links                    # paper_id, author_id, year (정수형)
+        self.paper_count = paper_count        # 입력 DataFrame의 행(논문) 수
+
+    def __len__(self):
+        return len(self.names)
+
+    def author_id(self, name):
+        return self.ids.get(normalize_author_name(name))
+
+    def name(self, author_id):
+        return self.names[author_id]
+
+    def filter_years(self, start=None, end=None):
+        """발행년도가 [start, end] 안에 있는 연결만 반환합니다. (None이면 그쪽은 제한 없음)"""
+        mask = np.ones(len(self.links), dtype=bool)
+        if start is not None:
+            mask &= self.links['year'].to_numpy() >= start
+        if end is not None:
+            mask &= self.links['year'].to_numpy() <= end
+        return self.links[mask]
+
+    def paper_author_ids(self, links=None):
+        """논문 순서대로 각 논문의 저자 ID 배열을 돌려줍니다. (원래 저자 순서 유지)"""
+        links = self.links if links is None else links
+        paper_ids = links['paper_id'].to_numpy()
+        author_ids = links['author_id'].to_numpy()
+        if len(paper_ids) == 0:
+            return []
+        # links 는 paper_id 순으로 정렬되어 있으므로 경계 위치로 한 번에 나눔
+        boundaries = np.flatnonzero(np.diff(paper_ids)) + 1
+        return np.split(author_ids, boundaries)
+
+    def authors_per_paper(self, links=None):
+        """논문별 저자 수 (paper_id → 저자 수). 저자가 없는 논문은 0."""
+        links = self.links if links is None else links
+        counts = np.bincount(links['paper_id'].to_numpy(), minlength=self.paper_count)
+        return pd.Series(counts, name='저자수')
+
+    def paper_counts(self, links=None):
+        """저자별 논문 수 (이름 → 편수), 많은 순."""
+        links = self.links if links is None else links
+        counts = np.bincount(links['author_id'].to_numpy(), minlength=len(self.names))
+        return pd.Series(counts, index=self.names, name='논문수').sort_values(ascending=False, kind='stable')
+
+
+def build_author_index(df, column=AUTHOR_SOURCE_COLUMN):
+    """
+    df[column] 의 저자 문자열로 AuthorIndex 를 만듭니다. kci_dataset.load_articles() 가 미리 분리한
+    목록 컬럼(예: '저자_상세_목록')이 있으면 그대로 사용합니다.
+    """
+    list_column = AUTHOR_LIST_COLUMNS.get(column)
+    if list_column in df.columns:
+        author_lists = df[list_column].tolist()
+    else:
+        author_lists = df[column].fillna('').map(split_authors).tolist()
+
+    lengths = np.fromiter((len(authors) for authors in author_lists), dtype=np.int64, count=len(author_lists))
+    flat_names = [normalize_author_name(name) for name in chain.from_iterable(author_lists)]
+    codes, names = pd.factorize(pd.Series(flat_names, dtype=object), sort=False)
+
+    years = df['발행년도'].to_numpy() if '발행년도' in df.columns else np.zeros(len(df), dtype=np.int64)
+    links = pd.DataFrame({
+        'paper_id': np.repeat(np.arange(len(df), dtype=np.int32), lengths),
+        'author_id': codes.astype(np.int32),
+        'year': np.repeat(np.asarray(years, dtype=np.int32), lengths),
+    })
+    links = links.drop_duplicates(['paper_id', 'author_id']).reset_index(drop=True)
+    return AuthorIndex(list(names), links, len(df))
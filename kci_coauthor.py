@@ -0,0 +1,219 @@
+"""
+희소 행렬 기반 공저 네트워크 계산기입니다.
+
+논문×저자 결합(incidence) 행렬 A 를 만들고 AᵀA 로 저자 쌍별 공저 편수(엣지 가중치)를 한 번에 구합니다.
+차수, 밀도, 연결 요소, 연결 중심성도 행렬 연산으로 계산하며, 그림을 그릴 때만 networkx 그래프로 변환합니다.
+
+네트워크의 노드는 기존 스크립트(nx.Graph 에 엣지만 추가)와 같게 공저 관계가 하나 이상 있는 저자이며,
+노드 순서도 networkx 에 엣지를 논문 순서대로 추가했을 때의 순서와 같습니다.
+
+    from kci_authors import build_author_index
+    from kci_coauthor import build_coauthor_network
+    network = build_coauthor_network(build_author_index(df), links=None)
+    network.density(), network.degree_centrality(), network.to_networkx()
+
+    timeline = CoauthorTimeline(author_index)
+    timeline.window(2015, 2019).density()
+    for metrics in timeline.rolling(size=5): ...
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+
+def incidence_matrix(links, n_papers, n_authors):
+    """논문×저자 0/1 희소 행렬 (CSR)"""
+    data = np.ones(len(links), dtype=np.int32)
+    return sparse.csr_matrix(
+        (data, (links['paper_id'].to_numpy(), links['author_id'].to_numpy())), shape=(n_papers, n_authors))
+
+def coauthor_links(links):
+    """저자가 2명 이상인 논문의 연결만 남깁니다. (단독 저자는 네트워크 노드가 아님)"""
+    paper_ids = links['paper_id'].to_numpy()
+    sizes = np.bincount(paper_ids) if len(paper_ids) else np.zeros(0, dtype=np.int64)
+    return links[sizes[paper_ids] >= 2] if len(paper_ids) else links
+
+def _weights(links, n_papers, n_authors):
+    """저자×저자 공저 편수 행렬 AᵀA (대각선 제거)"""
+    A = incidence_matrix(links, n_papers, n_authors)
+    weights = (A.T @ A).tocsr()
+    weights.setdiag(0)
+    weights.eliminate_zeros()
+    return weights
+
+
+class CoauthorNetwork:
+    def __init__(self, weights, nodes, names):
+        self.weights = weights      # 저자×저자 대칭 CSR 행렬 (공저 편수, 대각선 0), 전체 저자 ID 공간
+        self.nodes = nodes          # 네트워크에 포함된 저자 ID (networkx 삽입 순서)
+        self.names = names          # author_id → 이름
+        self.degrees = np.diff(self.weights.indptr)
+
+    def number_of_nodes(self):
+        return len(self.nodes)
+
+    def number_of_edges(self):
+        return self.weights.nnz // 2
+
+    def density(self):
+        """nx.density 와 같은 값. 노드가 1개 이하이면 0."""
+        n = self.number_of_nodes()
+        if n <= 1:
+            return 0.0
+        return 2 * self.number_of_edges() / (n * (n - 1))
+
+    def degree(self):
+        """이름 → 공저자 수 (노드 순서)"""
+        return {self.names[a]: int(self.degrees[a]) for a in self.nodes}
+
+    def degree_centrality(self):
+        """nx.degree_centrality 와 같은 값 (이름 → 차수 / (노드 수 - 1))"""
+        n = self.number_of_nodes()
+        scale = 1.0 / (n - 1) if n > 1 else 1.0
+        return {self.names[a]: self.degrees[a] * scale for a in self.nodes}
+
+    def top_authors(self, k=10):
+        """연결 중심성이 높은 순으로 k명 (동점이면 노드 순서)"""
+        order = np.argsort(-self.degrees[self.nodes], kind='stable')[:k]
+        return [self.names[a] for a in self.nodes[order]]
+
+    def components(self):
+        """연결 요소별 저자 이름 목록 (큰 요소부터)"""
+        if len(self.nodes) == 0:
+            return []
+        sub = self.weights[self.nodes][:, self.nodes]
+        _, labels = connected_components(sub, directed=False)
+        sizes = np.bincount(labels)
+        return [
+            [self.names[a] for a in self.nodes[labels == label]]
+            for label in np.argsort(-sizes, kind='stable')
+        ]
+
+    def largest_component_size(self):
+        if len(self.nodes) == 0:
+            return 0
+        _, labels = connected_components(self.weights[self.nodes][:, self.nodes], directed=False)
+        return int(np.bincount(labels).max())
+
+    def edges(self):
+        """(이름, 이름, 공저 편수) 목록. 각 쌍은 한 번만 나옵니다."""
+        upper = sparse.triu(self.weights, k=1).tocoo()
+        return [(self.names[a], self.names[b], int(w)) for a, b, w in zip(upper.row, upper.col, upper.data)]
+
+    def to_networkx(self):
+        """그림을 그릴 때 사용할 networkx 그래프 (weight = 공저 편수)"""
+        import networkx as nx
+
+        G = nx.Graph()
+        G.add_nodes_from(self.names[a] for a in self.nodes)
+        G.add_weighted_edges_from(self.edges())
+        return G
+
+
+def build_coauthor_network(author_index, links=None):
+    """
+    AuthorIndex 의 연결 테이블(또는 filter_years 로 거른 일부)로 공저 네트워크를 만듭니다.
+    """
+    links = author_index.links if links is None else links
+    links = coauthor_links(links)
+
+    weights = _weights(links, author_index.paper_count, len(author_index))
+
+    # 논문 순서대로 처음 등장한 순서 = networkx 에 엣지를 추가했을 때의 노드 순서
+    nodes = pd.unique(links['author_id'].to_numpy()).astype(np.int64)
+    return CoauthorNetwork(weights, nodes, author_index.names)
+
+
+WindowMetrics = namedtuple(
+    'WindowMetrics', ['start', 'end', 'nodes', 'edges', 'density', 'largest_component', 'top_authors'])
+
+
+class CoauthorTimeline:
+    """
+    연도별 공저 가중치 행렬(연도별 변화량)을 보관하고, 임의의 기간 또는 이동 구간의 네트워크 지표를 계산합니다.
+
+    이동 구간(rolling)은 새로 들어온 연도의 행렬을 더하고 빠진 연도의 행렬을 빼서 갱신하므로,
+    연도별 구간 전체를 훑는 비용이 네트워크를 한 번 만드는 비용과 비슷합니다.
+    """
+
+    def __init__(self, author_index, links=None):
+        self.author_index = author_index
+        links = author_index.links if links is None else links
+        self.links = coauthor_links(links)
+        self._shape = (len(author_index), len(author_index))
+
+        years = self.links['year'].to_numpy()
+        self.years = sorted(int(y) for y in np.unique(years))
+        self.year_weights = {
+            year: _weights(self.links[years == year], author_index.paper_count, len(author_index))
+            for year in self.years
+        }
+
+    def _bounds(self, start, end):
+        if not self.years:
+            return start or 0, end or 0
+        return (self.years[0] if start is None else start), (self.years[-1] if end is None else end)
+
+    def _year_matrix(self, year):
+        weights = self.year_weights.get(year)
+        return weights if weights is not None else sparse.csr_matrix(self._shape, dtype=np.int32)
+
+    def window(self, start=None, end=None):
+        """[start, end] 기간의 CoauthorNetwork (build_coauthor_network 로 만든 것과 같은 결과)"""
+        start, end = self._bounds(start, end)
+        weights = sparse.csr_matrix(self._shape, dtype=np.int32)
+        for year in self.years:
+            if start <= year <= end:
+                weights = weights + self.year_weights[year]
+
+        years = self.links['year'].to_numpy()
+        window_links = self.links[(years >= start) & (years <= end)]
+        nodes = pd.unique(window_links['author_id'].to_numpy()).astype(np.int64)
+        return CoauthorNetwork(weights.tocsr(), nodes, self.author_index.names)
+
+    def _metrics(self, start, end, weights, top_k):
+        degrees = np.diff(weights.indptr)
+        nodes = np.flatnonzero(degrees)
+        n = len(nodes)
+        edges = weights.nnz // 2
+        largest = 0
+        if n:
+            _, labels = connected_components(weights[nodes][:, nodes], directed=False)
+            largest = int(np.bincount(labels).max())
+        top = nodes[np.argsort(-degrees[nodes], kind='stable')[:top_k]]
+        return WindowMetrics(
+            start=start,
+            end=end,
+            nodes=n,
+            edges=edges,
+            density=2 * edges / (n * (n - 1)) if n > 1 else 0.0,
+            largest_component=largest,
+            top_authors=[(self.author_index.names[a], int(degrees[a])) for a in top],
+        )
+
+    def rolling(self, size, step=1, start=None, end=None, top_k=5):
+        """
+        size 년 길이의 구간을 step 년씩 옮기며 WindowMetrics 를 차례로 돌려줍니다.
+        top_authors 는 (이름, 공저자 수) 목록이며, 동점이면 저자 ID 순입니다.
+        """
+        start, end = self._bounds(start, end)
+        weights = sparse.csr_matrix(self._shape, dtype=np.int32)
+        included = set()
+        window_start = start
+        while window_start + size - 1 <= end:
+            window_years = set(range(window_start, window_start + size))
+            for year in sorted(window_years - included):
+                weights = weights + self._year_matrix(year)
+            removed = included - window_years
+            for year in sorted(removed):
+                weights = weights - self._year_matrix(year)
+            if removed:
+                weights.eliminate_zeros()
+            included = window_years
+
+            yield self._metrics(window_start, window_start + size - 1, weights.tocsr(), top_k)
+            window_start += step
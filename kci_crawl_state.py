@@ -0,0 +1,78 @@
+"""
+논문ID(R_SYST_LOCA_ID1) 기준으로 스크래핑 진행 상태를 저장하는 SQLite 저장소입니다.
+
+- 논문 한 건의 추출이 끝나는 즉시 기록하므로, 중간에 중단되어도 이미 처리한 논문은 남습니다.
+- 다시 실행하면 완료(done)된 논문은 상세 페이지를 다시 열지 않고 저장된 레코드를 사용하고,
+  실패(failed)한 논문만 다시 시도합니다.
+"""
+
+import json
+import sqlite3
+import time
+
+CRAWL_STATE_PATH = 'kci_crawl_state.sqlite'
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+class CrawlStateStore:
+    def __init__(self, path=CRAWL_STATE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT, -- 처음 발견된 순서 (검색 결과 순서)
+                article_id TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL,
+                detail_url TEXT,
+                record TEXT NOT NULL,                  -- 논문 레코드 (JSON)
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _upsert(self, article_id, status, record, detail_url, error):
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO articles (article_id, status, detail_url, record, attempts, last_error, updated_at)
+                VALUES (?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(article_id) DO UPDATE SET
+                    status = excluded.status,
+                    detail_url = COALESCE(excluded.detail_url, articles.detail_url),
+                    record = excluded.record,
+                    attempts = articles.attempts + 1,
+                    last_error = excluded.last_error,
+                    updated_at = excluded.updated_at
+            """, (article_id, status, detail_url, json.dumps(record, ensure_ascii=False), error, time.time()))
+
+    def mark_done(self, article_id, record, detail_url=None):
+        self._upsert(article_id, STATUS_DONE, record, detail_url, None)
+
+    def mark_failed(self, article_id, record, detail_url=None, error=None):
+        self._upsert(article_id, STATUS_FAILED, record, detail_url, error)
+
+    def status(self, article_id):
+        row = self.conn.execute('SELECT status FROM articles WHERE article_id = ?', (article_id,)).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, article_id):
+        return self.status(article_id) == STATUS_DONE
+
+    def get_record(self, article_id):
+        row = self.conn.execute('SELECT record FROM articles WHERE article_id = ?', (article_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def counts(self):
+        return dict(self.conn.execute('SELECT status, COUNT(*) FROM articles GROUP BY status').fetchall())
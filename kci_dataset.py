@@ -0,0 +1,184 @@
+"""
+분석 스크립트가 함께 사용하는 KCI 논문 데이터 로더입니다.
+
+CSV를 한 번만 파싱해 컬럼 타입을 정리한 뒤(정수형 연도/페이지/인용횟수, 범주형 저널명/발행기관/주제분야,
+저자 목록 컬럼) Parquet 캐시(.kci_cache/)에 저장합니다. 이후에는 CSV 대신 캐시를 읽으며,
+CSV 내용(sha256 해시)이 바뀌면 캐시를 새로 만듭니다. pyarrow가 없으면 pickle 캐시를 사용합니다.
+메모리에 다 올리기 어려운 큰 CSV는 iter_article_chunks() 로 같은 정리 규칙을 적용한 조각을 차례로 읽습니다.
+
+    from kci_dataset import load_articles
+    df = load_articles()
+    for chunk in iter_article_chunks(columns=['발행년도', '저자_상세']): ...
+"""
+
+import codecs
+import glob
+import hashlib
+import json
+import os
+import re
+
+import pandas as pd
+
+DATASET_CSV_PATH = 'kci_articles_all_fields_with_details.csv'
+DATASET_CACHE_DIR = os.environ.get('KCI_CACHE_DIR', '.kci_cache')
+
+TEXT_COLUMNS = ['제목', '저자_상세', '초록', '키워드_상세', '저자', '권', '호', '논문ID']
+CATEGORY_COLUMNS = ['저널명', '발행기관', '주제분야']
+INT_COLUMNS = ['시작페이지', '종료페이지', '인용횟수']
+AUTHOR_SPLIT_PATTERN = r'[|,;]'
+# 저자 문자열 컬럼 → 분리된 저자 목록 컬럼
+AUTHOR_LIST_COLUMNS = {'저자_상세': '저자_상세_목록', '저자': '저자_목록'}
+CSV_ENCODINGS = ('utf-8-sig', 'cp949', 'euc-kr')
+CHUNK_ROWS = int(os.environ.get('KCI_CHUNK_ROWS', '50000'))
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pkl'
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def csv_fingerprint(csv_path, cache_dir=DATASET_CACHE_DIR):
+    """
+    CSV 내용의 sha256 해시를 반환합니다. 파일 크기와 수정 시각이 지난번과 같으면
+    저장해 둔 해시를 재사용해 큰 파일을 매번 다시 읽지 않습니다.
+    """
+    stat = os.stat(csv_path)
+    meta_path = os.path.join(cache_dir, 'csv_hashes.json')
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            known = json.load(f)
+    except (FileNotFoundError, ValueError):
+        known = {}
+
+    key = os.path.abspath(csv_path)
+    entry = known.get(key)
+    if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return entry['sha256']
+
+    sha256 = file_hash(csv_path)
+    known[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(known, f, ensure_ascii=False, indent=2)
+    return sha256
+
+def read_csv_with_fallback(csv_path, **kwargs):
+    """utf-8 → cp949 → euc-kr 순서로 인코딩을 바꿔 가며 CSV를 읽습니다."""
+    for encoding in CSV_ENCODINGS:
+        try:
+            return pd.read_csv(csv_path, encoding=encoding, **kwargs)
+        except UnicodeDecodeError:
+            continue
+    raise UnicodeDecodeError('utf-8/cp949/euc-kr', b'', 0, 1, f'{csv_path} 인코딩을 확인할 수 없습니다.')
+
+def detect_encoding(csv_path, block_size=1024 * 1024):
+    """
+    read_csv_with_fallback 과 같은 순서로 시도해 파일 전체를 오류 없이 디코딩하는 첫 인코딩을 돌려줍니다.
+    조각 단위로 읽을 때는 중간에 인코딩 오류가 나면 처음부터 다시 읽어야 하므로 먼저 한 번 확인합니다.
+    """
+    for encoding in CSV_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(csv_path, 'rb') as f:
+                for block in iter(lambda: f.read(block_size), b''):
+                    decoder.decode(block)
+            decoder.decode(b'', final=True)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    raise UnicodeDecodeError('utf-8/cp949/euc-kr', b'', 0, 1, f'{csv_path} 인코딩을 확인할 수 없습니다.')
+
+def read_columns(csv_path, encoding=None):
+    """CSV 의 컬럼 이름 목록 (머리글만 읽음)"""
+    return pd.read_csv(csv_path, encoding=encoding or detect_encoding(csv_path), nrows=0).columns.tolist()
+
+def split_authors(text):
+    """'; ' 등으로 연결된 저자 문자열을 저자 목록으로 나눕니다."""
+    return [name.strip() for name in re.split(AUTHOR_SPLIT_PATTERN, str(text)) if name.strip()]
+
+def parse_year(series):
+    """'2020', '2020-06', 2020.0 등을 정수 연도로 바꿉니다. 알 수 없으면 0."""
+    return pd.to_numeric(series.astype(str).str[:4], errors='coerce').fillna(0).astype('int64')
+
+def normalize_articles(df):
+    """원본 CSV DataFrame의 컬럼 타입을 분석용으로 정리합니다."""
+    df = df.copy()
+    for column in TEXT_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].fillna('').astype(str)
+    if '발행년도' in df.columns:
+        df['발행년도'] = parse_year(df['발행년도'])
+    for column in INT_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].fillna('').astype(str).astype('category')
+    for source, target in AUTHOR_LIST_COLUMNS.items():
+        if source in df.columns:
+            df[target] = df[source].map(split_authors)
+    return df
+
+def iter_article_chunks(csv_path=DATASET_CSV_PATH, columns=None, chunk_rows=CHUNK_ROWS, encoding=None):
+    """
+    CSV 를 chunk_rows 행씩 읽어 normalize_articles 로 정리한 DataFrame 을 차례로 돌려줍니다.
+    columns 를 주면 그 컬럼만 읽습니다. (없는 컬럼은 무시) 조각마다 타입 추론이 달라지지 않도록 모두 문자열로 읽은 뒤
+    정리하므로, 조각을 이어 붙이면 load_articles() 결과와 같은 값이 됩니다.
+    """
+    usecols = (lambda column: column in columns) if columns is not None else None
+    reader = pd.read_csv(csv_path, encoding=encoding or detect_encoding(csv_path), usecols=usecols, dtype=str,
+                         chunksize=chunk_rows)
+    with reader:
+        for chunk in reader:
+            yield normalize_articles(chunk)
+
+def cache_path_for(sha256, cache_dir=DATASET_CACHE_DIR):
+    return os.path.join(cache_dir, f'articles_{sha256[:16]}.{CACHE_FORMAT}')
+
+def _write_cache(df, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 같은 CSV에서 만든 예전 캐시 파일 정리
+    for old_path in glob.glob(os.path.join(os.path.dirname(path), f'articles_*.{CACHE_FORMAT}')):
+        if old_path != path:
+            os.remove(old_path)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    if CACHE_FORMAT == 'parquet':
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+def _read_cache(path):
+    if CACHE_FORMAT == 'parquet':
+        df = pd.read_parquet(path)
+        # Parquet 리스트 컬럼은 numpy 배열로 읽히므로 파이썬 리스트로 되돌림
+        for column in AUTHOR_LIST_COLUMNS.values():
+            if column in df.columns:
+                df[column] = df[column].map(list)
+        return df
+    return pd.read_pickle(path)
+
+def load_articles(csv_path=DATASET_CSV_PATH, cache_dir=DATASET_CACHE_DIR, use_cache=True):
+    """
+    타입이 정리된 논문 DataFrame을 반환합니다. 캐시가 있으면 캐시를, 없으면 CSV를 파싱해 캐시를 만듭니다.
+    CSV가 없으면 FileNotFoundError 가 발생합니다.
+    """
+    if not use_cache:
+        return normalize_articles(read_csv_with_fallback(csv_path))
+
+    path = cache_path_for(csv_fingerprint(csv_path, cache_dir), cache_dir)
+    if os.path.exists(path):
+        return _read_cache(path)
+
+    df = normalize_articles(read_csv_with_fallback(csv_path))
+    _write_cache(df, path)
+    return df
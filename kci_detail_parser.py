@@ -0,0 +1,215 @@
+import re
+
+import httpx
+import lxml.html
+
+# 키워드 섹션을 찾을 때 사용하는 문구 (Playwright의 :has-text 와 같이 대소문자 구분 없이 비교)
+KEYWORD_SECTION_MARKERS = ['키워드', 'keywords']
+# 한글 키워드 <p> 후보에서 제외할 문구
+KEYWORD_EXCLUDE_PHRASES = ['초록', '저자', 'abstract', 'author', '본 논문은']
+
+HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+    ),
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+}
+
+
+# --- 추출값 정제 규칙 (Playwright / HTTP 백엔드 공통) ---
+
+def join_abstracts(abstract_texts):
+    """국문/영문 초록 텍스트 목록을 줄바꿈으로 연결합니다. 빈 초록은 제외합니다."""
+    return "\n".join(text.strip() for text in abstract_texts if text and text.strip())
+
+def clean_author_name(author_name_raw):
+    # 불필요한 공백, 줄바꿈, 이름 뒤의 숫자나 이메일 패턴을 제거
+    author_name_cleaned = re.sub(r'\s*\d+(\s*@\S+)?$', '', author_name_raw or '').strip()
+
+    # 국문/영문 이름이 '/'로 구분된 경우, 국문 이름만 취함
+    if '/' in author_name_cleaned:
+        author_name_cleaned = author_name_cleaned.split('/')[0].strip()
+    return author_name_cleaned
+
+def join_authors(author_texts):
+    """저자 링크 텍스트를 정제한 뒤 중복을 제거하고 가나다 순으로 정렬해 '; '로 연결합니다."""
+    all_authors = [name for name in (clean_author_name(text) for text in author_texts) if name]
+    return "; ".join(sorted(set(all_authors)))
+
+def pick_korean_keywords(p_texts):
+    """
+    키워드 섹션의 <p> 텍스트 중 한글 키워드 목록으로 보이는 첫 번째 텍스트를 골라 정제합니다.
+    (한글 포함, 길이 10자 이상, '초록/저자'와 같은 불필요한 단어가 없는 텍스트)
+    """
+    korean_keywords_text = ""
+    for p_text in p_texts:
+        p_text = p_text or ''
+        if re.search(r'[가-힣]', p_text) and len(p_text) > 10 and \
+           not any(phrase in p_text for phrase in KEYWORD_EXCLUDE_PHRASES):
+            korean_keywords_text = p_text.strip()
+            break
+
+    # 한글 키워드 정제: 쉼표를 세미콜론으로 변환 및 공백 제거
+    if korean_keywords_text:
+        korean_keywords_text = korean_keywords_text.replace(' ', '').replace(',', ';')
+        korean_keywords_text = ';'.join(filter(None, korean_keywords_text.split(';')))
+    return korean_keywords_text
+
+def combine_keywords(english_keyword_texts, korean_p_texts):
+    """영문 키워드(a#keywd)와 한글 키워드(<p>)를 하나의 세미콜론 구분 문자열로 결합합니다."""
+    english_keywords = [(keyword or '').strip() for keyword in english_keyword_texts]
+    korean_keywords_text = pick_korean_keywords(korean_p_texts)
+
+    keywords_combined = ""
+    if english_keywords and korean_keywords_text:
+        keywords_combined = "; ".join(english_keywords) + ";" + korean_keywords_text
+    elif english_keywords:
+        keywords_combined = "; ".join(english_keywords)
+    elif korean_keywords_text:
+        keywords_combined = korean_keywords_text
+
+    # 최종 정제: 중복 세미콜론 제거 및 양쪽 공백 제거
+    keywords_combined = ';'.join(filter(None, keywords_combined.split(';')))
+    return re.sub(r';\s*;', ';', keywords_combined).strip()
+
+def build_detail_info(raw_fields):
+    """
+    상세 페이지에서 한 번에 모은 원문 텍스트로 (초록, 저자_상세, 키워드_상세) 튜플을 만듭니다.
+
+    raw_fields 형식 (브라우저 evaluate 결과와 HTML 파서 결과가 같은 형식):
+        {'abstracts': [...], 'authors': [...],
+         'keyword_section': None 또는 {'english': [...], 'paragraphs': [...]}}
+    """
+    keywords_combined = ""
+    section = raw_fields.get('keyword_section')
+    if section is not None:
+        keywords_combined = combine_keywords(section.get('english', []), section.get('paragraphs', []))
+    return (
+        join_abstracts(raw_fields.get('abstracts', [])),
+        join_authors(raw_fields.get('authors', [])),
+        keywords_combined,
+    )
+
+def build_article_record(data_dict, title_on_search_page=''):
+    """검색 결과 행의 hidden input 값(name → value)으로 논문 한 건의 기본 레코드를 만듭니다."""
+    record = {
+        '제목': data_dict.get('R_INDE_TITL', '') or (title_on_search_page or '').strip(),
+        '저널명': data_dict.get('R_SERE_NM', ''),
+        '발행기관': data_dict.get('R_PUBI_INSI_NM', ''),
+        '권': data_dict.get('R_VOL', ''),
+        '호': data_dict.get('R_ISSE', ''),
+        '시작페이지': data_dict.get('R_ST_PG', ''),
+        '종료페이지': data_dict.get('R_END_PG', ''),
+        '발행년도': (data_dict.get('R_PUBI_DT', '') or '')[:4],
+        '주제분야': data_dict.get('R_MAJOR', ''),
+        '인용횟수': data_dict.get('R_CITATED_IDX', ''),
+        '논문ID': data_dict.get('R_SYST_LOCA_ID1', ''),
+        '초록': '',
+        '저자_상세': '',
+        '키워드_상세': '',
+    }
+    record['저자'] = data_dict.get('R_CRET_NM', '')
+    return record
+
+
+# --- 정적 HTML 파싱 (브라우저 없이) ---
+
+def _has_class(*class_names):
+    return ' and '.join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in class_names
+    )
+
+def _normalized_text(element):
+    return ' '.join(element.text_content().split()).lower()
+
+def _find_keyword_section(doc):
+    """
+    'div.innerBox.open' 중 '키워드'/'Keywords' 문구가 있는 <p> 또는 a#keywd 를 포함한
+    첫 번째 섹션을 문서 순서대로 찾습니다. (Playwright 셀렉터와 같은 규칙)
+    """
+    for section in doc.xpath(f"//div[{_has_class('innerBox', 'open')}]"):
+        if section.xpath(".//a[@id='keywd']"):
+            return section
+        for p in section.xpath('.//p'):
+            text = _normalized_text(p)
+            if any(marker in text for marker in KEYWORD_SECTION_MARKERS):
+                return section
+    return None
+
+def extract_raw_fields(doc):
+    """lxml 문서에서 build_detail_info 에 넘길 원문 텍스트를 모읍니다."""
+    section = _find_keyword_section(doc)
+    return {
+        'abstracts': [p.text_content() for p in doc.xpath("//p[@id='korAbst' or @id='folaAbst']")],
+        'authors': [a.text_content() for a in doc.xpath(f"//div[{_has_class('author')}]//a")],
+        'keyword_section': None if section is None else {
+            'english': [a.text_content() for a in section.xpath(".//a[@id='keywd']")],
+            'paragraphs': [p.text_content() for p in section.xpath('.//p')],
+        },
+    }
+
+def parse_search_rows_html(html):
+    """
+    검색 결과 페이지 HTML에서 행마다 상세 링크(href, 제목)와 hidden input 값을 추출합니다.
+    scrape_kci_details.SEARCH_ROWS_JS 와 같은 형식의 사전 목록을 반환합니다.
+    """
+    doc = lxml.html.fromstring(html)
+    table = f"//table[{_has_class('search-answer-tbl')}]"
+    row_fields = []
+    for row in doc.xpath(f'{table}/tbody/tr | {table}/tr'):
+        links = row.xpath(f".//a[{_has_class('subject')}]") or row.xpath(".//a[contains(@href, 'ciSereArtiView')]")
+        link = links[0] if links else None
+        row_fields.append({
+            'href': link.get('href') if link is not None else None,
+            'title': link.text_content() if link is not None else None,
+            'inputs': {el.get('name'): el.get('value') for el in row.xpath(".//input[@type='hidden']")},
+        })
+    return row_fields
+
+def missing_detail_blocks(doc):
+    """
+    상세 페이지라면 값이 비어 있어도 항상 있는 블록(저자 목록, 초록 영역) 중 문서에 없는 블록 이름 목록입니다.
+    키워드나 영문 초록이 없는 논문은 흔하므로 항목 값이 비어 있는 것은 구조 오류로 보지 않습니다.
+    """
+    missing = []
+    if not doc.xpath(f"//div[{_has_class('author')}]"):
+        missing.append('author')
+    if not doc.xpath("//p[@id='korAbst' or @id='folaAbst']"):
+        missing.append('abstract')
+    return missing
+
+def parse_detail_html(html):
+    """
+    ciSereArtiView 상세 페이지 HTML에서 (초록, 저자_상세, 키워드_상세)를 추출합니다.
+    extract_detail_info 와 같은 셀렉터와 정제 규칙을 사용하므로 결과 튜플이 동일합니다.
+    """
+    return build_detail_info(extract_raw_fields(lxml.html.fromstring(html)))
+
+def parse_detail_page(html):
+    """parse_detail_html 결과와 missing_detail_blocks 목록을 한 번의 파싱으로 돌려줍니다."""
+    doc = lxml.html.fromstring(html)
+    return build_detail_info(extract_raw_fields(doc)), missing_detail_blocks(doc)
+
+
+# --- HTTP 백엔드 ---
+
+def create_http_client(concurrency, cookies=None):
+    """
+    상세 페이지 요청용 비동기 HTTP 클라이언트를 만듭니다.
+    연결 풀 크기를 concurrency로 제한해 동시에 열리는 연결 수를 조절합니다.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    return httpx.AsyncClient(
+        headers=HTTP_HEADERS,
+        cookies=cookies,
+        limits=limits,
+        timeout=httpx.Timeout(30.0),
+        follow_redirects=True,
+    )
+
+async def fetch_detail_html(http_client, detail_url):
+    """상세 페이지 HTML을 받아 옵니다. 응답 오류는 httpx 예외로 그대로 전달됩니다."""
+    response = await http_client.get(detail_url)
+    response.raise_for_status()
+    return response.text
@@ -0,0 +1,267 @@
+"""
+KCI 사이트 대신 사용할 로컬 테스트 서버입니다.
+
+- 상세 페이지(ciSereArtiView.kci)는 FIXTURE_DIR/detail/<논문ID>.html 에 저장된 HTML이 있으면 그대로,
+  없으면 CSV의 논문 정보로 KCI 마크업(p#korAbst, div.author a, a#keywd 등)을 흉내 낸 HTML을 만들어 응답합니다.
+- 검색 페이지(poArtiSearList.kci)는 검색창(#topKeyword, button.searchbtn)과, query 가 있으면 CSV 논문을
+  SEARCH_PAGE_SIZE 개씩 나눈 결과 표(table.search-answer-tbl)와 goPage(n) 페이지 링크를 응답합니다.
+  FIXTURE_DIR/search/<페이지 번호>.html 이 있으면 그 HTML을 사용합니다.
+- latency/jitter 를 주면 응답마다 그만큼(균등 분포) 늦게 보내 실제 사이트의 응답 지연을 흉내 냅니다.
+- --save 로 현재 응답(또는 페이지 캐시에 저장된 실제 KCI 페이지)을 FIXTURE_DIR 에 HTML 파일로 저장합니다.
+- 스크래퍼는 KCI_BASE_URL 환경 변수로 이 서버를 가리키면 네트워크 없이 실행할 수 있습니다.
+"""
+
+import argparse
+import csv
+import html
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+CSV_PATH = 'kci_articles_all_fields_with_details.csv'
+FIXTURE_DIR = 'fixtures'
+DETAIL_PATH = '/kciportal/ci/sereArticleSearch/ciSereArtiView.kci'
+SEARCH_PATH = '/kciportal/po/search/poArtiSearList.kci'
+SEARCH_PAGE_SIZE = 10
+
+
+def detail_url(base_url, article_id):
+    return f'{base_url}{DETAIL_PATH}?sereArticleSearchBean.artiId={article_id}'
+
+def load_articles(csv_path=CSV_PATH):
+    """CSV를 읽어 {논문ID: 행} 사전을 반환합니다. (CSV 저장 순서 유지)"""
+    with open(csv_path, encoding='utf-8-sig', newline='') as f:
+        return {row['논문ID']: row for row in csv.DictReader(f) if row.get('논문ID')}
+
+def render_detail_html(article):
+    """CSV 한 행으로 KCI 상세 페이지와 같은 구조의 HTML을 만듭니다."""
+    esc = html.escape
+    authors = [a.strip() for a in article.get('저자_상세', '').split(';') if a.strip()]
+    keywords = [k.strip() for k in article.get('키워드_상세', '').split(';') if k.strip()]
+
+    author_links = '\n'.join(f'      <a href="#">{esc(name)}</a>' for name in authors)
+    keyword_links = '\n'.join(f'      <a href="#" id="keywd">{esc(kw)}</a>' for kw in keywords)
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>{esc(article.get('제목', ''))}</title></head>
+<body>
+  <div class="subject"><h3>{esc(article.get('제목', ''))}</h3></div>
+  <div class="author">
+{author_links}
+  </div>
+  <div class="innerBox">
+    <p class="title">초록</p>
+    <p id="korAbst">{esc(article.get('초록', ''))}</p>
+  </div>
+  <div class="innerBox open">
+    <p class="title">키워드</p>
+    <div class="keywords">
+{keyword_links}
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+# 검색 결과 행의 hidden input 이름과 CSV 컬럼의 대응 (scrape_kci_details 가 읽는 값)
+SEARCH_ROW_INPUTS = [
+    ('R_SYST_LOCA_ID1', '논문ID'), ('R_INDE_TITL', '제목'), ('R_SERE_NM', '저널명'),
+    ('R_PUBI_INSI_NM', '발행기관'), ('R_VOL', '권'), ('R_ISSE', '호'), ('R_ST_PG', '시작페이지'),
+    ('R_END_PG', '종료페이지'), ('R_PUBI_DT', '발행년도'), ('R_MAJOR', '주제분야'),
+    ('R_CITATED_IDX', '인용횟수'), ('R_CRET_NM', '저자'),
+]
+
+def render_search_rows_html(articles):
+    """논문 목록으로 KCI 검색 결과 표(table.search-answer-tbl)를 만듭니다."""
+    esc = html.escape
+    rows = []
+    for article in articles:
+        inputs = ''.join(
+            f'<input type="hidden" name="{name}" value="{esc(article.get(column, ""))}">'
+            for name, column in SEARCH_ROW_INPUTS
+        )
+        href = detail_url('', article['논문ID'])
+        rows.append(
+            f'    <tr><td>{inputs}<a class="subject" href="{esc(href)}">{esc(article.get("제목", ""))}</a></td></tr>'
+        )
+    body = '\n'.join(rows)
+    return f"""<table class="search-answer-tbl">
+  <tbody>
+{body}
+  </tbody>
+</table>"""
+
+def render_search_page_html(articles=(), query='', page_num=1, page_count=0):
+    """검색창과 (query 가 있으면) 검색 결과 표, goPage(n) 페이지 링크가 있는 검색 페이지 HTML"""
+    esc = html.escape
+    results = ''
+    if query:
+        links = ' '.join(
+            f'<a href="javascript:goPage({n})">{n}</a>' if n != page_num else f'<strong>{n}</strong>'
+            for n in range(1, page_count + 1)
+        )
+        results = f"""
+  {render_search_rows_html(articles)}
+  <div class="paging">{links}</div>"""
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>KCI 논문 검색</title>
+<script>
+function goPage(n) {{
+  const params = new URLSearchParams(location.search);
+  params.set('page', n);
+  location.search = params.toString();
+}}
+</script>
+</head>
+<body>
+  <form method="get" action="{SEARCH_PATH}">
+    <input type="text" id="topKeyword" name="query" value="{esc(query)}">
+    <button type="submit" class="searchbtn">검색</button>
+  </form>{results}
+</body>
+</html>
+"""
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    articles = {}
+    fixture_dir = FIXTURE_DIR
+    latency = 0.0
+    jitter = 0.0
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        body = None
+        if parsed.path == DETAIL_PATH:
+            body = self.detail_body(params.get('sereArticleSearchBean.artiId', [''])[0])
+        elif parsed.path == SEARCH_PATH:
+            body = self.search_body(params.get('query', [''])[0], params.get('page', ['1'])[0])
+        if body is None:
+            return self.send_error(404)
+        self.delay()
+        self.send_html(body)
+
+    def delay(self):
+        if self.latency > 0 or self.jitter > 0:
+            time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+    def detail_body(self, article_id):
+        saved_path = os.path.join(self.fixture_dir, 'detail', f'{article_id}.html')
+        if os.path.exists(saved_path):
+            with open(saved_path, 'rb') as f:
+                return f.read()
+        article = self.articles.get(article_id)
+        if article is None:
+            return None
+        return render_detail_html(article).encode('utf-8')
+
+    def search_body(self, query, page):
+        page_num = int(page) if page.isdigit() and int(page) > 0 else 1
+        if query:
+            saved_path = os.path.join(self.fixture_dir, 'search', f'{page_num}.html')
+            if os.path.exists(saved_path):
+                with open(saved_path, 'rb') as f:
+                    return f.read()
+        # 검색어와 관계없이 CSV 의 모든 논문을 저장 순서대로 나눠 보여 줌
+        articles = list(self.articles.values())
+        page_count = max(1, -(-len(articles) // SEARCH_PAGE_SIZE))
+        if query and page_num > page_count:
+            return None
+        start = (page_num - 1) * SEARCH_PAGE_SIZE
+        return render_search_page_html(articles[start:start + SEARCH_PAGE_SIZE], query, page_num,
+                                       page_count).encode('utf-8')
+
+    def send_html(self, body):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 찍지 않음
+
+
+def start_fixture_server(port=0, csv_path=CSV_PATH, fixture_dir=FIXTURE_DIR, latency=0.0, jitter=0.0):
+    """
+    백그라운드 스레드에서 테스트 서버를 띄우고 (server, base_url)을 반환합니다.
+    port=0 이면 비어 있는 포트를 자동으로 사용합니다. 종료는 server.shutdown().
+    latency/jitter(초)를 주면 응답마다 latency ± jitter 만큼 늦게 응답합니다.
+    """
+    handler = type('Handler', (FixtureRequestHandler,), {
+        'articles': load_articles(csv_path),
+        'fixture_dir': fixture_dir,
+        'latency': latency,
+        'jitter': jitter,
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+def save_fixtures(fixture_dir=FIXTURE_DIR, csv_path=CSV_PATH, page_cache_dir=None, limit=None):
+    """
+    검색 결과 페이지와 상세 페이지를 fixture_dir/search/<n>.html, fixture_dir/detail/<논문ID>.html 로 저장합니다.
+    page_cache_dir 를 주면 스크래퍼가 페이지 캐시에 저장해 둔 실제 KCI 페이지를, 없으면 CSV 로 만든 페이지를 씁니다.
+    limit 는 저장할 상세 페이지 수입니다. (검색 결과 페이지는 그 논문들이 들어가는 페이지까지)
+    반환값: (검색 결과 페이지 수, 상세 페이지 수)
+    """
+    os.makedirs(os.path.join(fixture_dir, 'search'), exist_ok=True)
+    os.makedirs(os.path.join(fixture_dir, 'detail'), exist_ok=True)
+
+    def write(path, body):
+        with open(path, 'wb') as f:
+            f.write(body if isinstance(body, bytes) else body.encode('utf-8'))
+
+    if page_cache_dir is not None:
+        from kci_page_cache import KIND_DETAIL, KIND_SEARCH, PageCache
+
+        with PageCache(page_cache_dir) as page_cache:
+            details = [(article_id, body) for _, article_id, body in page_cache.iter_pages(KIND_DETAIL) if article_id]
+            details = details[:limit] if limit else details
+            pages = list(page_cache.iter_pages(KIND_SEARCH))
+            pages = pages[:-(-len(details) // SEARCH_PAGE_SIZE)] if limit else pages
+            for page_num, (_, _, body) in enumerate(pages, start=1):
+                write(os.path.join(fixture_dir, 'search', f'{page_num}.html'), body)
+            for article_id, body in details:
+                write(os.path.join(fixture_dir, 'detail', f'{article_id}.html'), body)
+        return len(pages), len(details)
+
+    articles = list(load_articles(csv_path).values())[:limit]
+    page_count = -(-len(articles) // SEARCH_PAGE_SIZE)
+    for page_num in range(1, page_count + 1):
+        start = (page_num - 1) * SEARCH_PAGE_SIZE
+        write(os.path.join(fixture_dir, 'search', f'{page_num}.html'),
+              render_search_page_html(articles[start:start + SEARCH_PAGE_SIZE], 'fixture', page_num, page_count))
+    for article in articles:
+        write(os.path.join(fixture_dir, 'detail', f"{article['논문ID']}.html"), render_detail_html(article))
+    return page_count, len(articles)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='KCI 로컬 테스트 서버')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--csv', default=CSV_PATH)
+    parser.add_argument('--fixtures', default=FIXTURE_DIR)
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='응답 지연 변동 폭 (초, ±)')
+    parser.add_argument('--save', action='store_true', help='서버를 띄우지 않고 페이지를 --fixtures 에 HTML 파일로 저장')
+    parser.add_argument('--from-page-cache', help='--save 에서 사용할 스크래퍼 페이지 캐시 디렉토리 (실제 KCI 페이지)')
+    parser.add_argument('--limit', type=int, help='--save 로 저장할 상세 페이지 수')
+    args = parser.parse_args()
+
+    if args.save:
+        pages, details = save_fixtures(args.fixtures, args.csv, args.from_page_cache, args.limit)
+        print(f"✅ 저장 완료: {args.fixtures} (검색 결과 {pages}페이지, 상세 {details}건)")
+    else:
+        server, base_url = start_fixture_server(args.port, args.csv, args.fixtures, args.latency, args.jitter)
+        print(f"🧪 테스트 서버 실행 중: {base_url}  (KCI_BASE_URL={base_url} 로 스크래퍼 실행)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
@@ -0,0 +1,96 @@
+"""
+그림에 쓸 한글 폰트를 한 번만 찾아 .kci_cache/font.json 에 기억해 두는 모듈입니다.
+
+matplotlib 이 이미 만들어 둔 폰트 목록(fontManager)에서 이름으로 찾으므로 파일 시스템을 다시 훑지 않고,
+목록에 없을 때만 시스템 폰트를 한 번 검색해 등록합니다. 찾은 결과는 캐시 파일에 저장되어 다음 실행에서는
+파일이 그대로 있는지만 확인합니다. KCI_FONT 환경 변수에 폰트 이름이나 파일 경로를 주면 그 폰트를 사용합니다.
+
+    from kci_fonts import apply_korean_font
+    font_prop = apply_korean_font()      # rcParams 설정 + FontProperties 반환
+"""
+
+import json
+import os
+
+import matplotlib
+import matplotlib.font_manager as fm
+import matplotlib.pyplot as plt
+
+from kci_dataset import DATASET_CACHE_DIR
+
+KOREAN_FONT_NAMES = [
+    'AppleGothic', 'NanumGothic', 'NanumBarunGothic', 'Malgun Gothic',
+    'Noto Sans CJK KR', 'Noto Sans KR', 'UnDotum',
+]
+FONT_CACHE_PATH = os.path.join(DATASET_CACHE_DIR, 'font.json')
+FONT_OVERRIDE = os.environ.get('KCI_FONT')
+
+_resolved = None
+
+
+def _find_korean_font():
+    """(폰트 이름, 파일 경로) 또는 None"""
+    if FONT_OVERRIDE and os.path.exists(FONT_OVERRIDE):
+        fm.fontManager.addfont(FONT_OVERRIDE)
+        return fm.FontProperties(fname=FONT_OVERRIDE).get_name(), FONT_OVERRIDE
+
+    candidates = ([FONT_OVERRIDE] if FONT_OVERRIDE else []) + KOREAN_FONT_NAMES
+    known = {entry.name: entry.fname for entry in fm.fontManager.ttflist}
+    for name in candidates:
+        if name in known:
+            return name, known[name]
+
+    # matplotlib 폰트 목록을 만든 뒤에 설치된 폰트: 시스템 폰트를 한 번만 훑어 파일 이름으로 찾음
+    paths = fm.findSystemFonts(fontpaths=None, fontext='ttf')
+    for name in candidates:
+        key = name.replace(' ', '').lower()
+        for path in paths:
+            if key in os.path.basename(path).replace(' ', '').lower():
+                fm.fontManager.addfont(path)
+                return fm.FontProperties(fname=path).get_name(), path
+    return None
+
+def korean_font(cache_path=FONT_CACHE_PATH):
+    """
+    한글 폰트의 (이름, 파일 경로). 없으면 (None, None).
+    찾은 결과는 캐시 파일에 저장하고, 캐시의 파일이 지워졌거나 matplotlib 버전이 바뀌면 다시 찾습니다.
+    """
+    global _resolved
+    if _resolved is not None:
+        return _resolved
+
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        if (cached.get('matplotlib') == matplotlib.__version__ and cached.get('override') == FONT_OVERRIDE
+                and os.path.exists(cached['path'])):
+            if cached['name'] not in {entry.name for entry in fm.fontManager.ttflist}:
+                fm.fontManager.addfont(cached['path'])
+            _resolved = (cached['name'], cached['path'])
+            return _resolved
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    found = _find_korean_font()
+    if found is None:
+        # 찾지 못한 결과는 저장하지 않음 (폰트를 설치한 뒤 다시 찾도록)
+        print("⚠️ 한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다. (KCI_FONT 로 지정 가능)")
+        _resolved = (None, None)
+        return _resolved
+
+    name, path = found
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'name': name, 'path': path, 'matplotlib': matplotlib.__version__, 'override': FONT_OVERRIDE},
+                  f, ensure_ascii=False)
+    _resolved = (name, path)
+    return _resolved
+
+def apply_korean_font():
+    """한글 폰트를 rcParams 기본 폰트로 설정하고 FontProperties 를 돌려줍니다. (없으면 기본 폰트)"""
+    name, path = korean_font()
+    plt.rcParams['axes.unicode_minus'] = False
+    if name is None:
+        return fm.FontProperties()
+    plt.rcParams['font.family'] = name
+    return fm.FontProperties(fname=path)
@@ -0,0 +1,234 @@
+"""
+여러 키워드를 여러 문서에서 한 번에 찾는 다중 패턴 매처입니다.
+
+문서 전체를 하나의 문자열(말뭉치)로 이어 붙여 한 번만 소문자로 바꾸고, 키워드 전체로 만든 Aho-Corasick 오토마톤
+(pyahocorasick)으로 말뭉치를 한 번만 훑어 모든 일치 위치를 얻습니다. 일치 위치는 numpy 로 문서 경계 배열에
+대응시켜 (문서 수, 키워드 수) 결과를 한 번에 채우므로 행마다 파이썬 함수를 호출하지 않으며,
+키워드 수가 늘어도 스캔 횟수는 한 번입니다. 포함 여부만 필요한 any() 는 문서마다 첫 일치에서 멈춥니다.
+pyahocorasick 이 없으면 키워드마다 str.find 로 같은 결과를 구합니다.
+
+word_boundary=True 이면 영문/숫자로 시작하거나 끝나는 키워드('ai', 'ar' 등)는 앞뒤가 영문/숫자가 아닐 때만
+일치합니다. ('ar' 이 'art', 'research' 안에서 잡히지 않음) 한글 키워드는 조사가 붙으므로 경계를 보지 않습니다.
+
+    matcher = KeywordMatcher(['ai', '인공지능', 'vr'], word_boundary=True)
+    hits = matcher.hits(combine_columns(df))     # (문서 수, 키워드 수) bool 배열
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+TEXT_COLUMNS = ['제목', '초록', '키워드_상세']
+# 분석 스크립트가 함께 쓰는 키워드 목록 (그림/폰트 설정 없이 불러올 수 있도록 여기에 둠)
+# 연도별 트렌드로 추적할 키워드 (trend_extract, kci_report, kci_pipeline)
+TARGET_KEYWORDS = ['ai', '큐레이션', '몰입', '디지털', 'ar', 'vr', '메타버스']
+# data_visualization.py 의 제목 기술 키워드
+TECH_KEYWORDS = ["AI", "XR", "VR", "AR", "메타버스", "인공지능", "가상현실", "확장현실", "디지털트윈"]
+# 영문 외 문자 중 str.lower() 결과에 영문이 들어가는 문자 (İ, 켈빈 기호)
+_LOWER_TO_ASCII = tuple(chr(code) for code in (0x0130, 0x212A))
+
+
+def combine_columns(df, columns=TEXT_COLUMNS, sep=' '):
+    """여러 텍스트 컬럼을 문서 하나로 합칩니다. (analyze_kci 의 '제목 + 초록 + 키워드_상세' 결합과 같음)"""
+    combined = df[columns[0]].fillna('').astype(str)
+    for column in columns[1:]:
+        combined = combined + sep + df[column].fillna('').astype(str)
+    return combined
+
+def _is_word(char):
+    return char.isascii() and char.isalnum()
+
+def _has_border(text):
+    """키워드가 자기 자신과 겹쳐 나올 수 있는지 (접두어 = 접미어인 부분이 있는지)"""
+    return any(text[:size] == text[-size:] for size in range(1, len(text)))
+
+
+class KeywordMatcher:
+    def __init__(self, keywords, ignore_case=True, word_boundary=False):
+        self.keywords = list(keywords)
+        self.ignore_case = ignore_case
+        self.word_boundary = word_boundary
+
+        # 같은 키워드가 여러 번 들어와도 한 번만 검색하고 결과는 해당 컬럼 모두에 기록
+        self._texts = []
+        self._columns = []
+        for column, keyword in enumerate(self.keywords):
+            text = keyword.lower() if ignore_case else keyword
+            if text in self._texts:
+                self._columns[self._texts.index(text)].append(column)
+            else:
+                self._texts.append(text)
+                self._columns.append([column])
+        self._lengths = np.array([len(text) for text in self._texts], dtype=np.int64)
+        self._check_start = [word_boundary and _is_word(text[0]) for text in self._texts]
+        self._check_end = [word_boundary and _is_word(text[-1]) for text in self._texts]
+        self._border = [_has_border(text) for text in self._texts]
+
+        # 키워드가 영문/한글처럼 영문 외 대소문자가 없는 문자로만 되어 있으면 UTF-8 바이트에서 영문만 소문자로 바꿔도
+        # str.lower() 와 같은 결과가 나오므로 Arrow 버퍼를 바로 사용
+        self._ascii_lower_ok = not ignore_case or all(
+            ch.isascii() or ch.lower() == ch.upper() for text in self._texts for ch in text)
+
+        self._automaton = None
+        if ahocorasick is not None and self._texts:
+            self._automaton = ahocorasick.Automaton()
+            for text_id, text in enumerate(self._texts):
+                self._automaton.add_word(text, text_id)
+            self._automaton.make_automaton()
+
+    def _corpus_arrow(self, texts):
+        """Arrow 문자열 버퍼로 말뭉치를 만듭니다. 조건이 맞지 않으면 None."""
+        array = pa.array(texts, type=pa.large_string(), from_pandas=True).fill_null('')
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        if len(array) == 0:
+            return '', np.zeros(1, dtype=np.int64)
+        _, offsets_buffer, data_buffer = array.buffers()
+        offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+        data = bytes(memoryview(data_buffer).cast('B')[offsets[0]:offsets[-1]]) if data_buffer is not None else b''
+        if self.ignore_case:
+            data = data.lower()     # 영문만 소문자로
+        corpus = data.decode('utf-8')
+        if self.ignore_case and any(ch in corpus for ch in _LOWER_TO_ASCII):
+            return None
+        lengths = pc.utf8_length(array).to_numpy(zero_copy_only=False)
+        return corpus, np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+
+    def _corpus_str(self, texts):
+        texts = pd.Series(texts, dtype=object).fillna('').astype(str).tolist()
+        corpus = ''.join(texts)
+        if self.ignore_case:
+            lowered = corpus.lower()
+            if len(lowered) == len(corpus):
+                corpus = lowered
+            else:
+                # 일부 특수 문자는 소문자로 바꾸면 길이가 달라지므로 그때만 문서별로 변환
+                texts = [t.lower() for t in texts]
+                corpus = ''.join(texts)
+        lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        return corpus, np.concatenate(([0], np.cumsum(lengths)))
+
+    def _corpus(self, texts):
+        """(소문자로 바꾼 말뭉치 문자열, 문서 경계 배열[문서 수 + 1])"""
+        if pa is not None and self._ascii_lower_ok:
+            prepared = self._corpus_arrow(texts)
+            if prepared is not None:
+                return prepared
+        return self._corpus_str(texts)
+
+    def _occurrences(self, corpus):
+        """모든 (겹치는 것 포함) 일치의 (시작 위치 배열, 키워드 번호 배열)"""
+        if self._automaton is not None:
+            found = np.array(list(self._automaton.iter(corpus)), dtype=np.int64).reshape(-1, 2)
+            text_ids = found[:, 1]
+            return found[:, 0] - self._lengths[text_ids] + 1, text_ids
+
+        starts, text_ids = [], []
+        for text_id, text in enumerate(self._texts):
+            position = corpus.find(text)
+            while position != -1:
+                starts.append(position)
+                text_ids.append(text_id)
+                position = corpus.find(text, position + 1)
+        return np.array(starts, dtype=np.int64), np.array(text_ids, dtype=np.int64)
+
+    def _matches(self, texts, non_overlapping):
+        """
+        키워드 번호별로 조건(문서 경계, 단어 경계)을 만족하는 일치의 문서 번호 배열 목록을 돌려줍니다.
+        non_overlapping=True 이면 키워드마다 왼쪽부터 겹치지 않게 고릅니다. (str.count 와 같은 방식)
+        """
+        if not self._texts:
+            return []
+        corpus, bounds = self._corpus(texts)
+        starts, text_ids = self._occurrences(corpus)
+        ends = starts + self._lengths[text_ids]
+        docs = np.searchsorted(bounds, starts, side='right') - 1
+        doc_starts, doc_ends = bounds[docs], bounds[docs + 1]
+        # 문서 경계를 넘는 일치는 무효
+        valid = ends <= doc_ends
+
+        check_start = np.array(self._check_start, dtype=bool)[text_ids]
+        check_end = np.array(self._check_end, dtype=bool)[text_ids]
+        if check_start.any() or check_end.any():
+            # 일치 앞뒤 글자가 영문/숫자인지 한 번에 검사 (UTF-32 로 바꿔 글자 위치 = 배열 위치)
+            codes = np.frombuffer(corpus.encode('utf-32-le'), dtype=np.uint32)
+            is_word = lambda c: ((c >= 48) & (c <= 57)) | ((c >= 65) & (c <= 90)) | ((c >= 97) & (c <= 122))
+            before = np.where(starts > doc_starts, codes[np.maximum(starts - 1, 0)], 0)
+            after = np.where(valid & (ends < doc_ends), codes[np.minimum(ends, len(codes) - 1)], 0)
+            valid &= ~(check_start & is_word(before)) & ~(check_end & is_word(after))
+
+        # 키워드 번호, 시작 위치 순으로 정렬한 뒤 키워드별로 나눔
+        order = np.flatnonzero(valid)
+        order = order[np.lexsort((starts[order], text_ids[order]))]
+        splits = np.searchsorted(text_ids[order], np.arange(1, len(self._texts)))
+
+        results = []
+        for text_id, selected in enumerate(np.split(order, splits)):
+            if non_overlapping and self._border[text_id] and len(selected) > 1:
+                # 자기 자신과 겹칠 수 있는 키워드만 순서대로 골라냄 (나머지는 일치끼리 겹칠 수 없음)
+                keep, last_end = [], -1
+                for index in selected.tolist():
+                    keep.append(starts[index] >= last_end)
+                    if keep[-1]:
+                        last_end = ends[index]
+                selected = selected[np.array(keep, dtype=bool)]
+            results.append(docs[selected])
+        return results
+
+    def hits(self, texts):
+        """문서별 키워드 포함 여부 (문서 수, 키워드 수) bool 배열"""
+        result = np.zeros((len(texts), len(self.keywords)), dtype=bool)
+        for text_id, docs in enumerate(self._matches(texts, non_overlapping=False)):
+            for column in self._columns[text_id]:
+                result[docs, column] = True
+        return result
+
+    def _has_match(self, text):
+        """문서 하나에 조건을 만족하는 일치가 있는지. 첫 일치에서 멈춥니다."""
+        matches = self._automaton.iter(text)
+        if not self.word_boundary:
+            return next(matches, None) is not None
+        for last, text_id in matches:
+            first = last - self._lengths[text_id] + 1
+            if self._check_start[text_id] and first > 0 and _is_word(text[first - 1]):
+                continue
+            if self._check_end[text_id] and last + 1 < len(text) and _is_word(text[last + 1]):
+                continue
+            return True
+        return False
+
+    def any(self, texts):
+        """
+        문서별로 키워드가 하나라도 있는지 (bool 배열).
+        오토마톤이 있으면 문서마다 첫 일치에서 멈추므로 hits() 보다 빠릅니다.
+        """
+        if self._automaton is None:
+            return self.hits(texts).any(axis=1)
+        corpus, bounds = self._corpus(texts)
+        bounds = bounds.tolist()
+        # 말뭉치 전체에 iter(corpus, start, end) 를 쓰면 pyahocorasick 이 호출마다 말뭉치 전체를 UCS-4 로 복사하므로
+        # (한글처럼 UCS-2 문자열일 때) 문서 수의 제곱에 비례해 느려짐. 문서별로 잘라서 검사
+        return np.fromiter(
+            (self._has_match(corpus[bounds[i]:bounds[i + 1]]) for i in range(len(bounds) - 1)),
+            dtype=bool, count=len(bounds) - 1)
+
+    def counts(self, texts):
+        """
+        문서별 키워드 등장 횟수 (문서 수, 키워드 수) 정수 배열.
+        키워드마다 겹치지 않게 센 값으로, word_boundary=False 이면 str.count(kw) 와 같습니다.
+        """
+        result = np.zeros((len(texts), len(self.keywords)), dtype=np.int64)
+        for text_id, docs in enumerate(self._matches(texts, non_overlapping=True)):
+            for column in self._columns[text_id]:
+                result[:, column] = np.bincount(docs, minlength=len(texts))
+        return result
@@ -0,0 +1,178 @@
+"""
+공저 네트워크 그림용 힘 기반(force-directed) 배치와 위치 캐시입니다.
+
+nx.spring_layout(Fruchterman-Reingold)과 같은 방식으로 움직이지만, 반발력은 cKDTree 로 찾은 가까운 노드
+(거리 cutoff 이내, 최대 REPULSION_NEIGHBORS 개)끼리만, 인력은 희소 엣지 목록으로만 계산하므로
+한 번 반복하는 비용이 O(n²) 이 아니라 노드/엣지 수에 비례합니다. (Fruchterman-Reingold 논문의 격자 방식과 같은 근사) 결과 위치는 그래프 내용(노드, 엣지 가중치)과 설정의 해시를 키로
+.kci_cache/layouts/ 에 저장되어, 같은 그래프를 다시 그릴 때는 계산하지 않습니다.
+
+init 에 이전 배치(예: 앞 시기 네트워크)를 넘기면 같은 저자는 그 위치에서 시작해 낮은 온도로 조금만 움직이고,
+새 저자는 이미 배치된 공저자들의 평균 위치 근처에서 시작하므로 시기별 그림에서 같은 저자가 비슷한 자리에 놓입니다.
+
+    from kci_layout import layout_network
+    pos_early = layout_network(network_early)
+    pos_late = layout_network(network_late, init=pos_early)
+    nx.draw_networkx(G_late, pos=pos_late)
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+from kci_dataset import DATASET_CACHE_DIR
+
+LAYOUT_CACHE_DIR = os.environ.get('KCI_LAYOUT_CACHE', os.path.join(DATASET_CACHE_DIR, 'layouts'))
+LAYOUT_ITERATIONS = 100
+# 반발력을 계산할 최대 거리 (최적 거리 k 의 배수)
+REPULSION_CUTOFF = 3.0
+# 한 노드를 미는 가까운 노드 최대 수 (노드가 몰려 있어도 반복 비용이 노드 수에 비례하도록)
+REPULSION_NEIGHBORS = 16
+# 새로 배치하는 노드 / 이전 배치에 있던 노드의 시작 온도 (한 번에 움직일 수 있는 최대 거리)
+INITIAL_TEMPERATURE = 0.1
+WARM_TEMPERATURE = 0.005
+
+
+def _repulsion(pos, k, cutoff):
+    """cutoff 이내 가까운 노드들이 각 노드를 미는 힘의 합 (nx 와 같이 k² / 거리)"""
+    n = len(pos)
+    count = min(REPULSION_NEIGHBORS + 1, n)
+    distances, neighbors = cKDTree(pos).query(pos, k=count, distance_upper_bound=cutoff)
+    # 자기 자신과 cutoff 밖(인덱스 n)은 제외
+    valid = (neighbors < n) & (neighbors != np.arange(n)[:, None])
+    i = np.broadcast_to(np.arange(n)[:, None], neighbors.shape)[valid]
+    j = neighbors[valid]
+    displacement = np.zeros_like(pos)
+    if len(i) == 0:
+        return displacement
+    delta = pos[i] - pos[j]
+    distance = np.clip(distances[valid], 0.01, None)
+    force = delta * (k * k / distance ** 2)[:, None]
+    for axis in range(pos.shape[1]):
+        displacement[:, axis] = np.bincount(i, force[:, axis], n)
+    return displacement
+
+def _attraction(pos, rows, cols, weights, k):
+    """엣지 양 끝 노드를 당기는 힘의 합 (nx 와 같이 가중치 × 거리² / k)"""
+    displacement = np.zeros_like(pos)
+    if len(rows) == 0:
+        return displacement
+    delta = pos[rows] - pos[cols]
+    distance = np.clip(np.sqrt((delta ** 2).sum(axis=1)), 0.01, None)
+    force = delta * (weights * distance / k)[:, None]
+    n = len(pos)
+    for axis in range(pos.shape[1]):
+        displacement[:, axis] += np.bincount(cols, force[:, axis], n) - np.bincount(rows, force[:, axis], n)
+    return displacement
+
+def force_layout(adjacency, pos, k=None, iterations=LAYOUT_ITERATIONS, temperature=INITIAL_TEMPERATURE,
+                 cutoff=REPULSION_CUTOFF, threshold=1e-4):
+    """
+    희소 인접 행렬(대칭, 가중치)과 시작 위치(n × 2, [0, 1] 영역)로 Fruchterman-Reingold 배치를 계산합니다.
+    nx.spring_layout 처럼 매 반복 각 노드를 합력 방향으로 온도만큼 옮기고 온도를 선형으로 낮춥니다.
+    temperature 에 노드별 배열을 주면 노드마다 다른 온도를 사용합니다. (이미 배치된 노드는 조금만 움직이게)
+    """
+    pos = np.array(pos, dtype=float)
+    n = len(pos)
+    if n <= 1:
+        return pos
+    k = np.sqrt(1.0 / n) if k is None else k
+    upper = sparse.triu(adjacency, k=1).tocoo()
+    rows, cols, weights = upper.row, upper.col, upper.data.astype(float)
+
+    temperature = np.broadcast_to(np.asarray(temperature, dtype=float), (n,)).copy()
+    dt = temperature / (iterations + 1)
+    for _ in range(iterations):
+        displacement = _repulsion(pos, k, cutoff * k) + _attraction(pos, rows, cols, weights, k)
+        length = np.clip(np.sqrt((displacement ** 2).sum(axis=1)), 0.01, None)
+        delta_pos = displacement * (temperature / length)[:, None]
+        pos += delta_pos
+        temperature -= dt
+        if np.linalg.norm(delta_pos) / n < threshold:
+            break
+    return pos
+
+
+def _graph_key(names, adjacency, init, options):
+    """노드 이름, 엣지 가중치, 시작 위치, 설정으로 만든 캐시 키"""
+    upper = sparse.triu(adjacency, k=1).tocoo()
+    edges = sorted(
+        (min(names[a], names[b]), max(names[a], names[b]), int(w))
+        for a, b, w in zip(upper.row, upper.col, upper.data)
+    )
+    start = {name: [round(float(v), 6) for v in init[name]] for name in names if name in init} if init else {}
+    payload = json.dumps([sorted(names), edges, sorted(start.items()), options], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def _initial_positions(names, adjacency, init, rng):
+    """
+    [0, 1] 영역의 시작 위치. init 에 있는 노드는 그 위치에서, 없는 노드는 이미 배치된 이웃의 평균 위치 근처에서,
+    이웃도 없으면 배치된 노드들이 차지한 영역 안의 무작위 위치에서 시작합니다.
+    """
+    pos = rng.random((len(names), 2))
+    placed = np.array([name in init for name in names], dtype=bool) if init else np.zeros(len(names), dtype=bool)
+    if not placed.any():
+        return pos, placed
+    for position, name in enumerate(names):
+        if placed[position]:
+            pos[position] = (np.asarray(init[name], dtype=float) + 1) / 2
+    low, high = pos[placed].min(axis=0), pos[placed].max(axis=0)
+    pos[~placed] = low + pos[~placed] * np.maximum(high - low, 1e-3)
+    neighbors = adjacency.tocsr()
+    for position in np.flatnonzero(~placed):
+        around = [p for p in neighbors.indices[neighbors.indptr[position]:neighbors.indptr[position + 1]] if placed[p]]
+        if around:
+            pos[position] = pos[around].mean(axis=0) + rng.normal(scale=0.01, size=2)
+    return pos, placed
+
+def layout_graph(names, adjacency, init=None, k=None, iterations=LAYOUT_ITERATIONS, seed=42,
+                 cache_dir=LAYOUT_CACHE_DIR):
+    """
+    노드 이름 목록과 희소 인접 행렬(노드 순서와 같은 n × n)로 {이름: (x, y)} 배치를 돌려줍니다.
+    위치는 [-1, 1] 영역 좌표이며, init 은 이전에 이 함수가 돌려준 배치입니다. cache_dir=None 이면 캐시를 쓰지 않습니다.
+    """
+    names = list(names)
+    options = {'k': k, 'iterations': iterations, 'seed': seed, 'cutoff': REPULSION_CUTOFF, 'neighbors': REPULSION_NEIGHBORS,
+               'temperature': [INITIAL_TEMPERATURE, WARM_TEMPERATURE]}
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, f'{_graph_key(names, adjacency, init, options)[:20]}.json')
+        if os.path.exists(cache_path):
+            with open(cache_path, encoding='utf-8') as f:
+                return {name: np.array(xy) for name, xy in json.load(f).items()}
+
+    pos, placed = _initial_positions(names, adjacency, init, np.random.default_rng(seed))
+    # 이전 배치에 있던 노드는 낮은 온도로 조금만, 새 노드는 처음 배치할 때처럼 움직임
+    pos = force_layout(adjacency, pos, k=k, iterations=iterations,
+                       temperature=np.where(placed, WARM_TEMPERATURE, INITIAL_TEMPERATURE))
+    # nx.spring_layout 과 비슷한 [-1, 1] 영역 (데이터와 관계없는 고정 변환이므로 시기별 좌표계가 같음)
+    layout = {name: xy * 2 - 1 for name, xy in zip(names, pos)}
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({name: xy.tolist() for name, xy in layout.items()}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    return layout
+
+def layout_network(network, init=None, **options):
+    """kci_coauthor.CoauthorNetwork 의 배치 ({저자 이름: (x, y)}, nx.draw 의 pos 로 사용)"""
+    nodes = network.nodes
+    adjacency = network.weights[nodes][:, nodes]
+    return layout_graph([network.names[a] for a in nodes], adjacency, init=init, **options)
+
+def layout_periods(networks, **options):
+    """
+    시기 순서대로 앞 시기들의 배치에서 이어서 배치한 목록을 돌려줍니다.
+    바로 앞 시기에 없던 저자도 그 전에 배치된 적이 있으면 마지막 위치에서 시작합니다.
+    """
+    layouts, known = [], {}
+    for network in networks:
+        layout = layout_network(network, init=dict(known) or None, **options)
+        known.update(layout)
+        layouts.append(layout)
+    return layouts
@@ -0,0 +1,234 @@
+"""
+스크래퍼 계측: 논문/검색 결과 페이지의 단계별 소요 시간(span)과 카운터를 모아 요약하고 내보냅니다.
+
+- 단계마다 걸린 시간과 카운터 증가를 발생 즉시 JSON lines 파일에 한 줄씩 추가합니다.
+  (수집 실행마다 run ID 가 붙으므로 여러 실행/샤드 프로세스가 같은 파일에 기록해도 구분됩니다)
+- 수집이 끝나면 단계별 횟수, 평균, p50/p95, 최대 시간과 지연 시간 히스토그램을 요약하고,
+  원하면 Prometheus 텍스트 형식(node_exporter textfile collector 등)으로도 저장합니다.
+- 저장한 JSON lines 파일은 나중에 다시 읽어 요약할 수 있습니다.
+    python kci_metrics.py kci_metrics.jsonl --last
+    python kci_metrics.py kci_metrics.jsonl --prometheus kci_metrics.prom
+"""
+
+import argparse
+import bisect
+import contextlib
+import json
+import os
+import re
+import time
+from collections import defaultdict
+
+METRICS_PATH = 'kci_metrics.jsonl'
+# 히스토그램 구간 상한 (초)
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROMETHEUS_PREFIX = 'kci_crawl'
+
+
+def percentile(sorted_values, q):
+    """정렬된 값 목록의 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class CrawlMetrics:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.timings = defaultdict(list)  # 단계 이름 → 소요 시간(초) 목록
+        self.counters = defaultdict(int)  # (카운터 이름, 레이블) → 값
+        self.run_id = None
+        self.path = None
+        self._file = None
+
+    def open(self, path=METRICS_PATH, **run_fields):
+        """
+        새 수집 실행을 시작합니다. 이전 집계를 비우고, path 가 있으면 이벤트를 JSON lines 로 추가 기록합니다.
+        run_fields(검색어, 동시 처리 수 등)는 시작 이벤트에 함께 기록됩니다.
+        """
+        self.close_file()
+        self.timings.clear()
+        self.counters.clear()
+        self.run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self.path = path or None
+        if self.path:
+            self._file = open(self.path, 'a', encoding='utf-8', buffering=1)  # 줄 단위로 바로 기록
+        self._emit('run_start', **run_fields)
+
+    def close(self, prometheus_path=None):
+        """요약 이벤트를 기록하고 파일을 닫습니다. prometheus_path 를 주면 Prometheus 텍스트 형식으로도 저장합니다."""
+        self._emit('run_end', spans=self.summary(), counters=self.counter_values())
+        self.close_file()
+        if prometheus_path:
+            self.write_prometheus(prometheus_path)
+
+    def close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close_file()
+
+    def _emit(self, event, **fields):
+        if self._file is None:
+            return
+        record = {'ts': round(time.time(), 3), 'run': self.run_id, 'event': event, **fields}
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    # --- 기록 ---
+
+    def observe(self, name, seconds, **fields):
+        """단계 name 에 걸린 시간을 기록합니다. fields(논문ID 등)는 JSON lines 이벤트에만 남습니다."""
+        self.timings[name].append(seconds)
+        self._emit('span', name=name, seconds=round(seconds, 6), **fields)
+
+    @contextlib.contextmanager
+    def span(self, name, **fields):
+        """
+        with 블록의 실행 시간을 name 으로 기록합니다. 블록 안에서 돌려받은 사전에 값을 넣으면 이벤트에 함께 남고,
+        예외로 빠져나가면 예외 이름이 error 로 기록됩니다.
+        """
+        fields = dict(fields)
+        started = time.perf_counter()
+        try:
+            yield fields
+        except BaseException as e:
+            fields['error'] = type(e).__name__
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started, **fields)
+
+    def incr(self, name, value=1, **labels):
+        """카운터 name 을 늘립니다. labels 별로 따로 집계됩니다."""
+        self.counters[(name, tuple(sorted(labels.items())))] += value
+        self._emit('counter', name=name, value=value, **labels)
+
+    # --- 집계 ---
+
+    def histogram(self, name):
+        """LATENCY_BUCKETS 구간별 누적 개수 (마지막은 전체 개수, Prometheus 의 le="+Inf")"""
+        values = sorted(self.timings.get(name, []))
+        return [bisect.bisect_right(values, upper) for upper in self.buckets] + [len(values)]
+
+    def summary(self):
+        """{단계 이름: {count, sum, mean, p50, p95, max, buckets}}"""
+        result = {}
+        for name, values in self.timings.items():
+            if not values:
+                continue
+            ordered = sorted(values)
+            result[name] = {
+                'count': len(ordered),
+                'sum': round(sum(ordered), 6),
+                'mean': round(sum(ordered) / len(ordered), 6),
+                'p50': round(percentile(ordered, 0.5), 6),
+                'p95': round(percentile(ordered, 0.95), 6),
+                'max': round(ordered[-1], 6),
+                'buckets': self.histogram(name),
+            }
+        return result
+
+    def counter_values(self):
+        """[{name, value, 레이블...}]"""
+        return [{'name': name, 'value': value, **dict(labels)} for (name, labels), value in sorted(self.counters.items())]
+
+    def print_summary(self):
+        print("\n⏱️ 단계별 소요 시간 요약 (횟수, 평균 / p50 / p95 / 최대, 초)")
+        for name, s in sorted(self.summary().items()):
+            print(f"   - {name}: {s['count']}회, {s['mean']:.2f} / {s['p50']:.2f} / {s['p95']:.2f} / {s['max']:.2f}")
+        if self.counters:
+            print("📊 카운터")
+            for counter in self.counter_values():
+                labels = ', '.join(f'{k}={v}' for k, v in counter.items() if k not in ('name', 'value'))
+                print(f"   - {counter['name']}{f' ({labels})' if labels else ''}: {counter['value']}")
+        if self.path:
+            print(f"📈 계측 기록: {self.path} (run {self.run_id})")
+
+    # --- 내보내기 ---
+
+    def prometheus_text(self, prefix=PROMETHEUS_PREFIX):
+        """단계별 시간은 히스토그램 하나(레이블 span), 카운터는 이름별 counter 로 내보냅니다."""
+        def metric_name(name):
+            return re.sub(r'[^a-zA-Z0-9_]', '_', f'{prefix}_{name}')
+
+        def label_text(labels):
+            def escape(value):
+                return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            return '{' + ','.join(f'{k}="{escape(v)}"' for k, v in labels) + '}' if labels else ''
+
+        lines = []
+        histogram = metric_name('span_seconds')
+        if self.timings:
+            lines += [f'# HELP {histogram} 스크래퍼 단계별 소요 시간', f'# TYPE {histogram} histogram']
+        for name, values in sorted(self.timings.items()):
+            for upper, count in zip(self.buckets + ('+Inf',), self.histogram(name)):
+                lines.append(f'{histogram}_bucket{label_text([("span", name), ("le", upper)])} {count}')
+            lines.append(f'{histogram}_sum{label_text([("span", name)])} {sum(values):.6f}')
+            lines.append(f'{histogram}_count{label_text([("span", name)])} {len(values)}')
+
+        typed = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            counter = metric_name(f'{name}_total')
+            if counter not in typed:
+                lines.append(f'# TYPE {counter} counter')
+                typed.add(counter)
+            lines.append(f'{counter}{label_text(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        # 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+        print(f"📈 Prometheus 형식 저장: {path}")
+
+
+def load_metrics(path=METRICS_PATH, run_ids=None):
+    """
+    JSON lines 파일의 span/counter 이벤트를 다시 집계합니다. run_ids 를 주면 해당 실행만 모읍니다.
+    반환값: (CrawlMetrics, 파일에 기록된 run ID 목록 (기록 순서))
+    """
+    metrics = CrawlMetrics()
+    runs = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record['event'] == 'run_start':
+                runs.append(record['run'])
+            if run_ids is not None and record['run'] not in run_ids:
+                continue
+            if record['event'] == 'span':
+                metrics.timings[record['name']].append(record['seconds'])
+            elif record['event'] == 'counter':
+                labels = {k: v for k, v in record.items() if k not in ('ts', 'run', 'event', 'name', 'value')}
+                metrics.counters[(record['name'], tuple(sorted(labels.items())))] += record['value']
+    return metrics, runs
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='스크래퍼 계측 기록(JSON lines) 요약')
+    parser.add_argument('path', nargs='?', default=os.environ.get('KCI_METRICS') or METRICS_PATH)
+    parser.add_argument('--run', action='append', help='요약할 run ID (여러 번 지정 가능, 기본: 전체)')
+    parser.add_argument('--last', action='store_true', help='마지막 실행만 요약')
+    parser.add_argument('--prometheus', help='Prometheus 텍스트 형식으로 저장할 경로')
+    args = parser.parse_args()
+
+    run_ids = set(args.run) if args.run else None
+    if args.last:
+        _, runs = load_metrics(args.path, run_ids=set())
+        run_ids = set(runs[-1:])
+    metrics, runs = load_metrics(args.path, run_ids)
+    print(f"📂 {args.path}: 실행 {len(runs)}회 중 {len(run_ids) if run_ids is not None else len(runs)}회 요약")
+    metrics.print_summary()
+    if args.prometheus:
+        metrics.write_prometheus(args.prometheus)
@@ -0,0 +1,158 @@
+"""
+스크래핑 결과를 추출되는 대로 파일에 이어 쓰는 스트리밍 저장기입니다.
+
+- 레코드를 batch_size 건씩 모아 CSV에 추가하고 바로 flush 하므로, 수집 도중에도 파일을 tail 할 수 있습니다.
+- parquet_path 를 지정하면 같은 배치를 타입이 지정된 Parquet 파일(pyarrow 필요)에도 기록합니다.
+- 전체 결과를 메모리(DataFrame)에 쌓지 않으므로 수집량과 무관하게 메모리 사용량이 일정합니다.
+- append=True 이면 이전 실행의 결과 파일 뒤에 이어 쓰며, 이전 실행이 기록한 논문ID 는 다시 쓰지 않습니다. (이어서 수집할 때)
+"""
+
+import csv
+import os
+import re
+
+OUTPUT_CSV_PATH = 'kci_articles_all_fields_with_details.csv'
+
+FINAL_COLUMNS = [
+    '제목', '저자_상세', '초록', '키워드_상세', '저자',
+    '저널명', '발행기관', '권', '호', '시작페이지', '종료페이지',
+    '발행년도', '주제분야', '인용횟수', '논문ID'
+]
+# Parquet에서 정수형으로 저장할 컬럼 (변환할 수 없는 값은 null)
+INT_COLUMNS = ['시작페이지', '종료페이지', '발행년도', '인용횟수']
+# 이어 쓰기 전에 CSV 레코드 경계를 찾을 때 보는 바이트 (따옴표, 줄바꿈)
+_RECORD_DELIMITERS = re.compile(rb'["\n]')
+
+
+def to_int_or_none(value):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+def parquet_schema():
+    import pyarrow as pa
+    return pa.schema([
+        (column, pa.int32() if column in INT_COLUMNS else pa.string()) for column in FINAL_COLUMNS
+    ])
+
+
+def trim_partial_record(path):
+    """
+    기록 도중 중단되어 끝나지 않은 마지막 CSV 레코드를 잘라 냅니다. (이어 쓸 행이 깨지지 않도록)
+    초록처럼 따옴표 안에 줄바꿈이 들어간 필드가 있으므로, 따옴표 밖의 줄바꿈만 레코드 끝으로 봅니다.
+    """
+    record_end = 0
+    in_quotes = False
+    offset = 0
+    with open(path, 'rb+') as f:
+        while True:
+            block = f.read(64 * 1024)
+            if not block:
+                break
+            # UTF-8 의 여러 바이트 문자에는 '"' 나 '\n' 바이트가 들어가지 않으므로 바이트 단위로 봐도 됨
+            for match in _RECORD_DELIMITERS.finditer(block):
+                if match.group() == b'"':
+                    in_quotes = not in_quotes  # 이스케이프된 "" 는 두 번 뒤집혀 제자리
+                elif not in_quotes:
+                    record_end = offset + match.end()
+            offset += len(block)
+        if record_end < offset:
+            f.truncate(record_end)
+
+
+class StreamingArticleWriter:
+    def __init__(self, csv_path=OUTPUT_CSV_PATH, parquet_path=None, batch_size=50, append=False):
+        """
+        append=True 이고 결과 CSV 가 이미 있으면 머리글 없이 이어 쓰고, 파일에 있던 논문ID 는 다시 기록하지 않습니다.
+        Parquet 은 이어 쓸 수 없으므로 기존 CSV 의 행을 먼저 옮겨 적어 두 파일의 내용을 같게 유지합니다.
+        """
+        self.csv_path = csv_path
+        self.parquet_path = parquet_path
+        self.batch_size = batch_size
+        self.count = 0      # 이번 실행에서 기록한 행 수
+        self.existing = 0   # 이어 쓰기 전에 파일에 있던 행 수
+        self.existing_ids = set()
+        self._buffer = []
+
+        self._parquet_writer = None
+        if parquet_path:
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Parquet 저장에는 pyarrow가 필요합니다: pip install pyarrow")
+            self._parquet_writer = pq.ParquetWriter(parquet_path, parquet_schema())
+
+        if append and os.path.exists(csv_path):
+            trim_partial_record(csv_path)
+        resume = append and os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
+        if resume:
+            self._load_existing()
+
+        # BOM은 파일 처음에 한 번만 기록 (엑셀에서 한글이 깨지지 않도록 utf-8-sig 사용, 이어 쓸 때는 기록되지 않음)
+        self._csv_file = open(csv_path, 'a' if resume else 'w', encoding='utf-8-sig', newline='')
+        self._csv_writer = csv.DictWriter(
+            self._csv_file, fieldnames=FINAL_COLUMNS, extrasaction='ignore', lineterminator=os.linesep)
+        if not resume:
+            self._csv_writer.writeheader()
+            self._csv_file.flush()
+
+    def _load_existing(self):
+        """기존 CSV 의 논문ID 를 모으고, Parquet 을 함께 쓰면 기존 행을 옮겨 적습니다."""
+        batch = []
+        with open(self.csv_path, encoding='utf-8-sig', newline='') as f:
+            for record in csv.DictReader(f):
+                self.existing += 1
+                if record.get('논문ID'):
+                    self.existing_ids.add(record['논문ID'])
+                if self._parquet_writer is not None:
+                    batch.append(record)
+                    if len(batch) >= 1000:
+                        self._write_parquet(batch)
+                        batch = []
+        if batch:
+            self._write_parquet(batch)
+
+    def write(self, record):
+        # 이어서 수집하면 완료된 논문도 검색 결과 순서대로 다시 전달되므로 이전 실행이 기록한 논문은 건너뜀
+        if record.get('논문ID') in self.existing_ids:
+            return
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def _write_parquet(self, batch):
+        import pyarrow as pa
+        columns = {
+            column: [
+                to_int_or_none(r.get(column)) if column in INT_COLUMNS else (r.get(column) or '')
+                for r in batch
+            ]
+            for column in FINAL_COLUMNS
+        }
+        self._parquet_writer.write_table(pa.Table.from_pydict(columns, schema=parquet_schema()))
+
+    def flush(self):
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+
+        self._csv_writer.writerows(batch)
+        self._csv_file.flush()
+
+        if self._parquet_writer is not None:
+            self._write_parquet(batch)
+
+        self.count += len(batch)
+
+    def close(self):
+        self.flush()
+        self._csv_file.close()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,165 @@
+"""
+수집한 검색 결과/상세 페이지 HTML을 보관하는 로컬 디스크 캐시입니다.
+
+- 본문은 내용의 sha256 해시로 저장(content-addressed)하고 gzip으로 압축합니다. 같은 HTML은 한 번만 저장됩니다.
+- index.sqlite 에 URL(캐시 키) → 해시, 종류(search/detail), 논문ID, 수집 시각을 기록합니다.
+- TTL이 지난 항목은 조회되지 않으며, 전체 크기가 max_bytes 를 넘으면 오래 사용하지 않은 항목부터 지웁니다.
+- 캐시된 페이지만으로 추출을 다시 실행(replay)할 수 있어 파싱 규칙을 바꿀 때 재수집이 필요 없고,
+  오프라인 테스트 데이터로도 사용할 수 있습니다.
+"""
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import time
+
+PAGE_CACHE_DIR = '.kci_page_cache'
+PAGE_CACHE_TTL_SECONDS = 30 * 24 * 3600   # 30일
+PAGE_CACHE_MAX_BYTES = 2 * 1024 ** 3      # 압축 후 2GB
+# 이보다 최근에 쓴 본문 파일은 색인 행이 없어도 지우지 않음 (다른 프로세스가 put() 하는 중일 수 있음)
+ORPHAN_GRACE_SECONDS = 3600
+
+KIND_SEARCH = 'search'
+KIND_DETAIL = 'detail'
+
+
+class PageCache:
+    def __init__(self, cache_dir=PAGE_CACHE_DIR, ttl_seconds=PAGE_CACHE_TTL_SECONDS, max_bytes=PAGE_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(cache_dir, 'objects'), exist_ok=True)
+
+        # 샤드별 프로세스가 같은 캐시를 함께 쓸 수 있도록 잠금 대기 시간을 넉넉히 둠
+        self.conn = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite'), timeout=60)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                article_id TEXT,
+                seq INTEGER,               -- 검색 결과 페이지 번호 등 재생 순서
+                content_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,     -- 압축된 크기 (bytes)
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute('CREATE INDEX IF NOT EXISTS pages_kind ON pages (kind, seq)')
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _object_path(self, content_hash):
+        return os.path.join(self.cache_dir, 'objects', content_hash[:2], f'{content_hash}.html.gz')
+
+    def put(self, url, html, kind, article_id=None, seq=None):
+        """HTML을 저장하고 url 키에 연결합니다. 같은 내용이 이미 있으면 본문은 다시 쓰지 않습니다."""
+        data = html.encode('utf-8') if isinstance(html, str) else html
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._object_path(content_hash)
+        try:
+            # 이미 있는 본문은 수정 시각만 갱신해 색인 행을 기록하기 전에 evict() 가 지우지 않게 함
+            os.utime(path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO pages (url, kind, article_id, seq, content_hash, size, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (url, kind, article_id, seq, content_hash, os.path.getsize(path), now, now))
+
+    def _read(self, content_hash):
+        try:
+            with gzip.open(self._object_path(content_hash), 'rb') as f:
+                return f.read().decode('utf-8')
+        except FileNotFoundError:
+            return None
+
+    def _is_fresh(self, fetched_at):
+        return self.ttl_seconds is None or time.time() - fetched_at <= self.ttl_seconds
+
+    def get(self, url, touch=True):
+        """
+        TTL 안의 캐시 HTML을 반환합니다. 없거나 만료되었으면 None.
+        touch=False 이면 최근 사용 시각을 갱신하지 않습니다. (대량 재생 시 쓰기 비용 절약)
+        """
+        row = self.conn.execute('SELECT content_hash, fetched_at FROM pages WHERE url = ?', (url,)).fetchone()
+        if row is None or not self._is_fresh(row[1]):
+            return None
+        if touch:
+            with self.conn:
+                self.conn.execute('UPDATE pages SET accessed_at = ? WHERE url = ?', (time.time(), url))
+        return self._read(row[0])
+
+    def iter_pages(self, kind, url_prefix=''):
+        """종류별 캐시 페이지를 (url, 논문ID, html) 형태로 재생 순서대로 돌려줍니다. 만료 항목은 제외합니다."""
+        rows = self.conn.execute("""
+            SELECT url, article_id, content_hash, fetched_at FROM pages
+            WHERE kind = ? AND url LIKE ? ESCAPE '\\'
+            ORDER BY seq, fetched_at
+        """, (kind, url_prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')).fetchall()
+        for url, article_id, content_hash, fetched_at in rows:
+            if self._is_fresh(fetched_at):
+                html = self._read(content_hash)
+                if html is not None:
+                    yield url, article_id, html
+
+    def total_bytes(self):
+        row = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT content_hash, size FROM pages)')
+        return row.fetchone()[0]
+
+    def evict(self):
+        """
+        만료된 항목을 지우고, 전체 크기가 max_bytes 이하가 될 때까지 오래 사용하지 않은 항목부터 지웁니다.
+        더 이상 어떤 URL도 가리키지 않는 본문 파일은 디스크에서 삭제합니다. 삭제한 URL 수를 반환합니다.
+        샤드 프로세스들이 같은 캐시를 쓰므로, ORPHAN_GRACE_SECONDS 안에 쓴 본문과 임시 파일(.tmp)은
+        색인 행이 아직 없어도 남겨 둡니다. (그보다 오래된 임시 파일은 중단된 프로세스가 남긴 것이므로 삭제)
+        """
+        removed = 0
+        with self.conn:
+            if self.ttl_seconds is not None:
+                removed += self.conn.execute(
+                    'DELETE FROM pages WHERE fetched_at < ?', (time.time() - self.ttl_seconds,)).rowcount
+
+            total = self.total_bytes()
+            if self.max_bytes is not None and total > self.max_bytes:
+                for url, content_hash, size in self.conn.execute(
+                        'SELECT url, content_hash, size FROM pages ORDER BY accessed_at').fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    self.conn.execute('DELETE FROM pages WHERE url = ?', (url,))
+                    removed += 1
+                    # 같은 본문을 가리키는 다른 URL이 없을 때만 실제로 공간이 줄어듦
+                    still_used = self.conn.execute(
+                        'SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1', (content_hash,)).fetchone()
+                    if still_used is None:
+                        total -= size
+
+        referenced = {h for (h,) in self.conn.execute('SELECT DISTINCT content_hash FROM pages')}
+        objects_dir = os.path.join(self.cache_dir, 'objects')
+        cutoff = time.time() - ORPHAN_GRACE_SECONDS
+        for sub_dir in os.listdir(objects_dir):
+            for name in os.listdir(os.path.join(objects_dir, sub_dir)):
+                if not name.endswith('.tmp') and name.split('.')[0] in referenced:
+                    continue
+                path = os.path.join(objects_dir, sub_dir, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                except FileNotFoundError:
+                    pass
+        return removed
@@ -0,0 +1,374 @@
+"""
+수집부터 그림까지의 분석 과정을 단계(DAG)로 묶어, 바뀐 단계만 다시 실행하는 파이프라인입니다.
+
+    scrape → articles → tokens / author_index / search_index → 지표(metrics, trends, 공저 네트워크 …) → 그림(fig_*)
+
+각 단계의 결과는 .kci_cache/pipeline/ 에 pickle 로 저장되며, 단계 키는 단계 함수 코드, 설정값(키워드 목록 등),
+입력 단계 결과의 내용 해시로 만듭니다. 다시 실행하면 키가 바뀐 단계만 계산하고, 다시 계산한 결과가 예전과
+같으면 그 아래 단계는 건너뜁니다. 수집 단계는 결과 CSV 의 내용 해시를 키로 사용합니다.
+서로 의존하지 않는 단계는 여러 프로세스에서 동시에 실행합니다.
+
+예를 들어 kci_keywords.TARGET_KEYWORDS 를 고치면 trends 단계와 키워드 트렌드 그림만 다시 계산하고,
+수집이나 저자 사전, 공저 네트워크는 저장된 결과를 그대로 사용합니다.
+
+    python kci_pipeline.py                        # 기존 CSV 로 분석 + 그림
+    python kci_pipeline.py --scrape --years 2015-2024
+    python kci_pipeline.py trends --force tokens  # tokens 부터 trends 까지 다시 계산
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import kci_report
+from analyze_kci import AI_XR_KEYWORDS
+from kci_authors import build_author_index
+from kci_coauthor import CoauthorTimeline
+from kci_dataset import DATASET_CACHE_DIR, DATASET_CSV_PATH, csv_fingerprint, load_articles
+from kci_keywords import TARGET_KEYWORDS, TECH_KEYWORDS
+from kci_search_index import ArticleIndex, open_index
+from kci_tokenize import tokenize_articles
+
+PIPELINE_CACHE_DIR = os.path.join(DATASET_CACHE_DIR, 'pipeline')
+PIPELINE_WORKERS = int(os.environ.get('KCI_PIPELINE_WORKERS', '0')) or None
+# 단계 함수가 부르는 모듈의 계산 방식이 바뀌어 저장된 결과를 모두 버려야 할 때 올림
+PIPELINE_VERSION = 1
+
+# func(*입력 단계 결과, **params). fingerprint 가 있으면 항상 (주 프로세스에서) 실행하는 원천 단계이며,
+# 키는 fingerprint(결과) 로 만듭니다. (예: 수집 결과 CSV 의 내용 해시)
+Stage = namedtuple('Stage', ['name', 'func', 'inputs', 'params', 'fingerprint'], defaults=((), {}, None))
+
+
+# --- 단계 함수 ---
+
+def scrape_stage(csv_path, scrape=False, query=None, years=None, step=1, workers=1, max_pages=None):
+    """scrape=True 이면 발행년도 샤드별로 수집해 csv_path 에 저장하고, 아니면 기존 CSV 를 사용합니다."""
+    if scrape:
+        import scrape_kci_details
+        from kci_sharded_crawl import run_sharded, year_shards
+
+        shards = year_shards(query or scrape_kci_details.search_query(), years[0], years[1], step)
+        run_sharded(shards, workers, max_pages or scrape_kci_details.MAX_PAGES, output_csv=csv_path)
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"'{csv_path}' 파일이 없습니다. --scrape 로 먼저 수집하세요.")
+    return csv_path
+
+def articles_stage(csv_path):
+    return load_articles(csv_path)
+
+def tokens_stage(df, columns):
+    return tokenize_articles(df, columns)
+
+def author_index_stage(df, column):
+    return build_author_index(df, column)
+
+def search_index_stage(df, path):
+    """
+    전문 검색 색인을 df 와 한 번 동기화합니다. 색인을 쓰는 단계(metrics, tech_ratio)는 이 단계 뒤에
+    동기화 없이 읽기만 하므로, 동시에 실행되어도 같은 색인 파일에 함께 쓰지 않습니다.
+    """
+    with open_index(df, path) as search_index:
+        return search_index.path
+
+def metrics_stage(df, author_index, index_path, keywords, years, periods):
+    """analyze_kci 와 같은 요약 지표 (연도별 논문 수, CAGR, 키워드 포함 논문 수, 시기별 공저 밀도)"""
+    start, end = years
+    yearly = df[df['발행년도'].between(start, end)].groupby('발행년도').size().reindex(range(start, end + 1), fill_value=0)
+    cagr_start = 2019 if start <= 2019 < end else start
+    cagr = (yearly[end] / yearly[cagr_start]) ** (1 / (end - cagr_start)) - 1 if yearly[cagr_start] > 0 else 0.0
+    with ArticleIndex(index_path) as search_index:
+        keyword_counts = search_index.year_counts(keywords, start=start, end=end)
+    timeline = CoauthorTimeline(author_index)
+    return {
+        'articles': int(yearly.sum()),
+        'yearly': {int(year): int(count) for year, count in yearly.items()},
+        'cagr': (cagr_start, end, float(cagr)),
+        'keyword_articles': {int(year): int(keyword_counts.get(year, 0)) for year in (start, end)},
+        'density': {f'{a}-{b}': timeline.window(a, b).density() for a, b in periods},
+    }
+
+def yearly_counts_stage(df):
+    return kci_report.yearly_counts_data(df)
+
+def tech_ratio_stage(df, index_path, keywords):
+    return kci_report.tech_ratio_data(df, keywords, index_path)
+
+def trends_stage(tokens, df, keywords):
+    return kci_report.keyword_trend_data(tokens, df['발행년도'], keywords)
+
+def coauthor_network_stage(author_index, top_k):
+    return kci_report.coauthor_network_data(author_index, top_k)
+
+def coauthor_periods_stage(author_index, periods):
+    return kci_report.coauthor_periods_data(author_index, [tuple(period) for period in periods])
+
+def author_types_stage(author_index):
+    return kci_report.author_type_data(author_index)
+
+def figure_stage(data, figure, out_dir):
+    file_name, render = kci_report.FIGURES[figure]
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, file_name)
+    render(data, path)
+    return path
+
+
+def build_stages(csv_path=DATASET_CSV_PATH, out_dir=kci_report.REPORT_DIR, scrape_options=None,
+                 cache_dir=PIPELINE_CACHE_DIR):
+    """
+    기본 분석 파이프라인의 단계 목록 (입력 단계가 앞에 오는 순서)
+    전문 검색 색인은 다른 스크립트의 색인과 섞이지 않도록 cache_dir 에 따로 둡니다.
+    """
+    stages = [
+        Stage('scrape', scrape_stage, params={'csv_path': csv_path, **(scrape_options or {})},
+              fingerprint=csv_fingerprint),
+        Stage('articles', articles_stage, ('scrape',)),
+        Stage('tokens', tokens_stage, ('articles',), {'columns': ['키워드_상세', '초록']}),
+        Stage('author_index', author_index_stage, ('articles',), {'column': '저자_상세'}),
+        Stage('search_index', search_index_stage, ('articles',), {'path': os.path.join(cache_dir, 'search.sqlite')}),
+        Stage('metrics', metrics_stage, ('articles', 'author_index', 'search_index'),
+              {'keywords': AI_XR_KEYWORDS, 'years': [2015, 2024], 'periods': [[2015, 2019], [2020, 2024]]}),
+        Stage('yearly_counts', yearly_counts_stage, ('articles',)),
+        Stage('tech_ratio', tech_ratio_stage, ('articles', 'search_index'), {'keywords': TECH_KEYWORDS}),
+        Stage('trends', trends_stage, ('tokens', 'articles'), {'keywords': TARGET_KEYWORDS}),
+        Stage('coauthor_network', coauthor_network_stage, ('author_index',), {'top_k': 30}),
+        Stage('coauthor_periods', coauthor_periods_stage, ('author_index',),
+              {'periods': [list(period) for period in kci_report.PERIODS]}),
+        Stage('author_types', author_types_stage, ('author_index',)),
+    ]
+    figure_inputs = {
+        'yearly_counts': 'yearly_counts',
+        'tech_ratio': 'tech_ratio',
+        'keyword_trend': 'trends',
+        'coauthor_network': 'coauthor_network',
+        'coauthor_comparison': 'coauthor_periods',
+        'author_type_histogram': 'author_types',
+    }
+    stages += [
+        Stage(f'fig_{figure}', figure_stage, (source,), {'figure': figure, 'out_dir': out_dir})
+        for figure, source in figure_inputs.items()
+    ]
+    return stages
+
+
+# --- 실행 ---
+
+def _stage_key(stage, input_hashes):
+    """단계 함수 코드, 설정값, 입력 결과 해시로 만든 키"""
+    payload = json.dumps(
+        [PIPELINE_VERSION, stage.name, inspect.getsource(stage.func), stage.params, input_hashes],
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _write_output(value, path):
+    """결과를 pickle 로 저장하고 내용 해시를 돌려줍니다."""
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return hashlib.sha256(data).hexdigest()
+
+def _read_output(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def _execute(stage, input_paths, output_path):
+    """
+    작업 프로세스에서 실행: 입력 결과를 읽어 단계를 실행하고 결과를 저장합니다.
+    (결과 해시, 결과가 가리키는 파일 경로 또는 None, 걸린 시간)
+    """
+    started = time.perf_counter()
+    inputs = [_read_output(path) for path in input_paths]
+    output = stage.func(*inputs, **stage.params)
+    # 그림처럼 파일을 만드는 단계는 그 파일이 지워지면 다시 실행하도록 경로를 기록
+    artifact = output if isinstance(output, str) and os.path.isfile(output) else None
+    return _write_output(output, output_path), artifact, time.perf_counter() - started
+
+
+class Pipeline:
+    """
+    단계 목록을 의존 관계대로 실행합니다. 단계별 마지막 실행 기록(키, 결과 해시, 결과 파일)은
+    cache_dir/manifest.json 에 저장되며, 키가 같고 결과 파일이 남아 있으면 실행하지 않습니다.
+    """
+
+    def __init__(self, stages, cache_dir=PIPELINE_CACHE_DIR):
+        self.stages = {}
+        for stage in stages:
+            missing = [name for name in stage.inputs if name not in self.stages]
+            if missing:
+                raise ValueError(f"'{stage.name}' 단계의 입력 단계가 앞에 정의되지 않았습니다: {', '.join(missing)}")
+            self.stages[stage.name] = stage
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.manifest = {}
+
+    def _save_manifest(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _output_path(self, name, key):
+        return os.path.join(self.cache_dir, f'{name}-{key[:16]}.pkl')
+
+    def _cached(self, name, key):
+        entry = self.manifest.get(name)
+        return (entry is not None and entry['key'] == key and os.path.exists(entry['path'])
+                and (entry.get('artifact') is None or os.path.exists(entry['artifact'])))
+
+    def _record(self, name, key, path, output_hash, seconds, artifact=None):
+        old = self.manifest.get(name)
+        if old and old['path'] != path and os.path.exists(old['path']):
+            os.remove(old['path'])
+        self.manifest[name] = {'key': key, 'path': path, 'hash': output_hash, 'artifact': artifact,
+                               'seconds': round(seconds, 3)}
+        self._save_manifest()
+
+    def required(self, targets=None):
+        """targets 와 그 입력 단계 전체 (정의 순서)"""
+        if not targets:
+            return list(self.stages)
+        needed, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self.stages:
+                raise KeyError(f"알 수 없는 단계: {name}")
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.stages[name].inputs)
+        return [name for name in self.stages if name in needed]
+
+    def output(self, name):
+        """저장된 단계 결과"""
+        return _read_output(self.manifest[name]['path'])
+
+    def run(self, targets=None, force=(), workers=PIPELINE_WORKERS):
+        """
+        필요한 단계를 실행하고 {단계 이름: 'cached' | 'ran'} 을 돌려줍니다.
+        force 에 있는 단계는 저장된 결과가 있어도 다시 실행합니다. (결과가 바뀌면 아래 단계도 다시 실행)
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        pending = self.required(targets)
+        force = set(force)
+        unknown = force - set(self.stages)
+        if unknown:
+            raise KeyError(f"알 수 없는 단계: {', '.join(sorted(unknown))}")
+        workers = workers or os.cpu_count() or 1
+        hashes, status, running = {}, {}, {}
+        started = time.perf_counter()
+
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=kci_report.init_worker) if workers > 1 else None
+        if executor is None:
+            kci_report.init_worker()
+        try:
+            while pending or running:
+                for name in [name for name in pending if all(i in hashes for i in self.stages[name].inputs)]:
+                    stage = self.stages[name]
+                    pending.remove(name)
+                    if stage.fingerprint is not None:
+                        # 원천 단계: 항상 실행하고 결과 내용으로 키를 만듦
+                        stage_started = time.perf_counter()
+                        output = stage.func(**stage.params)
+                        key = _stage_key(stage, [stage.fingerprint(output)])
+                        path = self._output_path(name, key)
+                        self._record(name, key, path, _write_output(output, path), time.perf_counter() - stage_started)
+                        hashes[name], status[name] = key, 'ran'
+                        print(f"📥 {name}: {output}")
+                        continue
+
+                    key = _stage_key(stage, [hashes[i] for i in stage.inputs])
+                    if name not in force and self._cached(name, key):
+                        hashes[name], status[name] = self.manifest[name]['hash'], 'cached'
+                        print(f"♻️  {name}: 저장된 결과 사용")
+                        continue
+
+                    task = (stage, [self.manifest[i]['path'] for i in stage.inputs], self._output_path(name, key))
+                    if executor is None:
+                        self._finish(name, key, task[2], _execute(*task), hashes, status)
+                    else:
+                        running[executor.submit(_execute, *task)] = (name, key, task[2])
+
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name, key, path = running.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            print(f"❌ {name} 단계 실패: {e}")
+                            raise
+                        self._finish(name, key, path, result, hashes, status)
+                elif pending and not any(all(i in hashes for i in self.stages[name].inputs) for name in pending):
+                    raise RuntimeError(f"실행할 수 없는 단계: {', '.join(pending)}")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        ran = sum(1 for value in status.values() if value == 'ran')
+        print(f"✅ 파이프라인 완료: 실행 {ran}개, 재사용 {len(status) - ran}개 "
+              f"(작업 프로세스 {workers}개, {time.perf_counter() - started:.1f}초)")
+        return status
+
+    def _finish(self, name, key, path, result, hashes, status):
+        output_hash, artifact, seconds = result
+        unchanged = self.manifest.get(name, {}).get('hash') == output_hash
+        self._record(name, key, path, output_hash, seconds, artifact)
+        hashes[name], status[name] = output_hash, 'ran'
+        print(f"⚙️  {name}: {seconds:.1f}초" + (" (결과 변화 없음)" if unchanged else ""))
+
+
+def print_metrics(metrics):
+    print("\n--- KCI 데이터 요약 ---")
+    print(f"총 논문 수: {metrics['articles']}편")
+    start, end, cagr = metrics['cagr']
+    print(f"연평균 성장률(CAGR, {start}-{end}): {round(cagr * 100, 2)} %")
+    for year, count in metrics['keyword_articles'].items():
+        print(f"AI/XR 키워드 포함 논문 ({year}): {count} / {metrics['yearly'].get(year, 0)}")
+    for period, density in metrics['density'].items():
+        print(f"공저 네트워크 밀도 ({period}): {round(density, 4)}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='KCI 분석 파이프라인 (바뀐 단계만 다시 실행)')
+    parser.add_argument('targets', nargs='*', help='실행할 단계 (기본: 전체, 입력 단계는 자동 포함)')
+    parser.add_argument('--csv', default=DATASET_CSV_PATH)
+    parser.add_argument('--out', default=kci_report.REPORT_DIR, help='그림 저장 디렉토리')
+    parser.add_argument('--workers', type=int, default=PIPELINE_WORKERS, help='동시에 실행할 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--force', nargs='+', default=[], help='저장된 결과가 있어도 다시 실행할 단계')
+    parser.add_argument('--list', action='store_true', help='단계 목록과 마지막 실행 기록만 출력')
+    parser.add_argument('--scrape', action='store_true', help='분석 전에 KCI 에서 다시 수집')
+    parser.add_argument('--years', help='--scrape 의 발행년도 범위 (예: 2015-2024)')
+    parser.add_argument('--step', type=int, default=1, help='--scrape 발행년도 샤드 하나에 담을 연수')
+    parser.add_argument('--scrape-workers', type=int, default=1)
+    args = parser.parse_args()
+
+    scrape_options = {}
+    if args.scrape:
+        if not args.years:
+            parser.error('--scrape 에는 --years 가 필요합니다.')
+        scrape_options = {'scrape': True, 'years': [int(y) for y in args.years.split('-')], 'step': args.step,
+                          'workers': args.scrape_workers}
+    pipeline = Pipeline(build_stages(args.csv, args.out, scrape_options))
+
+    if args.list:
+        for stage in pipeline.stages.values():
+            entry = pipeline.manifest.get(stage.name)
+            last = f"{entry['seconds']}초, {entry['key'][:12]}" if entry else '실행 기록 없음'
+            print(f"{stage.name:<24} ← {', '.join(stage.inputs) or '-':<24} ({last})")
+    else:
+        pipeline.run(args.targets, force=args.force, workers=args.workers)
+        if 'metrics' in pipeline.required(args.targets):
+            print_metrics(pipeline.output('metrics'))
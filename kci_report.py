@@ -0,0 +1,222 @@
+"""
+분석 그림 전체를 화면 없이(Agg) 파일로 한 번에 만드는 보고서 명령입니다.
+
+데이터는 한 번만 읽고, 그림마다 필요한 값(연도별 논문 수, 기술 키워드 비율, 키워드 트렌드, 공저 네트워크 등)을
+먼저 계산한 뒤 그림 그리기는 프로세스 풀에서 그림별로 나눠 실행합니다. 한글 폰트는 kci_fonts 가 한 번 찾아
+캐시해 둔 것을 각 프로세스가 그대로 사용하며, plt.show() 를 호출하지 않으므로 서버/CI 에서도 실행됩니다.
+
+    python kci_report.py --out kci_report --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import networkx as nx
+import pandas as pd
+import seaborn as sns
+from sklearn.preprocessing import MinMaxScaler
+
+from kci_authors import build_author_index
+from kci_coauthor import CoauthorTimeline, build_coauthor_network
+from kci_dataset import DATASET_CSV_PATH, load_articles
+from kci_fonts import apply_korean_font
+from kci_keywords import TARGET_KEYWORDS, TECH_KEYWORDS
+from kci_layout import layout_network, layout_periods
+from kci_search_index import ArticleIndex, open_index
+from kci_tokenize import PRETOKENIZED_PATTERN, tokenize_articles
+from kci_trends import TrendEngine
+
+REPORT_DIR = 'kci_report'
+REPORT_WORKERS = int(os.environ.get('KCI_REPORT_WORKERS', '0')) or None
+CAGR_YEARS = (2015, 2024)
+PERIODS = [(None, 2019), (2020, None)]
+
+
+# --- 그림별 그리기 함수 (작업 프로세스에서 실행) ---
+
+def render_yearly_counts(data, path):
+    yearly_counts, cagr = data
+    fig, ax = plt.subplots(figsize=(10, 5))
+    sns.barplot(x=yearly_counts.index, y=yearly_counts.values, ax=ax, color='steelblue')
+    ax.set_title(f"KCI 문화유산 큐레이션 논문 수 (연평균 성장률: {cagr:.2%})")
+    ax.set_xlabel("발행년도")
+    ax.set_ylabel("논문 수")
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+
+def render_tech_ratio(tech_ratio_by_year, path):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    tech_ratio_by_year.plot(kind="line", marker="o", ax=ax, color="darkorange")
+    ax.set_title("기술 키워드 포함 논문 비율 (%)")
+    ax.set_xlabel("발행년도")
+    ax.set_ylabel("포함 비율 (%)")
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+
+def render_keyword_trend(trend_df_scaled, path):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    for kw in trend_df_scaled.columns:
+        ax.plot(trend_df_scaled.index, trend_df_scaled[kw], label=kw)
+    ax.set_title("주요 키워드 연도별 트렌드")
+    ax.set_xlabel("발행년도")
+    ax.set_ylabel("상대적 빈도 (정규화)")
+    ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+
+def render_coauthor_network(data, path):
+    network, top_authors = data
+    G = network.to_networkx()
+    pos = layout_network(network)
+    fig, ax = plt.subplots(figsize=(14, 12))
+    nx.draw_networkx_edges(G, pos, ax=ax, alpha=0.3, width=0.5)
+    nx.draw_networkx_nodes(G, pos, ax=ax, node_size=30, node_color='skyblue', edgecolors='gray')
+    nx.draw_networkx_labels(G, pos, ax=ax, labels={node: node for node in top_authors}, font_size=10,
+                            font_family=plt.rcParams['font.family'])
+    ax.set_title("KCI 문화유산 큐레이션 공저 네트워크", fontsize=16)
+    ax.axis('off')
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+
+def render_coauthor_comparison(periods, path):
+    networks = [network for _, network in periods]
+    layouts = layout_periods(networks)
+    fig, axes = plt.subplots(1, len(periods), figsize=(9 * len(periods), 9), sharex=True, sharey=True, squeeze=False)
+    for ax, (label, network), pos, color in zip(axes[0], periods, layouts, ["skyblue", "lightgreen", "plum"]):
+        if network.number_of_nodes() > 0:
+            nx.draw_networkx(network.to_networkx(), pos=pos, ax=ax, with_labels=False, node_size=20,
+                             node_color=color, edge_color="gray", width=0.5)
+        ax.set_title(f"{label} 공저 네트워크 (밀도: {network.density():.4f})")
+    fig.suptitle("KCI 문화유산 큐레이션 공저 네트워크 비교 (시기별)", fontsize=16)
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.9)
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+
+def render_author_type_histogram(author_types, path):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    sns.countplot(x=author_types, hue=author_types, palette="Set2", legend=False, ax=ax)
+    ax.set_title("KCI 문화유산 큐레이션 연구 단독/공저자 편수 비교")
+    ax.set_xlabel("저자 유형")
+    ax.set_ylabel("논문 수")
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+
+
+# --- 그림 데이터 계산 (주 프로세스에서 한 번, kci_pipeline 의 단계에서도 사용) ---
+
+def yearly_counts_data(df):
+    yearly_counts = df["발행년도"].value_counts().sort_index()
+    start, end = CAGR_YEARS
+    cagr = (yearly_counts.get(end, 1) / yearly_counts.get(start, 1)) ** (1 / (end - start)) - 1
+    return yearly_counts, cagr
+
+def tech_ratio_data(df, keywords=TECH_KEYWORDS, index_path=None):
+    """index_path 를 주면 이미 df 와 동기화된 색인을 그대로 읽습니다. (kci_pipeline 의 search_index 단계)"""
+    yearly_counts = df["발행년도"].value_counts().sort_index()
+    with (ArticleIndex(index_path) if index_path else open_index(df)) as search_index:
+        tech_counts = search_index.year_counts(keywords, columns=["제목"])
+    return tech_counts.reindex(yearly_counts.index, fill_value=0).div(yearly_counts).mul(100).round(2)
+
+def keyword_trend_data(tokens, years, keywords=TARGET_KEYWORDS):
+    """tokenize_articles 결과(키워드_상세, 초록)와 발행년도로 키워드별 연도 빈도를 0~1 로 정규화"""
+    engine = TrendEngine(tokens["키워드_상세"] + ' ' + tokens["초록"], years.astype(str),
+                         token_pattern=PRETOKENIZED_PATTERN)
+    trend_df = engine.keyword_counts(keywords)
+    return pd.DataFrame(MinMaxScaler().fit_transform(trend_df), index=trend_df.index, columns=trend_df.columns)
+
+def coauthor_network_data(author_index, top_k=30):
+    network = build_coauthor_network(author_index)
+    return network, network.top_authors(top_k)
+
+def coauthor_periods_data(author_index, periods=PERIODS):
+    timeline = CoauthorTimeline(author_index)
+    if not timeline.years:
+        return []
+    return [
+        (f"{start or timeline.years[0]}–{end or timeline.years[-1]}", timeline.window(start, end))
+        for start, end in periods
+    ]
+
+def author_type_data(author_index):
+    authors_per_paper = author_index.authors_per_paper().to_numpy()
+    return pd.Series(authors_per_paper).map(lambda x: "단독 저자" if x == 1 else "공저")
+
+# 그림 이름 → (파일 이름, 그리기 함수)
+FIGURES = {
+    'yearly_counts': ('kci_yearly_counts.png', render_yearly_counts),
+    'tech_ratio': ('kci_tech_ratio.png', render_tech_ratio),
+    'keyword_trend': ('kci_keyword_trend.png', render_keyword_trend),
+    'coauthor_network': ('kci_coauthor_network.png', render_coauthor_network),
+    'coauthor_comparison': ('kci_coauthor_comparison.png', render_coauthor_comparison),
+    'author_type_histogram': ('kci_author_type_histogram.png', render_author_type_histogram),
+}
+
+def prepare_figures(df):
+    """{그림 이름: 그림 데이터}"""
+    tokens = tokenize_articles(df, ["키워드_상세", "초록"])
+    author_index = build_author_index(df, '저자_상세')
+    return {
+        'yearly_counts': yearly_counts_data(df),
+        'tech_ratio': tech_ratio_data(df),
+        'keyword_trend': keyword_trend_data(tokens, df["발행년도"]),
+        'coauthor_network': coauthor_network_data(author_index),
+        'coauthor_comparison': coauthor_periods_data(author_index),
+        'author_type_histogram': author_type_data(author_index),
+    }
+
+
+def init_worker():
+    """그림을 그리는 작업 프로세스 초기화 (한글 폰트)"""
+    apply_korean_font()
+
+def _render(task):
+    render, data, path = task
+    started = time.perf_counter()
+    render(data, path)
+    return path, time.perf_counter() - started
+
+def build_report(csv_path=DATASET_CSV_PATH, out_dir=REPORT_DIR, workers=REPORT_WORKERS):
+    """모든 그림을 out_dir 에 저장하고 (파일 경로, 걸린 시간) 목록을 돌려줍니다."""
+    started = time.perf_counter()
+    df = load_articles(csv_path)
+    figures = prepare_figures(df)
+    print(f"📦 데이터 준비 완료 ({len(df)}건, {time.perf_counter() - started:.1f}초)")
+
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(FIGURES[name][1], data, os.path.join(out_dir, FIGURES[name][0])) for name, data in figures.items()]
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        init_worker()
+        results = [_render(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            results = list(executor.map(_render, tasks))
+
+    for path, seconds in results:
+        print(f"🖼️  {path} ({seconds:.1f}초)")
+    print(f"✅ 그림 {len(results)}개 저장 (작업 프로세스 {workers}개, 총 {time.perf_counter() - started:.1f}초)")
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='KCI 분석 그림 일괄 생성 (Agg)')
+    parser.add_argument('--csv', default=DATASET_CSV_PATH)
+    parser.add_argument('--out', default=REPORT_DIR)
+    parser.add_argument('--workers', type=int, default=REPORT_WORKERS, help='그림을 그릴 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+    build_report(args.csv, args.out, args.workers)
@@ -0,0 +1,233 @@
+"""
+제목/초록/키워드_상세 전문 검색 색인(SQLite FTS5)과 질의 함수입니다.
+
+CSV(또는 load_articles() DataFrame)에서 색인을 만들고, 다시 sync() 하면 새로 추가되었거나 내용이 바뀐 논문만
+색인에 반영합니다. 색인은 소문자로 바꾼 텍스트를 trigram 토크나이저로 저장하므로 3글자 이상 키워드는
+색인 조회로, 2글자 이하 키워드('ai', 'vr' 등)는 LIKE 검색으로 찾으며, 결과는 기존 분석과 같은
+대소문자 무시 부분 문자열 일치입니다. (SQLite 3.34 미만으로 trigram 이 없으면 모두 LIKE 로 검색)
+
+    python kci_search_index.py 메타버스 "digital twin"
+
+    from kci_search_index import ArticleIndex
+    with ArticleIndex() as index:
+        index.sync(df)
+        result = index.query(['메타버스'])
+        result.year_counts, result.article_ids
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+from collections import namedtuple
+
+import pandas as pd
+
+from kci_dataset import DATASET_CACHE_DIR, DATASET_CSV_PATH, load_articles
+
+SEARCH_INDEX_PATH = os.environ.get('KCI_SEARCH_INDEX', os.path.join(DATASET_CACHE_DIR, 'search.sqlite'))
+# 원본 컬럼 → 색인 컬럼
+INDEX_COLUMNS = {'제목': 'title', '초록': 'abstract', '키워드_상세': 'keywords'}
+TRIGRAM_MIN_LENGTH = 3
+# 다른 프로세스가 같은 색인을 sync 하는 동안 기다리는 최대 시간 (초)
+SEARCH_INDEX_TIMEOUT = float(os.environ.get('KCI_SEARCH_INDEX_TIMEOUT', '600'))
+
+QueryResult = namedtuple('QueryResult', ['year_counts', 'article_ids'])
+
+
+def content_hash(values):
+    return hashlib.sha1('\x1f'.join(values).encode('utf-8')).hexdigest()
+
+def _like_pattern(keyword):
+    escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+def _phrase(keyword):
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+class ArticleIndex:
+    def __init__(self, path=SEARCH_INDEX_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=SEARCH_INDEX_TIMEOUT)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id INTEGER PRIMARY KEY,            -- documents_fts 의 rowid
+                article_id TEXT NOT NULL UNIQUE,
+                year INTEGER NOT NULL,
+                row_count INTEGER NOT NULL,            -- 원본 데이터에서 같은 논문ID 행 수
+                content_hash TEXT NOT NULL             -- 제목/초록/키워드 sha1 (바뀌면 다시 색인)
+            )
+        """)
+        columns = ', '.join(INDEX_COLUMNS.values())
+        try:
+            self.conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5({columns}, tokenize='trigram')")
+            self.trigram = True
+        except sqlite3.OperationalError:
+            # trigram 토크나이저가 없는 SQLite: 일반 테이블에 저장하고 LIKE 로 검색
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS documents_fts (rowid INTEGER PRIMARY KEY, {columns})")
+            self.trigram = False
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def sync(self, df, prune=True):
+        """
+        DataFrame 의 논문을 색인에 반영합니다. 논문ID별 내용 해시가 같으면 건너뛰므로 새 논문/바뀐 논문만 기록합니다.
+        prune=True 이면 df 에 없는 논문은 색인에서 지웁니다. 반환값: (추가/갱신 수, 삭제 수)
+        여러 프로세스가 같은 색인 파일을 sync 해도 되도록 기존 논문 조회부터 기록까지 쓰기 잠금을 잡고 실행합니다.
+        """
+        frame = pd.DataFrame({
+            column: df[column].fillna('').astype(str).str.lower() if column in df.columns else ''
+            for column in INDEX_COLUMNS
+        })
+        frame['year'] = pd.to_numeric(df['발행년도'], errors='coerce').fillna(0).astype(int).to_numpy()
+        frame['hash'] = [content_hash(values) for values in frame[list(INDEX_COLUMNS)].itertuples(index=False)]
+        ids = df['논문ID'].fillna('').astype(str) if '논문ID' in df.columns else pd.Series('', index=df.index)
+        frame['article_id'] = [article_id or f'#{digest}' for article_id, digest in zip(ids, frame['hash'])]
+        frame['row_count'] = frame.groupby('article_id')['article_id'].transform('size')
+        frame = frame.drop_duplicates('article_id', keep='last')
+
+        columns = ', '.join(INDEX_COLUMNS.values())
+        placeholders = ', '.join('?' * len(INDEX_COLUMNS))
+        changed = 0
+        with self.conn:
+            # 조회 전에 쓰기 잠금: 다른 프로세스의 sync 는 timeout 동안 기다렸다가 이 결과를 보고 이어서 실행
+            self.conn.execute('BEGIN IMMEDIATE')
+            known = {
+                article_id: (doc_id, year, row_count, digest)
+                for doc_id, article_id, year, row_count, digest in self.conn.execute(
+                    'SELECT doc_id, article_id, year, row_count, content_hash FROM documents')
+            }
+            for row in frame.itertuples(index=False):
+                entry = known.get(row.article_id)
+                if entry is not None and entry[1:] == (row.year, row.row_count, row.hash):
+                    continue
+                cursor = self.conn.execute(
+                    'INSERT INTO documents (article_id, year, row_count, content_hash) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT(article_id) DO UPDATE SET '
+                    'year = excluded.year, row_count = excluded.row_count, content_hash = excluded.content_hash',
+                    (row.article_id, row.year, row.row_count, row.hash))
+                doc_id = entry[0] if entry is not None else cursor.lastrowid
+                if entry is not None and entry[3] == row.hash:
+                    continue
+                # 새 논문이거나 내용이 바뀐 논문: 검색 텍스트 행을 교체
+                texts = [getattr(row, column) for column in INDEX_COLUMNS]
+                self.conn.execute('DELETE FROM documents_fts WHERE rowid = ?', (doc_id,))
+                self.conn.execute(f'INSERT INTO documents_fts (rowid, {columns}) VALUES (?, {placeholders})',
+                                  (doc_id, *texts))
+                changed += 1
+
+            removed = 0
+            if prune:
+                stale = [(known[article_id][0],) for article_id in set(known) - set(frame['article_id'])]
+                self.conn.executemany('DELETE FROM documents_fts WHERE rowid = ?', stale)
+                self.conn.executemany('DELETE FROM documents WHERE doc_id = ?', stale)
+                removed = len(stale)
+        return changed, removed
+
+    def _match_condition(self, keywords, columns):
+        """키워드 중 하나라도 포함하는 문서 조건 (SQL, 인자)"""
+        fts_columns = [INDEX_COLUMNS[column] for column in (columns or INDEX_COLUMNS)]
+        keywords = [keyword.lower() for keyword in keywords if keyword]
+        if not keywords:
+            return '0', []
+
+        conditions, params = [], []
+        indexed = [k for k in keywords if self.trigram and len(k) >= TRIGRAM_MIN_LENGTH]
+        if indexed:
+            expression = '{%s} : (%s)' % (' '.join(fts_columns), ' OR '.join(_phrase(k) for k in indexed))
+            conditions.append('d.doc_id IN (SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?)')
+            params.append(expression)
+        for keyword in keywords:
+            if keyword in indexed:
+                continue
+            like = ' OR '.join(f"{column} LIKE ? ESCAPE '\\'" for column in fts_columns)
+            conditions.append(f'd.doc_id IN (SELECT rowid FROM documents_fts WHERE {like})')
+            params.extend([_like_pattern(keyword)] * len(fts_columns))
+        return '(' + ' OR '.join(conditions) + ')', params
+
+    def _year_filter(self, start, end):
+        conditions, params = [], []
+        if start is not None:
+            conditions.append('d.year >= ?')
+            params.append(start)
+        if end is not None:
+            conditions.append('d.year <= ?')
+            params.append(end)
+        return ''.join(f' AND {condition}' for condition in conditions), params
+
+    def year_counts(self, keywords, columns=None, start=None, end=None, distinct=False):
+        """
+        키워드(하나라도) 포함 논문 수를 연도별로 돌려줍니다. (pd.Series, 연도 순)
+        distinct=False 이면 원본 데이터의 행 수(같은 논문ID 중복 포함) 기준으로 세어 DataFrame 분석과 같은 값이 나옵니다.
+        """
+        condition, params = self._match_condition(keywords, columns)
+        years, year_params = self._year_filter(start, end)
+        measure = 'COUNT(*)' if distinct else 'SUM(d.row_count)'
+        rows = self.conn.execute(
+            f'SELECT d.year, {measure} FROM documents d WHERE {condition}{years} GROUP BY d.year ORDER BY d.year',
+            params + year_params).fetchall()
+        return pd.Series(dict(rows), dtype='int64', name='논문수').rename_axis('발행년도')
+
+    def year_totals(self, start=None, end=None, distinct=False):
+        """연도별 전체 논문 수 (비율 계산용 분모)"""
+        years, params = self._year_filter(start, end)
+        measure = 'COUNT(*)' if distinct else 'SUM(d.row_count)'
+        rows = self.conn.execute(
+            f'SELECT d.year, {measure} FROM documents d WHERE 1{years} GROUP BY d.year ORDER BY d.year',
+            params).fetchall()
+        return pd.Series(dict(rows), dtype='int64', name='논문수').rename_axis('발행년도')
+
+    def search(self, keywords, columns=None, start=None, end=None):
+        """키워드(하나라도) 포함 논문ID 목록 (색인에 들어온 순서)"""
+        condition, params = self._match_condition(keywords, columns)
+        years, year_params = self._year_filter(start, end)
+        rows = self.conn.execute(
+            f'SELECT d.article_id FROM documents d WHERE {condition}{years} ORDER BY d.doc_id', params + year_params)
+        return [article_id for (article_id,) in rows]
+
+    def query(self, keywords, columns=None, start=None, end=None, distinct=False):
+        """연도별 포함 논문 수와 포함 논문ID 목록을 함께 돌려줍니다."""
+        return QueryResult(
+            year_counts=self.year_counts(keywords, columns, start, end, distinct),
+            article_ids=self.search(keywords, columns, start, end),
+        )
+
+
+def open_index(df=None, path=SEARCH_INDEX_PATH):
+    """색인을 열고 df(없으면 load_articles())와 동기화합니다."""
+    index = ArticleIndex(path)
+    index.sync(load_articles() if df is None else df)
+    return index
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='KCI 논문 전문 검색 (제목/초록/키워드)')
+    parser.add_argument('keywords', nargs='+', help='하나라도 포함하면 일치 (대소문자 무시, 부분 문자열)')
+    parser.add_argument('--csv', default=DATASET_CSV_PATH)
+    parser.add_argument('--columns', nargs='*', choices=list(INDEX_COLUMNS), help='검색할 컬럼 (기본: 전체)')
+    parser.add_argument('--start', type=int)
+    parser.add_argument('--end', type=int)
+    args = parser.parse_args()
+
+    with ArticleIndex() as index:
+        changed, removed = index.sync(load_articles(args.csv))
+        print(f"🗂️  색인 {len(index)}건 (추가/갱신 {changed}건, 삭제 {removed}건)")
+        result = index.query(args.keywords, args.columns, args.start, args.end)
+        print(f"\n🔎 {', '.join(args.keywords)}: {len(result.article_ids)}건")
+        for year, count in result.year_counts.items():
+            print(f"   - {year}년: {count}편")
+        print("\n논문ID:", ', '.join(result.article_ids))
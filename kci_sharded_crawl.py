@@ -0,0 +1,152 @@
+"""
+하나의 검색을 여러 샤드(발행년도 구간 또는 검색어 목록)로 나누어 프로세스별로 동시에 수집하고,
+결과를 논문ID 기준으로 중복 제거해 하나의 CSV로 합칩니다.
+
+샤드마다 별도 프로세스와 브라우저를 사용하며, 결과 CSV와 진행 상태 저장소도 샤드별로 따로 둡니다.
+(페이지 캐시는 함께 사용) 각 샤드는 검색 결과 페이지 상한(MAX_PAGES)을 따로 가지므로,
+검색을 잘게 나눌수록 전체적으로 더 많은 논문을 수집할 수 있습니다.
+
+    python kci_sharded_crawl.py --years 2015-2024 --step 2 --workers 4
+    python kci_sharded_crawl.py --queries "문화유산 큐레이션" "디지털 아카이브" --workers 2
+"""
+
+import argparse
+import asyncio
+import csv
+import multiprocessing
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from kci_output import OUTPUT_CSV_PATH, StreamingArticleWriter
+
+SHARD_WORK_DIR = 'kci_shards'
+
+Shard = namedtuple('Shard', ['name', 'query', 'year_range'])
+
+
+def year_shards(query, start_year, end_year, step=1):
+    """[start_year, end_year] 구간을 step 년씩 나눈 샤드 목록을 만듭니다."""
+    shards = []
+    for year_from in range(start_year, end_year + 1, step):
+        year_to = min(year_from + step - 1, end_year)
+        shards.append(Shard(f'years_{year_from}_{year_to}', query, (year_from, year_to)))
+    return shards
+
+def query_shards(queries, year_range=None):
+    """검색어마다 샤드 하나씩 만듭니다."""
+    return [
+        Shard(f'query_{index:02d}_' + re.sub(r'\W+', '_', query).strip('_')[:30], query, year_range)
+        for index, query in enumerate(queries, start=1)
+    ]
+
+def shard_paths(shard, work_dir=SHARD_WORK_DIR):
+    return (
+        os.path.join(work_dir, f'{shard.name}.csv'),
+        os.path.join(work_dir, f'{shard.name}.state.sqlite'),
+    )
+
+def crawl_shard(shard, max_pages, work_dir=SHARD_WORK_DIR):
+    """
+    작업 프로세스에서 실행됩니다. 샤드 하나를 자체 브라우저로 수집하고 결과 CSV 경로를 반환합니다.
+    """
+    import scrape_kci_details
+
+    output_csv, crawl_state_path = shard_paths(shard, work_dir)
+    print(f"🧩 샤드 시작: {shard.name} (검색어: {shard.query}, 발행년도: {shard.year_range or '전체'})")
+    asyncio.run(scrape_kci_details.run(
+        query=shard.query,
+        year_range=shard.year_range,
+        max_pages=max_pages,
+        output_csv=output_csv,
+        crawl_state_path=crawl_state_path,
+    ))
+    return output_csv
+
+def merge_shard_outputs(shard_csvs, output_csv=OUTPUT_CSV_PATH):
+    """
+    샤드별 CSV를 순서대로 읽어 논문ID 기준으로 중복을 제거하며 하나의 CSV로 합칩니다.
+    논문ID가 없는 행은 그대로 유지합니다. (기록한 행 수, 제거한 중복 수)를 반환합니다.
+    """
+    seen_ids = set()
+    duplicates = 0
+    with StreamingArticleWriter(output_csv) as writer:
+        for shard_csv in shard_csvs:
+            if not os.path.exists(shard_csv):
+                continue
+            with open(shard_csv, encoding='utf-8-sig', newline='') as f:
+                for record in csv.DictReader(f):
+                    article_id = record.get('논문ID')
+                    if article_id:
+                        if article_id in seen_ids:
+                            duplicates += 1
+                            continue
+                        seen_ids.add(article_id)
+                    writer.write(record)
+    return writer.count, duplicates
+
+def run_sharded(shards, workers, max_pages, output_csv=OUTPUT_CSV_PATH, work_dir=SHARD_WORK_DIR):
+    """
+    샤드를 작업 프로세스에서 동시에 수집한 뒤 합칩니다. 발행년도 범위가 있는 샤드는 검색 화면의 기간 필터가
+    필요하므로, 필터 셀렉터가 설정되지 않았으면 수집을 시작하지 않고 RuntimeError 를 냅니다.
+    실패한 샤드가 하나라도 있으면 일부만 수집된 결과로 output_csv 를 덮어쓰지 않도록 병합하지 않고 RuntimeError 를 냅니다.
+    """
+    import scrape_kci_details
+
+    if any(shard.year_range for shard in shards):
+        scrape_kci_details.require_year_filter()
+    os.makedirs(work_dir, exist_ok=True)
+    # 브라우저를 띄우는 작업 프로세스는 fork 대신 spawn 으로 깨끗하게 시작
+    context = multiprocessing.get_context('spawn')
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {executor.submit(crawl_shard, shard, max_pages, work_dir): shard for shard in shards}
+        for future in as_completed(futures):
+            shard = futures[future]
+            try:
+                future.result()
+                print(f"✅ 샤드 완료: {shard.name}")
+            except Exception as e:
+                failed.append(shard.name)
+                print(f"❌ 샤드 실패: {shard.name} (오류: {e}) - 다시 실행하면 진행 상태를 이어서 수집합니다.")
+
+    if failed:
+        raise RuntimeError(f"샤드 {len(failed)}개가 실패해 병합하지 않았습니다: {', '.join(sorted(failed))}")
+
+    # 샤드 정의 순서대로 합쳐 결과 순서를 일정하게 유지
+    written, duplicates = merge_shard_outputs([shard_paths(shard, work_dir)[0] for shard in shards], output_csv)
+    print(f"\n✅ 병합 완료: {output_csv} (총 {written}건, 중복 제거 {duplicates}건)")
+
+
+if __name__ == '__main__':
+    import scrape_kci_details
+
+    parser = argparse.ArgumentParser(description='KCI 샤드 병렬 수집')
+    parser.add_argument('--query', default=scrape_kci_details.search_query(), help='발행년도 샤드에 사용할 검색어')
+    parser.add_argument('--years', help='발행년도 범위 (예: 2015-2024)')
+    parser.add_argument('--step', type=int, default=1, help='발행년도 샤드 하나에 담을 연수')
+    parser.add_argument('--queries', nargs='+', help='검색어 목록 (검색어마다 샤드 하나)')
+    parser.add_argument('--workers', type=int, default=max(1, min(4, os.cpu_count() or 1)))
+    parser.add_argument('--max-pages', type=int, default=scrape_kci_details.MAX_PAGES)
+    parser.add_argument('--output', default=OUTPUT_CSV_PATH)
+    parser.add_argument('--work-dir', default=SHARD_WORK_DIR)
+    args = parser.parse_args()
+
+    year_range = tuple(int(y) for y in args.years.split('-')) if args.years else None
+    if args.queries:
+        shards = query_shards(args.queries, year_range)
+    elif year_range:
+        shards = year_shards(args.query, year_range[0], year_range[1], args.step)
+    else:
+        parser.error('--years 또는 --queries 중 하나는 지정해야 합니다.')
+    if year_range and not scrape_kci_details.year_filter_available():
+        parser.error('--years 를 사용하려면 KCI_YEAR_FROM_SELECTOR/KCI_YEAR_TO_SELECTOR/KCI_YEAR_APPLY_SELECTOR 를 '
+                     '검색 결과 화면의 기간 필터에 맞게 지정해야 합니다.')
+
+    try:
+        run_sharded(shards, args.workers, args.max_pages, args.output, args.work_dir)
+    except RuntimeError as e:
+        print(f"\n🚨 {e}")
+        sys.exit(1)
@@ -0,0 +1,165 @@
+"""
+KCI 전체 내보내기처럼 메모리에 다 올리기 어려운 큰 CSV를 조각(chunk) 단위로 한 번만 읽으며
+analyze_kci 의 지표(연도별 논문 수, AI/XR 키워드 포함 논문 수, 기간별 공저 네트워크)를 누적하는 분석기입니다.
+
+조각마다 필요한 컬럼만 읽고 kci_dataset 과 같은 규칙으로 정리한 뒤, 본문 텍스트는 바로 버리고 작은 값만 남깁니다.
+- 연도별 논문 수: 연도별 행 수
+- 키워드 포함 논문 수: 행마다 (논문 키 해시, 발행년도, 포함 여부). 메모리 분석의 전문 검색 색인(kci_search_index)과
+  같게 논문ID별 마지막 행의 연도/내용으로 판정하고 같은 논문ID의 행 수만큼 셉니다.
+- 공저 네트워크: 기간별 저자 쌍(엣지) 정수 코드의 중복 없는 집합과 저자 이름 → ID 사전
+따라서 메모리는 본문 크기와 무관하게 행 수(행당 십여 바이트)와 저자/엣지 수에만 비례합니다.
+
+    from kci_stream import analyze_stream
+    result = analyze_stream('kci_all.csv', keywords=['메타버스'], periods=[(2015, 2019), (2020, 2024)])
+    result.yearly_counts(2015, 2024), result.keyword_year_counts(2015, 2024), result.period_network(2015, 2019)
+"""
+
+from collections import namedtuple
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from kci_authors import AUTHOR_SOURCE_COLUMN, normalize_author_name
+from kci_dataset import AUTHOR_LIST_COLUMNS, CHUNK_ROWS, DATASET_CSV_PATH, iter_article_chunks
+from kci_keywords import KeywordMatcher
+from kci_search_index import INDEX_COLUMNS, content_hash
+
+STREAM_COLUMNS = ['논문ID', '발행년도', AUTHOR_SOURCE_COLUMN, *INDEX_COLUMNS]
+
+PeriodNetwork = namedtuple('PeriodNetwork', ['start', 'end', 'nodes', 'edges', 'density'])
+
+
+class UniqueCodes:
+    """
+    int64 코드의 중복 없는 집합. 새로 들어온 조각은 모아 두었다가 정리된 집합보다 커지면 한 번에 합쳐(np.unique)
+    중복을 지우므로, 합치는 비용은 전체 코드 수에 대해 선형에 가깝고 메모리는 집합 크기의 두 배 정도로 제한됩니다.
+    """
+
+    def __init__(self, min_pending=1 << 20):
+        self.min_pending = min_pending
+        self._unique = np.empty(0, dtype=np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    def add(self, codes):
+        codes = np.asarray(codes, dtype=np.int64)
+        if len(codes) == 0:
+            return
+        self._pending.append(codes)
+        self._pending_size += len(codes)
+        if self._pending_size >= max(len(self._unique), self.min_pending):
+            self._compact()
+
+    def _compact(self):
+        if self._pending:
+            self._unique = np.unique(np.concatenate([self._unique, *self._pending]))
+            self._pending = []
+            self._pending_size = 0
+
+    def values(self):
+        self._compact()
+        return self._unique
+
+    def __len__(self):
+        return len(self.values())
+
+
+class StreamingAnalysis:
+    def __init__(self, keywords, periods, keyword_columns=tuple(INDEX_COLUMNS)):
+        self.matcher = KeywordMatcher(keywords)
+        self.periods = [tuple(period) for period in periods]
+        self.keyword_columns = list(keyword_columns)
+        self.rows = 0
+        self.year_rows = pd.Series(dtype='int64')          # 발행년도 → 행 수
+        self.author_ids = {}                               # 정규화된 저자 이름 → 정수 ID
+        self.period_edges = {period: UniqueCodes() for period in self.periods}
+        self._keys, self._years, self._matched = [], [], []
+
+    def add(self, chunk):
+        """kci_dataset.iter_article_chunks() 의 조각 하나를 누적합니다."""
+        years = chunk['발행년도'].to_numpy()
+        self.rows += len(chunk)
+        self.year_rows = self.year_rows.add(chunk['발행년도'].value_counts(), fill_value=0).astype('int64')
+        self._add_keywords(chunk, years)
+        self._add_coauthors(chunk, years)
+
+    def _add_keywords(self, chunk, years):
+        matched = np.zeros(len(chunk), dtype=bool)
+        for column in self.keyword_columns:
+            if column in chunk.columns:
+                matched |= self.matcher.any(chunk[column])
+
+        # 색인과 같은 논문 키: 논문ID, 없으면 소문자로 바꾼 제목/초록/키워드의 해시
+        keys = chunk['논문ID'].tolist() if '논문ID' in chunk.columns else [''] * len(chunk)
+        if not all(keys):
+            texts = pd.DataFrame({
+                column: chunk[column].str.lower() if column in chunk.columns else '' for column in INDEX_COLUMNS
+            })
+            keys = [key or f'#{content_hash(values)}'
+                    for key, values in zip(keys, texts.itertuples(index=False))]
+        self._keys.append(pd.util.hash_pandas_object(pd.Series(keys, dtype=object), index=False).to_numpy())
+        self._years.append(years.astype(np.int32))
+        self._matched.append(matched)
+
+    def _author_id(self, name):
+        return self.author_ids.setdefault(name, len(self.author_ids))
+
+    def _add_coauthors(self, chunk, years):
+        list_column = AUTHOR_LIST_COLUMNS[AUTHOR_SOURCE_COLUMN]
+        if list_column not in chunk.columns:
+            return
+        codes = {period: [] for period in self.periods}
+        for authors, year in zip(chunk[list_column], years):
+            periods = [period for period in self.periods if period[0] <= year <= period[1]]
+            if not periods or len(authors) < 2:
+                continue
+            # 한 논문에 같은 저자가 여러 번 나오면 한 번만 (kci_authors.build_author_index 와 같음)
+            ids = sorted(set(self._author_id(normalize_author_name(name)) for name in authors))
+            pair_codes = [(a << 32) | b for a, b in combinations(ids, 2)]
+            for period in periods:
+                codes[period].extend(pair_codes)
+        for period, period_codes in codes.items():
+            self.period_edges[period].add(period_codes)
+
+    # --- 결과 ---
+
+    def yearly_counts(self, start, end):
+        """[start, end] 연도별 행 수 (analyze_kci 의 groupby('발행년도').size().reindex 와 같은 Series)"""
+        counts = self.year_rows.reindex(range(start, end + 1), fill_value=0).astype('int64')
+        return counts.rename_axis('발행년도').rename(None)
+
+    def keyword_year_counts(self, start=None, end=None):
+        """
+        키워드(하나라도) 포함 논문 수를 연도별로 돌려줍니다. ArticleIndex.year_counts(distinct=False) 와 같이
+        논문ID별 마지막 행의 연도와 내용으로 판정하고, 같은 논문ID의 행 수만큼 셉니다.
+        """
+        frame = pd.DataFrame({
+            'key': np.concatenate(self._keys) if self._keys else np.empty(0, dtype=np.uint64),
+            'year': np.concatenate(self._years) if self._years else np.empty(0, dtype=np.int32),
+            'matched': np.concatenate(self._matched) if self._matched else np.empty(0, dtype=bool),
+        })
+        documents = frame.groupby('key', sort=False).agg(
+            year=('year', 'last'), matched=('matched', 'last'), rows=('key', 'size'))
+        mask = documents['matched'].to_numpy(copy=True)
+        if start is not None:
+            mask &= documents['year'].to_numpy() >= start
+        if end is not None:
+            mask &= documents['year'].to_numpy() <= end
+        counts = documents[mask].groupby('year')['rows'].sum().sort_index().astype('int64')
+        return counts.rename('논문수').rename_axis('발행년도')
+
+    def period_network(self, start, end):
+        """(start, end) 기간 공저 네트워크의 노드/엣지 수와 밀도 (CoauthorTimeline.window(start, end) 와 같은 값)"""
+        edges = self.period_edges[(start, end)].values()
+        nodes = len(np.unique(np.concatenate([edges >> 32, edges & 0xFFFFFFFF]))) if len(edges) else 0
+        density = 2 * len(edges) / (nodes * (nodes - 1)) if nodes > 1 else 0.0
+        return PeriodNetwork(start, end, nodes, len(edges), density)
+
+
+def analyze_stream(csv_path=DATASET_CSV_PATH, keywords=(), periods=(), chunk_rows=CHUNK_ROWS, encoding=None):
+    """CSV 를 chunk_rows 행씩 한 번 읽으며 누적한 StreamingAnalysis 를 돌려줍니다."""
+    analysis = StreamingAnalysis(keywords, periods)
+    for chunk in iter_article_chunks(csv_path, STREAM_COLUMNS, chunk_rows, encoding):
+        analysis.add(chunk)
+    return analysis
@@ -0,0 +1,244 @@
+"""
+성능 측정용으로 KCI 수집 결과 CSV 와 같은 모양의 가상 논문 데이터를 원하는 규모(1만~100만 편)로 만듭니다.
+
+번들 CSV 에서 본 분포를 따릅니다.
+- 논문당 저자 수: 1명 41%, 2명 31%, 3명 18% … (최대 9명)
+- 발행년도: 해마다 늘어나는 지수 분포
+- 저자: 소수 저자가 많은 논문을 쓰는 거듭제곱 분포, 공저자는 주로 가까운 연구자 그룹에서 선택
+- 초록/키워드: 한국어(일부 영어) 문장, 최근 연도일수록 AI/XR 기술 용어가 자주 등장
+- 논문ID 중복 행: 약 10% (같은 논문이 여러 검색 결과에 잡힌 경우처럼 내용이 같은 행)
+
+같은 규모와 seed 로는 항상 같은 데이터가 만들어지며, synthetic_csv() 는 만든 CSV 를 캐시 디렉토리에 저장해 재사용합니다.
+
+    python kci_synthetic.py --papers 100000 --out kci_synthetic_100k.csv
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from kci_dataset import DATASET_CACHE_DIR
+
+SYNTHETIC_DIR = os.path.join(DATASET_CACHE_DIR, 'synthetic')
+YEAR_RANGE = (2003, 2025)
+YEAR_GROWTH = 0.15
+# 논문당 저자 수 1~9명의 상대 빈도 (번들 CSV 기준)
+AUTHOR_COUNT_WEIGHTS = [201, 153, 87, 23, 17, 7, 4, 1, 1]
+# 논문 수 대비 저자 수, 저자 인기도 거듭제곱 지수, 공저자가 가까운 그룹에서 나올 확률과 그룹 범위
+AUTHOR_POOL_RATIO = 1.2
+AUTHOR_POPULARITY_EXPONENT = 0.5
+LOCAL_COAUTHOR_RATE = 0.7
+LOCAL_COAUTHOR_SPAN = 50
+ENGLISH_ABSTRACT_RATE = 0.15
+# 첫 해와 마지막 해에 문장/키워드가 기술 용어를 포함할 확률
+TECH_RATE = (0.05, 0.4)
+DUPLICATE_RATE = 0.1
+SENTENCE_POOL_SIZE = 2000
+
+SURNAMES = list('김이박최정강조윤장임한오서신권황안송류전')
+GIVEN_SYLLABLES = list('민서지현수영준은하윤도예진성우희재연주혜동소태경보람인석종욱')
+ENGLISH_FIRST_NAMES = ['James', 'Maria', 'David', 'Sarah', 'John', 'Emma', 'Daniel', 'Laura', 'Michael', 'Anna']
+ENGLISH_LAST_NAMES = ['Smith', 'Kim', 'Lee', 'Park', 'Johnson', 'Brown', 'Garcia', 'Miller', 'Wilson', 'Taylor']
+
+KO_TOPICS = [
+    '디지털 큐레이션', '문화유산', '박물관', '기록관', '디지털 아카이브', '메타데이터', '온톨로지', '전시 기획',
+    '관람객 경험', '무형문화유산', '지역 문화', '데이터 시각화', '스토리텔링', '교육 프로그램', '소장품 관리', '지식 그래프',
+]
+KO_TECH = ['인공지능', '가상현실', '증강현실', '확장현실', '메타버스', '디지털 트윈', '딥러닝', '머신러닝', '대규모 언어 모델',
+           'AI', 'VR', 'AR', 'XR']
+EN_TOPICS = ['digital curation', 'cultural heritage', 'museum', 'archive', 'metadata', 'ontology', 'exhibition design',
+             'visitor experience', 'data visualization', 'storytelling']
+EN_TECH = ['artificial intelligence', 'virtual reality', 'augmented reality', 'extended reality', 'metaverse',
+           'digital twin', 'deep learning', 'machine learning', 'large language model']
+KO_TEMPLATES = [
+    '본 연구는 {a}와 {b}의 관계를 분석하였다.', '{a}을 활용한 {b} 방안을 제안한다.',
+    '연구 결과 {a}는 {b}에 긍정적인 영향을 미치는 것으로 나타났다.', '이를 위해 {a} 사례를 중심으로 {b}의 현황을 살펴보았다.',
+    '{a} 기반 {b} 모델을 설계하고 그 효과를 검증하였다.', '마지막으로 {a}과 {b}의 향후 과제를 논의하였다.',
+]
+EN_TEMPLATES = [
+    'This study examines {a} in the context of {b}.', 'We propose a {a} framework for {b}.',
+    'The results show that {a} improves {b}.', 'A case study of {a} and {b} is presented.',
+]
+TITLE_TEMPLATES = ['{a}을 활용한 {b} 연구', '{a} 기반 {b} 방안', '{b}에서의 {a} 적용 사례 분석', '{a}와 {b}에 관한 연구']
+SUBJECT_WEIGHTS = {
+    '문헌정보학': 79, '디자인': 53, '학제간연구': 47, '기타인문학': 23, '경영학': 22,
+    '역사학': 20, '관광학': 18, '교육학': 16, '컴퓨터학': 14, '예술학': 12,
+}
+JOURNAL_COUNT = 200
+
+
+def _sentence_pool(rng, templates, topics, tech_terms, tech, size):
+    """템플릿 문장 size 개. tech=True 이면 문장마다 기술 용어가 하나 들어감"""
+    template = rng.integers(len(templates), size=size)
+    a = rng.integers(len(topics), size=size)
+    b = rng.integers(len(topics), size=size)
+    t = rng.integers(len(tech_terms), size=size)
+    return np.array([
+        templates[template[i]].format(a=tech_terms[t[i]] if tech else topics[a[i]], b=topics[b[i]])
+        for i in range(size)
+    ], dtype=object)
+
+def _author_names(count):
+    """저자 ID → 이름 (성 + 이름 2~3음절, 5% 는 영문). 조합을 다 쓰면 동명이인이 생김"""
+    syllables = len(GIVEN_SYLLABLES)
+    names = []
+    for author_id in range(count):
+        if author_id % 20 == 19:
+            names.append(f'{ENGLISH_FIRST_NAMES[author_id // 20 % 10]} {ENGLISH_LAST_NAMES[author_id // 200 % 10]}')
+            continue
+        code = author_id
+        surname = SURNAMES[code % len(SURNAMES)]
+        code //= len(SURNAMES)
+        given = GIVEN_SYLLABLES[code % syllables] + GIVEN_SYLLABLES[code // syllables % syllables]
+        if code >= syllables * syllables:
+            given += GIVEN_SYLLABLES[code // (syllables * syllables) % syllables]
+        names.append(surname + given)
+    return names
+
+def _tech_rate(years):
+    start, end = YEAR_RANGE
+    low, high = TECH_RATE
+    return low + (high - low) * (years - start) / max(end - start, 1)
+
+def generate_corpus(n_papers, seed=42, duplicate_rate=DUPLICATE_RATE):
+    """n_papers 편(중복 행 제외)의 가상 논문 DataFrame. 컬럼과 값 형식은 수집 결과 CSV 와 같습니다."""
+    rng = np.random.default_rng(seed)
+    start, end = YEAR_RANGE
+
+    year_values = np.arange(start, end + 1)
+    year_weights = np.exp(YEAR_GROWTH * (year_values - start))
+    years = np.sort(rng.choice(year_values, size=n_papers, p=year_weights / year_weights.sum()))
+    tech_rate = _tech_rate(years)
+
+    # 저자: 첫 저자는 인기도 분포에서, 공저자는 대부분 첫 저자 근처(같은 연구 그룹) ID 에서 선택
+    n_authors = max(10, int(n_papers * AUTHOR_POOL_RATIO))
+    popularity = (np.arange(n_authors) + 1.0) ** -AUTHOR_POPULARITY_EXPONENT
+    popularity = rng.permutation(popularity / popularity.sum())
+    count_weights = np.asarray(AUTHOR_COUNT_WEIGHTS, dtype=float)
+    author_counts = rng.choice(np.arange(1, len(count_weights) + 1), size=n_papers, p=count_weights / count_weights.sum())
+    first_authors = rng.choice(n_authors, size=n_papers, p=popularity)
+    total = int(author_counts.sum())
+    paper_of_slot = np.repeat(np.arange(n_papers), author_counts)
+    local = (first_authors[paper_of_slot] + rng.integers(-LOCAL_COAUTHOR_SPAN, LOCAL_COAUTHOR_SPAN + 1, total)) % n_authors
+    slot_authors = np.where(rng.random(total) < LOCAL_COAUTHOR_RATE, local, rng.choice(n_authors, size=total, p=popularity))
+    offsets = np.concatenate([[0], np.cumsum(author_counts)[:-1]])
+    slot_authors[offsets] = first_authors
+    names = np.array(_author_names(n_authors), dtype=object)
+
+    # 초록: 언어/기술 여부별 문장 묶음에서 논문마다 4~8문장
+    pools = {
+        (lang, tech): _sentence_pool(rng, templates, topics, tech_terms, tech, SENTENCE_POOL_SIZE)
+        for lang, templates, topics, tech_terms in [('ko', KO_TEMPLATES, KO_TOPICS, KO_TECH),
+                                                    ('en', EN_TEMPLATES, EN_TOPICS, EN_TECH)]
+        for tech in (False, True)
+    }
+    titles = {tech: _sentence_pool(rng, TITLE_TEMPLATES, KO_TOPICS, KO_TECH, tech, SENTENCE_POOL_SIZE) for tech in (False, True)}
+    english = rng.random(n_papers) < ENGLISH_ABSTRACT_RATE
+    sentence_counts = rng.integers(4, 9, size=n_papers)
+    sentence_tech = rng.random(int(sentence_counts.sum())) < np.repeat(tech_rate, sentence_counts)
+    sentence_pick = rng.integers(SENTENCE_POOL_SIZE, size=len(sentence_tech))
+    keyword_counts = rng.integers(3, 8, size=n_papers)
+    keyword_tech = rng.random(int(keyword_counts.sum())) < np.repeat(tech_rate, keyword_counts)
+    keyword_topic = rng.integers(len(KO_TOPICS), size=len(keyword_tech))
+    keyword_term = rng.integers(len(KO_TECH), size=len(keyword_tech))
+    title_tech = rng.random(n_papers) < tech_rate
+    title_pick = rng.integers(SENTENCE_POOL_SIZE, size=n_papers)
+
+    author_strings, abstracts, keywords = [], [], []
+    slot, sentence, keyword = 0, 0, 0
+    for paper in range(n_papers):
+        count = author_counts[paper]
+        author_strings.append('; '.join(names[slot_authors[slot:slot + count]]))
+        slot += count
+
+        lang = 'en' if english[paper] else 'ko'
+        count = sentence_counts[paper]
+        abstracts.append(' '.join(
+            pools[lang, bool(tech)][pick]
+            for tech, pick in zip(sentence_tech[sentence:sentence + count], sentence_pick[sentence:sentence + count])
+        ))
+        sentence += count
+
+        count = keyword_counts[paper]
+        terms = dict.fromkeys(
+            KO_TECH[keyword_term[i]] if keyword_tech[i] else KO_TOPICS[keyword_topic[i]]
+            for i in range(keyword, keyword + count)
+        )
+        keywords.append('; '.join(terms))
+        keyword += count
+
+    subjects = list(SUBJECT_WEIGHTS)
+    subject_weights = np.asarray(list(SUBJECT_WEIGHTS.values()), dtype=float)
+    journal_subject = rng.choice(len(subjects), size=JOURNAL_COUNT, p=subject_weights / subject_weights.sum())
+    prefixes, suffixes = ['한국', '대한', '국제', '동아시아', ''], ['연구', '학회지', '논총', '저널']
+    journal_names = np.array([
+        f'{prefixes[j % len(prefixes)]}{subjects[journal_subject[j]]}{suffixes[j // len(prefixes) % len(suffixes)]}'
+        + (f' {j // 20 + 1}' if j >= 20 else '')
+        for j in range(JOURNAL_COUNT)
+    ], dtype=object)
+    journals = rng.integers(JOURNAL_COUNT, size=n_papers)
+    start_pages = rng.integers(1, 300, size=n_papers)
+    volumes = rng.integers(1, 60, size=n_papers)
+    issues = rng.integers(1, 5, size=n_papers)
+    # 논문ID: 겹치지 않도록 무작위 간격으로 증가하는 번호를 섞어 사용
+    article_numbers = rng.permutation(1_000_000 + np.cumsum(rng.integers(1, 50, size=n_papers)))
+    # 오래된 논문일수록 인용이 많음
+    citations = rng.poisson(1.0 + 0.5 * (end - years))
+    first_slot_names = names[slot_authors[offsets]]
+
+    df = pd.DataFrame({
+        '제목': np.where(title_tech, titles[True][title_pick], titles[False][title_pick]),
+        '저자_상세': author_strings,
+        '초록': abstracts,
+        '키워드_상세': keywords,
+        '저자': first_slot_names,
+        '저널명': journal_names[journals],
+        '발행기관': [f'{subjects[journal_subject[j]]}학회' for j in journals],
+        '권': np.where(rng.random(n_papers) < 0.3, '', volumes.astype(float).astype(str)),
+        '호': issues.astype(float).astype(str),
+        '시작페이지': start_pages,
+        '종료페이지': start_pages + rng.integers(10, 40, size=n_papers),
+        '발행년도': years,
+        '주제분야': np.array(subjects, dtype=object)[journal_subject[journals]],
+        '인용횟수': citations,
+        '논문ID': [f'ART{number:09d}' for number in article_numbers],
+    })
+
+    if duplicate_rate > 0:
+        copies = df.iloc[rng.choice(n_papers, size=int(n_papers * duplicate_rate))]
+        df = pd.concat([df, copies], ignore_index=True)
+        # 같은 연도 안에서 순서를 섞어 중복 행이 원본 근처에 흩어지게 함
+        df = df.iloc[np.lexsort((rng.random(len(df)), df['발행년도'].to_numpy()))].reset_index(drop=True)
+    return df
+
+def write_corpus(df, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    df.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+    os.replace(tmp_path, path)
+
+def synthetic_csv(n_papers, seed=42, corpus_dir=SYNTHETIC_DIR):
+    """규모와 seed 별 가상 데이터 CSV 경로. 없으면 만들어 저장합니다."""
+    path = os.path.join(corpus_dir, f'kci_synthetic_{n_papers}_{seed}.csv')
+    if not os.path.exists(path):
+        print(f"🧪 가상 데이터 생성: {n_papers:,}편 (seed {seed})")
+        write_corpus(generate_corpus(n_papers, seed), path)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='KCI 형식 가상 논문 데이터 생성')
+    parser.add_argument('--papers', type=int, default=10000, help='논문 수 (중복 행 제외)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--duplicate-rate', type=float, default=DUPLICATE_RATE)
+    parser.add_argument('--out', help='CSV 경로 (기본: .kci_cache/synthetic/ 아래)')
+    args = parser.parse_args()
+
+    if args.out:
+        corpus = generate_corpus(args.papers, args.seed, args.duplicate_rate)
+        write_corpus(corpus, args.out)
+        print(f"✅ 저장 완료: {args.out} ({len(corpus):,}행)")
+    else:
+        print(f"✅ {synthetic_csv(args.papers, args.seed)}")
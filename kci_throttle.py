@@ -0,0 +1,160 @@
+"""
+KCI 요청 속도를 조절하는 적응형 제한기와 실패한 논문을 나중에 다시 처리하는 재시도 큐입니다.
+
+- AdaptiveRateLimiter: 토큰 버킷으로 초당 요청 수를 제한하고, 동시에 진행할 요청 수(concurrency)를
+  상황에 따라 조절합니다. 타임아웃/5xx/429 가 나면 속도와 동시 요청 수를 절반으로 줄이고(back off),
+  연속으로 성공하면 조금씩 다시 올립니다(ramp up). (AIMD 방식)
+- RetryQueue: 실패한 항목을 시도 횟수와 함께 모아 두었다가 수집이 끝난 뒤 정해진 횟수까지 다시 처리합니다.
+"""
+
+import asyncio
+import contextlib
+import random
+import time
+
+import httpx
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+RATE_LIMIT_INITIAL = 2.0        # 초당 요청 수 (시작값)
+RATE_LIMIT_MIN = 0.2
+RATE_LIMIT_MAX = 10.0
+RATE_LIMIT_BURST = 4            # 토큰 버킷 크기
+RAMP_UP_AFTER_SUCCESSES = 10    # 연속 성공이 이만큼 쌓이면 속도/동시 요청 수를 올림
+RETRY_MAX_ATTEMPTS = 3          # 논문 하나를 시도할 최대 횟수 (첫 시도 포함, 재시도는 RETRY_MAX_ATTEMPTS - 1회)
+RETRY_BASE_DELAY = 2.0          # 재시도 대기 시간(초)의 기준값 (시도마다 2배)
+
+
+class ServerBusyError(Exception):
+    """KCI가 5xx 또는 429로 응답했을 때 사용합니다."""
+
+    def __init__(self, status):
+        super().__init__(f'HTTP {status}')
+        self.status = status
+
+
+def is_overload_error(error):
+    """사이트 과부하 신호(타임아웃, 5xx, 429)인지 판단합니다. 이 경우에만 속도를 줄입니다."""
+    if isinstance(error, (PlaywrightTimeoutError, httpx.TimeoutException, ServerBusyError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return False
+
+def check_response_status(status):
+    if status is not None and (status >= 500 or status == 429):
+        raise ServerBusyError(status)
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, max_concurrency, rate=RATE_LIMIT_INITIAL, min_rate=RATE_LIMIT_MIN,
+                 max_rate=RATE_LIMIT_MAX, burst=RATE_LIMIT_BURST):
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency = self.max_concurrency
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._successes_in_row = 0
+        self._condition = asyncio.Condition()
+        self.stats = {'success': 0, 'overload': 0, 'error': 0, 'backoffs': 0, 'rampups': 0}
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    async def _acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+
+    async def _wait_for_token(self):
+        # 토큰이 생길 때까지 대기 (다른 요청은 동시 요청 슬롯을 기다리는 동안 막히지 않음)
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def _release(self):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """요청 하나를 보낼 수 있을 때까지 기다린 뒤 진입합니다. (토큰을 기다리다 취소되어도 슬롯을 돌려줌)"""
+        await self._acquire()
+        try:
+            await self._wait_for_token()
+            yield
+        finally:
+            await self._release()
+
+    def record_success(self):
+        self.stats['success'] += 1
+        self._successes_in_row += 1
+        if self._successes_in_row >= RAMP_UP_AFTER_SUCCESSES:
+            self._successes_in_row = 0
+            self.rate = min(self.max_rate, self.rate * 1.25)
+            if self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+            self.stats['rampups'] += 1
+
+    def record_failure(self, error):
+        self._successes_in_row = 0
+        if not is_overload_error(error):
+            self.stats['error'] += 1
+            return
+        self.stats['overload'] += 1
+        self.stats['backoffs'] += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.concurrency = max(1, self.concurrency // 2)
+        self._tokens = min(self._tokens, 0.0)  # 남은 토큰을 버려 바로 속도를 낮춤
+
+    def summary(self):
+        return (f"속도 {self.rate:.2f}건/초, 동시 요청 {self.concurrency}/{self.max_concurrency}, "
+                f"성공 {self.stats['success']}, 과부하 {self.stats['overload']}, 기타 오류 {self.stats['error']}")
+
+
+@contextlib.asynccontextmanager
+async def _unlimited():
+    yield
+
+def limited(rate_limiter):
+    """
+    rate_limiter 가 없으면 아무것도 하지 않는 async 컨텍스트를 돌려줍니다.
+    (contextlib.nullcontext 는 Python 3.10 부터 async with 를 지원하므로 직접 정의)
+    """
+    return rate_limiter.slot() if rate_limiter is not None else _unlimited()
+
+
+class RetryQueue:
+    def __init__(self, max_attempts=RETRY_MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self._items = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, item, attempts=1):
+        """실패한 항목을 지금까지의 시도 횟수와 함께 넣습니다. 최대 횟수를 다 쓴 항목은 넣지 않고 False를 반환합니다."""
+        if attempts >= self.max_attempts:
+            return False
+        self._items.append((item, attempts))
+        return True
+
+    def drain(self):
+        items, self._items = self._items, []
+        return items
+
+    def backoff_delay(self, attempts):
+        """시도 횟수에 따른 대기 시간 (지수 증가 + 지터)"""
+        return self.base_delay * (2 ** (attempts - 1)) * random.uniform(0.5, 1.5)
@@ -0,0 +1,232 @@
+"""
+초록/키워드 한국어 토큰화 단계와 논문ID 기준 디스크 캐시입니다.
+
+토큰화 결과는 (논문ID, 컬럼, 토크나이저) 별로 원문 해시와 함께 SQLite(.kci_cache/tokens.sqlite)에 저장되며,
+다시 실행하면 원문이 바뀌었거나 새로 추가된 문서만 다시 토큰화합니다. 다시 토큰화할 문서가 많으면
+프로세스 풀에서 나눠 처리합니다.
+
+토크나이저는 kiwipiepy 가 설치되어 있으면 형태소 분석(명사/외국어/어근)을, 없으면 정규식으로 단어를 나눈 뒤
+흔한 조사를 떼어 내는 간이 방식을 사용합니다. (KCI_TOKENIZER=kiwi|regex 로 지정 가능) 간이 방식에서 두 글자 이상 조사
+('에서/으로/에서는' 등)는 문서마다 떼어 내고, 명사의 끝 글자와 구별할 수 없는 한 글자 조사('은/는/을/를/의/과' 등)는
+tokenize_articles 가 말뭉치 전체를 보고 조사를 뗀 어간이 단독 토큰으로도 나올 때만 뗍니다.
+('연구결과를' → '연구결과', '연구결과'·'민주주의' 는 그대로)
+결과는 토큰을 공백으로 이은 문자열이므로 TF-IDF 등에서 공백 기준으로 나눠 쓰면 됩니다.
+
+    from kci_tokenize import tokenize_articles
+    tokens = tokenize_articles(df, ['키워드_상세', '초록'])
+    docs = tokens['키워드_상세'] + ' ' + tokens['초록']
+    TrendEngine(docs, df['발행년도'], token_pattern=PRETOKENIZED_PATTERN)
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from kci_dataset import DATASET_CACHE_DIR
+
+try:
+    import kiwipiepy
+except ImportError:
+    kiwipiepy = None
+
+TOKEN_CACHE_PATH = os.environ.get('KCI_TOKEN_CACHE', os.path.join(DATASET_CACHE_DIR, 'tokens.sqlite'))
+TOKENIZER = os.environ.get('KCI_TOKENIZER', 'kiwi' if kiwipiepy is not None else 'regex')
+TOKENIZE_COLUMNS = ['키워드_상세', '초록']
+# 토큰화된 문서(공백으로 이은 토큰)를 CountVectorizer 등에 넘길 때 쓰는 토큰 패턴
+PRETOKENIZED_PATTERN = r'(?u)\S+'
+# 다시 토큰화할 문서가 이보다 적으면 프로세스 풀을 띄우지 않고 바로 처리
+PARALLEL_MIN_DOCS = 500
+
+MIN_TOKEN_LENGTH = 2
+_PARTICLES = [
+    '에서는', '에서도', '으로서', '으로써', '으로는', '에게서', '이라는', '이라고', '에서의', '으로의',
+    '에서', '에게', '으로', '로서', '로써', '까지', '부터', '처럼', '보다', '라는', '이며', '에는', '에도',
+    '과의', '와의', '과는', '와는', '들이', '들을', '들의', '들은', '로의',
+    '은', '는', '을', '를', '에', '와', '과', '로', '의',
+]
+# 정규식 토크나이저: 한글 / 영문·숫자 덩어리로 나누고, 한글 단어 끝의 조사를 긴 것부터 떼어 냄 (어간은 2글자 이상)
+# 한 글자 조사로 시작하는 조사('의', '과의', '에서는' 등)는 명사의 끝 글자와 구별할 수 없으므로
+# ('연구결과', '민주주의') 문서 단위로는 떼지 않고 merge_particle_variants 가 말뭉치를 보고 뗌
+_WORD_PATTERN = re.compile(r'[a-z0-9]{%d,}|[가-힣]{%d,}' % (MIN_TOKEN_LENGTH, MIN_TOKEN_LENGTH))
+_SINGLE_PARTICLES = frozenset(p for p in _PARTICLES if len(p) == 1)
+_AMBIGUOUS_PARTICLES = sorted((p for p in _PARTICLES if p[0] in _SINGLE_PARTICLES), key=len, reverse=True)
+_SAFE_PARTICLES = sorted((p for p in _PARTICLES if p[0] not in _SINGLE_PARTICLES), key=len, reverse=True)
+# kiwi 형태소 중 남길 품사 (일반/고유 명사, 외국어, 한자, 어근)
+KIWI_TAGS = {'NNG', 'NNP', 'SL', 'SH', 'XR'}
+
+_kiwi = None
+
+
+def tokenizer_name(tokenizer=None):
+    """캐시 키에 쓰는 토크나이저 이름 (버전 포함, 바뀌면 캐시를 새로 만듦)"""
+    tokenizer = tokenizer or TOKENIZER
+    if tokenizer == 'kiwi':
+        return f'kiwi-{kiwipiepy.__version__}'
+    return 'regex-2'
+
+def _strip_long_particle(word):
+    for particle in _SAFE_PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= MIN_TOKEN_LENGTH:
+            return word[:-len(particle)]
+    return word
+
+def regex_tokenize(text):
+    """한 글자 조사로 시작하는 조사는 남겨 둡니다. (merge_particle_variants 가 말뭉치 기준으로 처리)"""
+    return [_strip_long_particle(word) for word in _WORD_PATTERN.findall(str(text).lower())]
+
+def merge_particle_variants(token_docs):
+    """
+    토큰 문자열 목록에서 한 글자 조사로 시작하는 조사('의', '과의', '에서' 등)가 붙은 토큰을, 조사를 뗀 어간이
+    말뭉치에 단독 토큰으로 있을 때만 어간으로 바꿉니다. 조사는 긴 것부터 맞춰 봅니다.
+    ('연구결과를' 과 '연구결과' 가 함께 있으면 '연구결과' 로 합치고, '연구결' 이 없으므로 '연구결과' 는 그대로 둠)
+    """
+    vocabulary = set()
+    for doc in token_docs:
+        vocabulary.update(doc.split())
+    stems = {}
+    for token in vocabulary:
+        for particle in _AMBIGUOUS_PARTICLES:
+            stem = token[:-len(particle)]
+            if token.endswith(particle) and len(stem) >= MIN_TOKEN_LENGTH and stem in vocabulary:
+                stems[token] = stem
+                break
+    if not stems:
+        return list(token_docs)
+    return [' '.join(stems.get(token, token) for token in doc.split()) for doc in token_docs]
+
+def kiwi_tokenize(text):
+    global _kiwi
+    if _kiwi is None:
+        _kiwi = kiwipiepy.Kiwi()
+    return [
+        token.form.lower() for token in _kiwi.tokenize(str(text))
+        if token.tag in KIWI_TAGS and len(token.form) >= MIN_TOKEN_LENGTH
+    ]
+
+def tokenize_text(text, tokenizer=None):
+    """텍스트 하나를 토큰 목록으로 나눕니다."""
+    if (tokenizer or TOKENIZER) == 'kiwi':
+        return kiwi_tokenize(text)
+    return regex_tokenize(text)
+
+def _tokenize_batch(args):
+    texts, tokenizer = args
+    return [' '.join(tokenize_text(text, tokenizer)) for text in texts]
+
+def content_hash(text):
+    return hashlib.sha1(str(text).encode('utf-8')).hexdigest()
+
+
+class TokenCache:
+    def __init__(self, path=TOKEN_CACHE_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tokens (
+                article_id TEXT NOT NULL,
+                field TEXT NOT NULL,                   -- 원문 컬럼 (초록, 키워드_상세 ...)
+                tokenizer TEXT NOT NULL,
+                content_hash TEXT NOT NULL,            -- 원문 sha1 (바뀌면 다시 토큰화)
+                tokens TEXT NOT NULL,                  -- 공백으로 이은 토큰
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (article_id, field, tokenizer)
+            )
+        """)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def lookup(self, field, tokenizer):
+        """{논문ID: (원문 해시, 토큰 문자열)}"""
+        rows = self.conn.execute(
+            'SELECT article_id, content_hash, tokens FROM tokens WHERE field = ? AND tokenizer = ?',
+            (field, tokenizer))
+        return {article_id: (digest, tokens) for article_id, digest, tokens in rows}
+
+    def store(self, field, tokenizer, entries):
+        """entries: (논문ID, 원문 해시, 토큰 문자열) 목록"""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO tokens (article_id, field, tokenizer, content_hash, tokens, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(article_id, field, tokenizer) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    tokens = excluded.tokens,
+                    updated_at = excluded.updated_at
+            """, [(article_id, field, tokenizer, digest, tokens, now) for article_id, digest, tokens in entries])
+
+
+def tokenize_many(texts, tokenizer=None, workers=None):
+    """텍스트 목록을 토큰 문자열 목록으로 바꿉니다. 많으면 프로세스 풀에서 나눠 처리합니다."""
+    tokenizer = tokenizer or TOKENIZER
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    if len(texts) < PARALLEL_MIN_DOCS or workers <= 1:
+        return _tokenize_batch((texts, tokenizer))
+
+    size = -(-len(texts) // (workers * 4))
+    batches = [(texts[i:i + size], tokenizer) for i in range(0, len(texts), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [tokens for batch in executor.map(_tokenize_batch, batches) for tokens in batch]
+
+def tokenize_articles(df, columns=TOKENIZE_COLUMNS, tokenizer=None, cache_path=TOKEN_CACHE_PATH,
+                      workers=None, id_column='논문ID'):
+    """
+    df 의 각 컬럼을 토큰화한 DataFrame(같은 인덱스, 값은 공백으로 이은 토큰)을 돌려줍니다.
+    캐시에 같은 논문ID/원문 해시가 있으면 그대로 쓰고, 새 문서나 원문이 바뀐 문서만 토큰화해 캐시에 기록합니다.
+    논문ID가 없는 행은 원문 해시를 키로 사용합니다. 정규식 토크나이저의 한 글자 조사는 캐시에서 읽은 뒤
+    columns 전체를 한 말뭉치로 보고 merge_particle_variants 로 뗍니다.
+    """
+    tokenizer = tokenizer or TOKENIZER
+    name = tokenizer_name(tokenizer)
+    result = pd.DataFrame(index=df.index)
+
+    with TokenCache(cache_path) as cache:
+        for column in columns:
+            texts = df[column].fillna('').astype(str).tolist()
+            digests = [content_hash(text) for text in texts]
+            ids = df[id_column].fillna('').astype(str).tolist() if id_column in df.columns else [''] * len(df)
+            keys = [article_id or f'#{digest}' for article_id, digest in zip(ids, digests)]
+
+            known = cache.lookup(column, name)
+            tokens = [None] * len(texts)
+            missing = {}
+            for position, (key, digest) in enumerate(zip(keys, digests)):
+                cached = known.get(key)
+                if cached is not None and cached[0] == digest:
+                    tokens[position] = cached[1]
+                else:
+                    # 같은 논문ID가 여러 행에 있으면 한 번만 토큰화
+                    missing.setdefault((key, digest), []).append(position)
+
+            if missing:
+                pending = list(missing)
+                computed = tokenize_many([texts[missing[entry][0]] for entry in pending], tokenizer, workers)
+                for entry, value in zip(pending, computed):
+                    for position in missing[entry]:
+                        tokens[position] = value
+                cache.store(column, name, [(key, digest, value) for (key, digest), value in zip(pending, computed)])
+                print(f"🔤 '{column}' {len(pending)}건 토큰화 (캐시 사용 {len(texts) - sum(map(len, missing.values()))}건)")
+
+            result[column] = tokens
+
+    if tokenizer == 'regex' and columns:
+        merged = merge_particle_variants([doc for column in columns for doc in result[column]])
+        for offset, column in enumerate(columns):
+            result[column] = merged[offset * len(df):(offset + 1) * len(df)]
+    return result
@@ -0,0 +1,126 @@
+"""
+전체 말뭉치를 한 번만 토큰화/벡터화해 두고 연도별 TF-IDF 트렌드와 키워드 빈도를 계산하는 엔진입니다.
+
+단어 빈도 행렬(문서 × 단어, 희소)과 문서별 연도를 보관하고, 연도 × 문서 지시 행렬을 곱해 모든 연도의
+평균 TF-IDF / 단어 빈도 합계를 한 번에 구합니다. 모든 연도가 같은 어휘와 IDF를 쓰므로 연도끼리 값을 비교할 수 있고,
+상위 단어, 단어별 시계열, 임의 키워드 빈도 질의는 이 행렬을 잘라 계산할 뿐 다시 학습하지 않습니다.
+불용어는 TF-IDF(mean_tfidf, top_terms, term_series)에서만 빠지고, 단어 빈도(term_counts, keyword_counts)는
+불용어까지 포함해 원문 그대로 셉니다.
+
+    from kci_trends import TrendEngine
+    engine = TrendEngine(df['키워드_상세'] + ' ' + df['초록'], df['발행년도'])
+    engine.top_terms(2024, k=10)
+    engine.term_series(['메타버스', '큐레이션'])
+    engine.keyword_counts(['ai', '디지털'])       # 연도 × 키워드 등장 횟수
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+
+TREND_STOP_WORDS = ["연구", "논문", "대상", "분석", "방법"]
+
+
+class TrendEngine:
+    def __init__(self, texts, years, stop_words=TREND_STOP_WORDS, **vectorizer_options):
+        """
+        texts 와 years 는 같은 길이의 문서 텍스트/연도 목록입니다. vectorizer_options 는 CountVectorizer 에
+        그대로 전달됩니다. (토큰 패턴, min_df 등) 불용어까지 벡터화한 빈도 행렬(all_counts, all_terms)에서
+        불용어 열을 뺀 것이 TF-IDF 에 쓰는 counts, terms 입니다.
+        """
+        self.vectorizer = CountVectorizer(**vectorizer_options)
+        self.stop_words = CountVectorizer(stop_words=stop_words).get_stop_words() or frozenset()
+        self.all_counts = self.vectorizer.fit_transform(pd.Series(texts).fillna('').astype(str)).tocsr()
+        self.all_terms = self.vectorizer.get_feature_names_out()
+        self._kept_columns = np.flatnonzero([term not in self.stop_words for term in self.all_terms])
+        self.terms = self.all_terms[self._kept_columns]
+        self.doc_years = np.asarray(years)
+        self._refresh()
+
+    def _refresh(self):
+        """빈도 행렬에서 TF-IDF 와 연도 지시 행렬을 다시 계산합니다. (토큰화는 하지 않음)"""
+        self.counts = self.all_counts[:, self._kept_columns]
+        self.transformer = TfidfTransformer()
+        self.tfidf = self.transformer.fit_transform(self.counts).tocsr()
+
+        self.years, year_codes = np.unique(self.doc_years, return_inverse=True)
+        self.year_sizes = np.bincount(year_codes, minlength=len(self.years))
+        # 연도 × 문서 0/1 행렬: 곱하면 연도별 합계
+        self._year_rows = sparse.csr_matrix(
+            (np.ones(len(year_codes)), (year_codes, np.arange(len(year_codes)))),
+            shape=(len(self.years), len(year_codes)))
+        self._year_positions = {year: position for position, year in enumerate(self.years.tolist())}
+        self._mean_tfidf = None
+        self._term_counts = None
+
+    def add_documents(self, texts, years):
+        """
+        기존 어휘로 새 문서를 벡터화해 덧붙입니다. 기존 문서는 다시 토큰화하지 않으며,
+        어휘에 없는 새 단어는 무시됩니다. (새 단어까지 반영하려면 TrendEngine 을 새로 만들어야 함)
+        """
+        new_counts = self.vectorizer.transform(pd.Series(texts).fillna('').astype(str))
+        self.all_counts = sparse.vstack([self.all_counts, new_counts]).tocsr()
+        self.doc_years = np.concatenate([self.doc_years, np.asarray(years)])
+        self._refresh()
+
+    def _year_position(self, year):
+        if year not in self._year_positions:
+            raise KeyError(f'{year}년 문서가 없습니다.')
+        return self._year_positions[year]
+
+    def mean_tfidf(self):
+        """연도 × 단어 평균 TF-IDF 행렬 (희소, 행 순서는 self.years)"""
+        if self._mean_tfidf is None:
+            scale = sparse.diags(1.0 / np.maximum(self.year_sizes, 1))
+            self._mean_tfidf = (scale @ self._year_rows @ self.tfidf).tocsr()
+        return self._mean_tfidf
+
+    def term_counts(self):
+        """연도 × 단어 등장 횟수 합계 행렬 (희소, 행 순서는 self.years, 열 순서는 불용어를 포함한 self.all_terms)"""
+        if self._term_counts is None:
+            self._term_counts = (self._year_rows @ self.all_counts).tocsr()
+        return self._term_counts
+
+    def top_terms(self, year, k=10, max_features=None):
+        """
+        해당 연도의 평균 TF-IDF 상위 k개 단어 (pd.Series, 큰 순).
+        max_features 를 주면 그 해에 많이 나온 단어 max_features 개 안에서만 고릅니다.
+        """
+        position = self._year_position(year)
+        scores = self.mean_tfidf()[position].toarray().ravel()
+        candidates = np.arange(len(self.terms))
+        if max_features is not None:
+            frequency = self.term_counts()[position].toarray().ravel()[self._kept_columns]
+            candidates = np.argsort(-frequency, kind='stable')[:max_features]
+        order = candidates[np.argsort(-scores[candidates], kind='stable')[:k]]
+        return pd.Series(scores[order], index=self.terms[order])
+
+    def top_terms_by_year(self, k=10, max_features=None):
+        """{연도: top_terms(연도)}"""
+        return {year: self.top_terms(year, k, max_features) for year in self.years.tolist()}
+
+    def term_series(self, terms):
+        """연도 × 단어 평균 TF-IDF DataFrame. 어휘에 없는 단어는 0."""
+        vocabulary = {term: column for column, term in enumerate(self.terms.tolist())}
+        columns = [vocabulary.get(term, -1) for term in terms]
+        mean = self.mean_tfidf()
+        values = np.zeros((len(self.years), len(terms)))
+        for position, column in enumerate(columns):
+            if column >= 0:
+                values[:, position] = mean[:, column].toarray().ravel()
+        return pd.DataFrame(values, index=self.years, columns=list(terms))
+
+    def keyword_counts(self, keywords, ignore_case=True):
+        """
+        연도 × 키워드 등장 횟수 DataFrame. 어휘의 단어마다 키워드가 들어 있는 횟수를 세어 단어 빈도에 곱해 더하므로
+        새 키워드를 물어도 문서를 다시 읽지 않습니다. 불용어도 세므로 단어 문자로만 된 키워드는 원문에서 str.count 로 센 값과 같고,
+        공백 등이 들어간 키워드(예: 'digital twin')는 단어 경계를 넘으므로 세지 못합니다.
+        """
+        terms = self.all_terms.tolist()
+        weights = np.zeros((len(terms), len(keywords)))
+        for position, keyword in enumerate(keywords):
+            keyword = keyword.lower() if ignore_case else keyword
+            weights[:, position] = [term.count(keyword) for term in terms]
+        values = self.term_counts() @ weights
+        return pd.DataFrame(np.rint(values).astype(np.int64), index=self.years, columns=list(keywords))
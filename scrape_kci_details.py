@@ -1,236 +1,617 @@
+import argparse
 import asyncio
+import contextlib
+import os
+import sys
+import time
 from playwright.async_api import async_playwright
-import pandas as pd
 import re
-
-KCI_URL = 'https://www.kci.go.kr/kciportal/po/search/poArtiSearList.kci'
+from urllib.parse import parse_qs, quote, urlparse
+
+from kci_crawl_state import CRAWL_STATE_PATH, CrawlStateStore
+from kci_detail_parser import (
+    build_article_record, build_detail_info, create_http_client, fetch_detail_html,
+    parse_detail_html, parse_detail_page, parse_search_rows_html,
+)
+from kci_metrics import METRICS_PATH, CrawlMetrics
+from kci_output import OUTPUT_CSV_PATH, StreamingArticleWriter
+from kci_page_cache import KIND_DETAIL, KIND_SEARCH, PAGE_CACHE_DIR, PageCache
+from kci_throttle import AdaptiveRateLimiter, RetryQueue, check_response_status, limited
+
+# KCI_BASE_URL 환경 변수로 로컬 테스트 서버(kci_fixture_server.py)를 가리킬 수 있습니다.
+KCI_BASE_URL = os.environ.get('KCI_BASE_URL', 'https://www.kci.go.kr')
+KCI_URL = f'{KCI_BASE_URL}/kciportal/po/search/poArtiSearList.kci'
 SEARCH_KEYWORD1 = '문화유산 OR "cultural heritage"'
 SEARCH_KEYWORD2 = '큐레이션'
+MAX_PAGES = 10 # 검색 결과를 몇 페이지까지 따라갈지
+DETAIL_CONCURRENCY = 4 # 상세 페이지를 동시에 처리할 탭 수 (1이면 기존처럼 순차 처리)
+# 상세 페이지 처리 방식: 'playwright' (브라우저 렌더링) 또는 'http' (HTTP 요청 + HTML 파싱, 실패 시 playwright로 대체)
+DETAIL_BACKEND = os.environ.get('KCI_DETAIL_BACKEND', 'playwright')
+# 진행 상태 저장소 경로 (처음부터 다시 수집하려면 파일을 삭제)
+CRAWL_STATE_PATH = os.environ.get('KCI_CRAWL_STATE', CRAWL_STATE_PATH)
+# 결과 파일 경로. KCI_OUTPUT_PARQUET 를 지정하면 타입이 지정된 Parquet 파일도 함께 기록
+OUTPUT_CSV_PATH = os.environ.get('KCI_OUTPUT_CSV', OUTPUT_CSV_PATH)
+OUTPUT_PARQUET_PATH = os.environ.get('KCI_OUTPUT_PARQUET')
+OUTPUT_BATCH_SIZE = 50 # 몇 건씩 모아서 파일에 추가할지
+# 수집한 HTML 캐시 (KCI_PAGE_CACHE_ENABLED=0 으로 끔). --replay 는 이 캐시만으로 추출을 다시 실행
+PAGE_CACHE_DIR = os.environ.get('KCI_PAGE_CACHE', PAGE_CACHE_DIR)
+USE_PAGE_CACHE = os.environ.get('KCI_PAGE_CACHE_ENABLED', '1') != '0'
+REPLAY_OUTPUT_CSV_PATH = 'kci_articles_replayed.csv'
+# 단계별 소요 시간/카운터 기록 (JSON lines, 빈 값이면 기록하지 않음). Prometheus 텍스트 형식은 경로를 지정할 때만 저장
+METRICS_PATH = os.environ.get('KCI_METRICS', METRICS_PATH)
+METRICS_PROMETHEUS_PATH = os.environ.get('KCI_METRICS_PROM')
+
+# 브라우저 프로필: 'lean' (헤드리스 + 이미지/미디어/폰트/외부 스크립트 차단) 또는 'full' (모든 리소스 로드)
+SCRAPE_PROFILE = os.environ.get('KCI_SCRAPE_PROFILE', 'lean')
+HEADLESS = os.environ.get('KCI_HEADLESS', '1') != '0' # 화면을 보며 디버깅하려면 KCI_HEADLESS=0
+LEAN_BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+# 외부(KCI 이외) 스크립트 중 차단하지 않을 호스트 (페이지 동작에 필요한 라이브러리 CDN)
+THIRD_PARTY_SCRIPT_ALLOWLIST = ('code.jquery.com', 'ajax.googleapis.com', 'cdnjs.cloudflare.com', 'cdn.jsdelivr.net')
+LEAN_LAUNCH_ARGS = [
+    '--disable-gpu', '--disable-dev-shm-usage', '--disable-extensions',
+    '--mute-audio', '--no-first-run', '--disable-background-networking',
+]
+
+# 발행년도 범위 필터 입력란 셀렉터 (검색 결과 화면의 기간 설정). 발행년도 범위로 수집(샤드 포함)하려면 세 값을
+# 모두 실제 화면에 맞게 지정해야 합니다. 지정하지 않으면 year_range 수집을 거부합니다. (행 단위 거르기만으로는 모든 샤드가
+# 같은 첫 페이지들을 받게 되어 요청만 늘고 검색 페이지 상한도 넘지 못함)
+YEAR_FILTER_FROM_SELECTOR = os.environ.get('KCI_YEAR_FROM_SELECTOR')
+YEAR_FILTER_TO_SELECTOR = os.environ.get('KCI_YEAR_TO_SELECTOR')
+YEAR_FILTER_APPLY_SELECTOR = os.environ.get('KCI_YEAR_APPLY_SELECTOR')
+
+# 준비 상태 대기별 최대 대기 시간 (ms). 고정 sleep 대신 필요한 요소가 나타나는 즉시 진행합니다.
+WAIT_TIMEOUTS = {
+    'search_form': 20000,   # 검색어 입력창
+    'search_rows': 40000,   # 검색 결과 표의 행
+    'page_change': 40000,   # 다음 페이지 클릭 후 결과 표 갱신
+    'detail_fields': 60000, # 상세 페이지의 초록/저자/키워드 블록
+}
+SEARCH_ROWS_SELECTOR = 'table.search-answer-tbl > tbody > tr'
+
+# 상세 페이지 준비 조건: 저자·초록·키워드 블록이 모두 있거나, 문서 로드가 끝났으면(누락 항목 확정) 준비 완료
+DETAIL_READY_JS = """
+() => Boolean(
+    (document.querySelector('div.author a') &&
+     document.querySelector('p#korAbst, p#folaAbst') &&
+     document.querySelector('div.innerBox.open a#keywd, div.innerBox.open p')) ||
+    document.readyState === 'complete'
+)
+"""
+
+# 검색 결과 표의 첫 행 텍스트 (페이지가 바뀌었는지 판단하는 기준)
+FIRST_ROW_JS = """
+() => {
+    const row = document.querySelector('table.search-answer-tbl > tbody > tr');
+    return row ? row.innerText : null;
+}
+"""
+
+# 단계별 소요 시간과 카운터 (run() 이 실행마다 열고 닫음)
+metrics = CrawlMetrics()
+
+async def wait_until_ready(name, wait_coro_factory, **fields):
+    """
+    준비 상태 대기를 실행하고 실제로 걸린 시간을 'wait.<name>' 단계로 기록합니다.
+    wait_coro_factory 는 WAIT_TIMEOUTS[name]을 받아 대기 코루틴을 돌려주는 함수입니다.
+    """
+    with metrics.span(f'wait.{name}', **fields):
+        return await wait_coro_factory(WAIT_TIMEOUTS[name])
 
-articles_data = []
+async def wait_for_detail_ready(detail_page, article_id=None):
+    await wait_until_ready('detail_fields', lambda timeout: detail_page.wait_for_function(
+        DETAIL_READY_JS, timeout=timeout), article_id=article_id)
+
+async def wait_for_search_rows(page):
+    await wait_until_ready('search_rows', lambda timeout: page.wait_for_selector(
+        SEARCH_ROWS_SELECTOR, timeout=timeout))
+
+async def wait_for_page_change(page, previous_first_row):
+    """
+    다음 페이지 클릭 후 결과 표의 첫 행이 이전과 달라질 때까지 기다립니다.
+    클릭이 전체 페이지 이동을 일으키면 실행 컨텍스트가 바뀌므로 제한 시간 안에서 다시 시도합니다.
+    """
+    async def wait_changed(timeout):
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            remaining_ms = max(1, int((deadline - time.perf_counter()) * 1000))
+            try:
+                return await page.wait_for_function(
+                    f'(previous) => {{ const current = ({FIRST_ROW_JS})(); return current !== null && current !== previous; }}',
+                    arg=previous_first_row, timeout=remaining_ms)
+            except Exception as e:
+                if 'context was destroyed' not in str(e) or time.perf_counter() >= deadline:
+                    raise
+                await page.wait_for_load_state('domcontentloaded')
+
+    await wait_until_ready('page_change', wait_changed)
+
+@contextlib.asynccontextmanager
+async def rate_limited(rate_limiter, **fields):
+    """limited() 와 같고, 속도 제한기에서 차례를 기다린 시간을 'detail.rate_limit_wait' 단계로 기록합니다."""
+    started = time.perf_counter()
+    async with limited(rate_limiter):
+        if rate_limiter is not None:
+            metrics.observe('detail.rate_limit_wait', time.perf_counter() - started, **fields)
+        yield
+
+def record_article_metrics(temp_article_data, succeeded, source):
+    """논문 한 건의 결과(성공/실패, 비어 있는 초록/저자/키워드)를 카운터에 더합니다."""
+    metrics.incr('articles', source=source, status='ok' if succeeded else 'failed')
+    if not succeeded:
+        return
+    for column, counter in (('초록', 'missing_abstract'), ('저자_상세', 'missing_authors'),
+                            ('키워드_상세', 'missing_keywords')):
+        if not temp_article_data.get(column):
+            metrics.incr(counter, source=source)
+
+# 상세 페이지의 초록/저자/키워드 원문을 한 번의 evaluate 호출로 모으는 스크립트
+# (결과 형식은 kci_detail_parser.build_detail_info 의 raw_fields 와 동일)
+DETAIL_FIELDS_JS = """
+() => {
+    const texts = (nodes) => Array.from(nodes, (el) => el.textContent);
+    const normalize = (text) => text.replace(/\\s+/g, ' ').trim().toLowerCase();
+    // 'div.innerBox.open' 중 '키워드'/'Keywords' 문구가 있는 p 또는 a#keywd 를 가진 첫 섹션
+    const section = Array.from(document.querySelectorAll('div.innerBox.open')).find((box) =>
+        box.querySelector('a#keywd') ||
+        Array.from(box.querySelectorAll('p')).some((p) => {
+            const text = normalize(p.textContent);
+            return text.includes('키워드') || text.includes('keywords');
+        })
+    );
+    return {
+        abstracts: texts(document.querySelectorAll('p#korAbst, p#folaAbst')),
+        authors: texts(document.querySelectorAll('div.author a')),
+        keyword_section: section ? {
+            english: texts(section.querySelectorAll('a#keywd')),
+            paragraphs: texts(section.querySelectorAll('p')),
+        } : null,
+    };
+}
+"""
+
+# 검색 결과 행마다 상세 링크(href, 제목)와 hidden input 값을 한 번의 호출로 모으는 스크립트
+SEARCH_ROWS_JS = """
+(rows) => rows.map((row) => {
+    const link = row.querySelector('a.subject') || row.querySelector('a[href*="ciSereArtiView"]');
+    const inputs = {};
+    for (const input of row.querySelectorAll("input[type='hidden']")) {
+        inputs[input.getAttribute('name')] = input.getAttribute('value');
+    }
+    return {
+        href: link ? link.getAttribute('href') : null,
+        title: link ? link.textContent : null,
+        inputs: inputs,
+    };
+})
+"""
 
 async def extract_detail_info(detail_page):
     """
     논문 상세 페이지에서 초록, 저자_상세, 키워드_상세 정보를 추출합니다.
-    제공된 HTML 스니펫을 기반으로 셀렉터를 세밀하게 조정했습니다.
+    필요한 원문을 DETAIL_FIELDS_JS 로 한 번에 가져온 뒤, 정제 규칙(저자 정규식, 국문/영문 키워드 결합)은
+    HTTP 백엔드와 같은 kci_detail_parser.build_detail_info 로 파이썬에서 적용합니다.
     """
-    abstract_text = ""
-    authors_full_list = ""
-    keywords_combined = ""
+    try:
+        raw_fields = await detail_page.evaluate(DETAIL_FIELDS_JS)
+    except Exception as e:
+        metrics.incr('extract_errors', error=type(e).__name__)
+        print(f"    ❌ 상세 정보 추출 실패: {e}")
+        return "", "", ""
+
+    abstract_text, authors_full_list, keywords_combined = build_detail_info(raw_fields)
+
+    if not abstract_text:
+        print("    ⚠️ 초록 내용을 찾지 못했습니다.")
+    if not raw_fields.get('authors'):
+        print("    ⚠️ 저자 정보 (div.author a)를 찾을 수 없습니다.")
+    if not keywords_combined:
+        print("    ⚠️ 키워드 섹션을 찾았으나 추출된 키워드가 없습니다.")
+
+    return abstract_text, authors_full_list, keywords_combined
+
+def search_query():
+    return f'{SEARCH_KEYWORD1} {SEARCH_KEYWORD2}'
+
+def search_cache_key(query, page_num='', year_range=None):
+    """검색 결과 페이지는 URL이 바뀌지 않으므로 검색어(와 발행년도 범위), 페이지 번호로 캐시 키를 만듭니다."""
+    years = f'&years={year_range[0]}-{year_range[1]}' if year_range else ''
+    return f'{KCI_URL}?query={quote(query)}{years}&page={page_num}'
+
+def search_cache_prefix(query):
+    """검색어 하나의 캐시 키 공통 앞부분 (발행년도 샤드별로 수집한 페이지도 포함)"""
+    return f'{KCI_URL}?query={quote(query)}&'
+
+def parse_search_cache_key(url):
+    """search_cache_key 로 만든 키 → (발행년도 범위 또는 None, 페이지 번호)"""
+    params = parse_qs(urlparse(url).query)
+    years = params.get('years', [''])[0]
+    year_range = tuple(int(year) for year in years.split('-')) if years else None
+    return year_range, int(params.get('page', ['0'])[0] or 0)
 
-    # --- 1. 초록 추출 (국문/영문 모두 포함) ---
+def in_year_range(record, year_range):
+    if not year_range:
+        return True
     try:
-        # ID가 korAbst 또는 folaAbst인 모든 p 태그를 찾음
-        abstract_locators = detail_page.locator('p#korAbst, p#folaAbst') 
-        
-        extracted_abstracts = []
-        for i in range(await abstract_locators.count()):
-            content = await abstract_locators.nth(i).text_content()
-            if content.strip(): 
-                extracted_abstracts.append(content.strip())
-        
-        abstract_text = "\n".join(extracted_abstracts) # 국문/영문 초록을 줄바꿈으로 연결
-        if not abstract_text:
-            print("    ⚠️ 초록 내용을 찾지 못했습니다.")
+        return year_range[0] <= int(record['발행년도']) <= year_range[1]
+    except ValueError:
+        return False
 
-    except Exception as e:
-        print(f"    ❌ 초록 추출 실패: {e}")
+def year_filter_available():
+    return bool(YEAR_FILTER_FROM_SELECTOR and YEAR_FILTER_TO_SELECTOR and YEAR_FILTER_APPLY_SELECTOR)
+
+def require_year_filter():
+    if not year_filter_available():
+        raise RuntimeError("발행년도 범위로 수집하려면 KCI_YEAR_FROM_SELECTOR/KCI_YEAR_TO_SELECTOR/"
+                           "KCI_YEAR_APPLY_SELECTOR 를 검색 결과 화면의 기간 필터에 맞게 지정해야 합니다.")
+
+async def apply_year_filter(page, year_range):
+    """
+    검색 결과 화면의 발행년도 기간 필터를 적용합니다. (셀렉터가 없으면 RuntimeError)
+    필터를 적용한 뒤에도 extract_page_articles 는 행의 발행년도로 한 번 더 거릅니다.
+    """
+    require_year_filter()
+    await page.fill(YEAR_FILTER_FROM_SELECTOR, str(year_range[0]))
+    await page.fill(YEAR_FILTER_TO_SELECTOR, str(year_range[1]))
+    previous_first_row = await page.evaluate(FIRST_ROW_JS)
+    await page.click(YEAR_FILTER_APPLY_SELECTOR)
+    await wait_for_page_change(page, previous_first_row)
+    return True
+
+def is_first_party(url):
+    host = urlparse(url).hostname or ''
+    kci_host = urlparse(KCI_BASE_URL).hostname or ''
+    return host == kci_host or host.endswith('.kci.go.kr')
+
+async def block_heavy_resources(route):
+    """텍스트 추출에 필요 없는 이미지/미디어/폰트와 외부 스크립트(분석 도구 등) 요청을 중단합니다."""
+    request = route.request
+    if request.resource_type in LEAN_BLOCKED_RESOURCE_TYPES:
+        return await route.abort()
+    if request.resource_type == 'script' and not is_first_party(request.url):
+        host = urlparse(request.url).hostname or ''
+        if not host.endswith(THIRD_PARTY_SCRIPT_ALLOWLIST):
+            return await route.abort()
+    await route.continue_()
+
+async def launch_browser(playwright):
+    """
+    SCRAPE_PROFILE 에 맞춰 브라우저와 공유 컨텍스트를 만듭니다.
+    검색 페이지와 상세 페이지 탭이 모두 같은 컨텍스트를 사용하므로 세션 쿠키와 연결을 함께 씁니다.
+    """
+    lean = SCRAPE_PROFILE == 'lean'
+    browser = await playwright.chromium.launch(headless=HEADLESS, args=LEAN_LAUNCH_ARGS if lean else None)
+    context = await browser.new_context(
+        viewport={'width': 1280, 'height': 800},
+        locale='ko-KR',
+        service_workers='block' if lean else 'allow',
+    )
+    if lean:
+        await context.route('**/*', block_heavy_resources)
+    return browser, context
+
+async def create_page_pool(browser, size):
+    """
+    상세 페이지 처리에 재사용할 탭(page)을 size개 만들어 큐에 담아 반환합니다.
+    browser 자리에는 Browser 또는 공유 BrowserContext 를 넘길 수 있습니다.
+    """
+    page_pool = asyncio.Queue()
+    for _ in range(max(1, size)):
+        page_pool.put_nowait(await browser.new_page())
+    return page_pool
+
+async def close_page_pool(page_pool):
+    while not page_pool.empty():
+        detail_page = page_pool.get_nowait()
+        try:
+            await detail_page.close()
+        except:
+            pass
 
-    # --- 2. 저자 목록 추출 (저자 중복 제거 및 정제) ---
+async def fetch_article_detail(browser, page_pool, index, temp_article_data, full_detail_url, page_cache=None,
+                               rate_limiter=None):
+    """
+    풀에서 탭 하나를 빌려 상세 페이지 정보를 채워 넣고, 작업이 끝나면 탭을 풀에 돌려줍니다.
+    성공하면 True, 실패하면 False를 반환합니다.
+    """
+    article_id = temp_article_data['논문ID']
+    with metrics.span('detail.tab_wait', article_id=article_id):
+        detail_page = await page_pool.get()
     try:
-        all_authors = []
-        # 'div.author' 내에 있는 모든 'a' 태그 (저자 링크)를 찾습니다.
-        # 이 셀렉터는 'div.author'가 저자 그룹의 컨테이너이며, 그 안에 각 저자 링크가 있음을 가정합니다.
-        author_links = detail_page.locator('div.author a') 
-        
-        if await author_links.count() > 0:
-            for i in range(await author_links.count()):
-                author_link = author_links.nth(i)
-                author_name_raw = await author_link.text_content()
-                
-                # 불필요한 공백, 줄바꿈, 이름 뒤의 숫자나 이메일 패턴을 제거
-                author_name_cleaned = re.sub(r'\s*\d+(\s*@\S+)?$', '', author_name_raw).strip() 
-                
-                # 국문/영문 이름이 '/'로 구분된 경우, 국문 이름만 취함
-                if '/' in author_name_cleaned:
-                    author_name_cleaned = author_name_cleaned.split('/')[0].strip()
-
-                if author_name_cleaned: # 비어있지 않은 이름만 추가
-                    all_authors.append(author_name_cleaned)
-            
-            # 추출된 저자 목록에서 중복을 제거하고 알파벳/가나다 순으로 정렬 후 문자열로 합칩니다.
-            authors_full_list = "; ".join(sorted(list(set(all_authors)))) 
-        else:
-            print("    ⚠️ 저자 정보 (div.author a)를 찾을 수 없습니다.")
+        print(f"    ↗️ [{index+1}] 상세 페이지 이동: '{temp_article_data['제목']}'")
+        async with rate_limited(rate_limiter, article_id=article_id):
+            with metrics.span('detail.goto', article_id=article_id):
+                response = await detail_page.goto(full_detail_url, wait_until='domcontentloaded', timeout=60000) 
+            check_response_status(response.status if response is not None else None)
+            await wait_for_detail_ready(detail_page, article_id)
+        if rate_limiter is not None:
+            rate_limiter.record_success()
+
+        with metrics.span('detail.extract', article_id=article_id):
+            detail_abstract, detail_authors, detail_keywords = await extract_detail_info(detail_page)
+        if page_cache is not None:
+            with metrics.span('detail.cache_write', article_id=article_id):
+                page_cache.put(full_detail_url, await detail_page.content(), KIND_DETAIL, article_id)
+        temp_article_data['초록'] = detail_abstract
+        temp_article_data['저자_상세'] = detail_authors
+        temp_article_data['키워드_상세'] = detail_keywords
+        print(f"    ✅ [{index+1}] 상세 정보 추출 완료: 저자_상세='{detail_authors[:50]}...' 키워드='{detail_keywords[:50]}...'")
+        return True
 
     except Exception as e:
-        print(f"    ❌ 저자 목록 추출 실패: {e}")
-
-    # --- 3. 키워드 추출 (영어 키워드 및 한글 키워드 모두 포함) ---
+        if rate_limiter is not None:
+            rate_limiter.record_failure(e)
+        metrics.incr('detail_errors', error=type(e).__name__)
+        print(f"  ❌ [{index+1}] 상세 페이지 이동 또는 추출 실패 (오류: {e})")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    finally:
+        # 탭이 닫혔거나 죽었으면 새 탭으로 교체해서 풀 크기를 유지
+        if detail_page.is_closed():
+            detail_page = await browser.new_page()
+        page_pool.put_nowait(detail_page)
+
+async def fetch_article_detail_http(http_client, browser, page_pool, index, temp_article_data, full_detail_url,
+                                    page_cache=None, rate_limiter=None, browser_fallback=True):
+    """
+    브라우저 없이 HTTP 요청으로 상세 정보를 채웁니다.
+    요청이 실패하거나 응답에 저자 목록/초록 영역 블록이 없으면(오류 페이지, 스크립트로 그리는 페이지 등)
+    Playwright 탭 풀로 다시 시도합니다. 키워드나 초록 값이 비어 있기만 한 논문은 그대로 사용합니다.
+    browser_fallback=False 이면 브라우저 없이 실패(False)로 처리합니다. (탭 풀이 없는 벤치마크 등)
+    """
+    article_id = temp_article_data['논문ID']
     try:
-        english_keywords = []
-        korean_keywords_text = ""
-        
-        # 키워드 섹션 컨테이너를 찾기 위한 여러 셀렉터 시도 (HTML 구조 다양성에 대응)
-        # `p` 태그 내에 '키워드' 또는 'Keywords' 텍스트를 포함하는 innerBox를 우선 찾거나,
-        # 'a#keywd'를 가진 innerBox를 찾음
-        keywords_section_locator = detail_page.locator(
-            'div.innerBox.open:has(p:has-text("키워드")), ' 
-            'div.innerBox.open:has(p:has-text("Keywords")), '
-            'div.innerBox.open:has(a#keywd)'
-        )
-        
-        if await keywords_section_locator.count() > 0:
-            target_keywords_section = keywords_section_locator.first
-
-            # 영어 키워드 (a#keywd) 추출
-            english_keywd_locators = target_keywords_section.locator('a#keywd')
-            for i in range(await english_keywd_locators.count()):
-                keyword = await english_keywd_locators.nth(i).text_content()
-                english_keywords.append(keyword.strip())
-            
-            # 한글 키워드 (<p> 태그) 추출 (유연하게)
-            korean_keywd_p_locators = target_keywords_section.locator('p')
-            for i in range(await korean_keywd_p_locators.count()):
-                p_text = await korean_keywd_p_locators.nth(i).text_content()
-                # 한글 포함, 길이 10자 이상, '초록/저자'와 같은 불필요한 단어가 없는 텍스트 필터링
-                if re.search(r'[가-힣]', p_text) and len(p_text) > 10 and \
-                   not any(phrase in p_text for phrase in ['초록', '저자', 'abstract', 'author', '본 논문은']): 
-                    korean_keywords_text = p_text.strip()
-                    break 
-            
-            # 한글 키워드 정제: 쉼표를 세미콜론으로 변환 및 공백 제거
-            if korean_keywords_text:
-                korean_keywords_text = korean_keywords_text.replace(' ', '').replace(',', ';')
-                korean_keywords_text = ';'.join(filter(None, korean_keywords_text.split(';')))
-
-            # 영문 키워드와 국문 키워드를 결합
-            if english_keywords and korean_keywords_text:
-                keywords_combined = "; ".join(english_keywords) + ";" + korean_keywords_text
-            elif english_keywords:
-                keywords_combined = "; ".join(english_keywords)
-            elif korean_keywords_text:
-                keywords_combined = korean_keywords_text
-            
-            # 최종 정제: 중복 세미콜론 제거 및 양쪽 공백 제거
-            keywords_combined = ';'.join(filter(None, keywords_combined.split(';')))
-            keywords_combined = re.sub(r';\s*;', ';', keywords_combined).strip()
-
-        if not keywords_combined:
-             print("    ⚠️ 키워드 섹션을 찾았으나 추출된 키워드가 없습니다.")
-        
+        async with rate_limited(rate_limiter, article_id=article_id):
+            with metrics.span('detail.http_get', article_id=article_id):
+                detail_html = await fetch_detail_html(http_client, full_detail_url)
+        if rate_limiter is not None:
+            rate_limiter.record_success()
+        with metrics.span('detail.parse', article_id=article_id):
+            (detail_abstract, detail_authors, detail_keywords), missing_blocks = parse_detail_page(detail_html)
     except Exception as e:
-        print(f"    ❌ 키워드 추출 실패: {e}")
-
-    return abstract_text, authors_full_list, keywords_combined
+        if rate_limiter is not None:
+            rate_limiter.record_failure(e)
+        if not browser_fallback:
+            metrics.incr('detail_errors', error=type(e).__name__)
+            print(f"  ❌ [{index+1}] HTTP 상세 페이지 요청 실패 (오류: {e})")
+            return False
+        metrics.incr('http_fallbacks', reason=type(e).__name__)
+        print(f"    ⚠️ [{index+1}] HTTP 상세 페이지 요청 실패, 브라우저로 재시도합니다. (오류: {e})")
+        return await fetch_article_detail(
+            browser, page_pool, index, temp_article_data, full_detail_url, page_cache, rate_limiter)
+
+    if missing_blocks and not browser_fallback:
+        metrics.incr('detail_errors', error='missing_blocks')
+        print(f"  ❌ [{index+1}] HTTP 응답에 상세 페이지 블록({', '.join(missing_blocks)})이 없습니다.")
+        return False
+    if missing_blocks:
+        metrics.incr('http_fallbacks', reason='missing_blocks')
+        print(f"    ⚠️ [{index+1}] HTTP 응답에 상세 페이지 블록({', '.join(missing_blocks)})이 없어 브라우저로 재시도합니다.")
+        return await fetch_article_detail(
+            browser, page_pool, index, temp_article_data, full_detail_url, page_cache, rate_limiter)
+
+    if page_cache is not None:
+        with metrics.span('detail.cache_write', article_id=article_id):
+            page_cache.put(full_detail_url, detail_html, KIND_DETAIL, article_id)
+
+    temp_article_data['초록'] = detail_abstract
+    temp_article_data['저자_상세'] = detail_authors
+    temp_article_data['키워드_상세'] = detail_keywords
+    print(f"    ✅ [{index+1}] 상세 정보 추출 완료 (HTTP): 저자_상세='{detail_authors[:50]}...' 키워드='{detail_keywords[:50]}...'")
+    return True
+
+async def fetch_one_article(browser, page_pool, http_client, page_cache, rate_limiter, index, temp_article_data,
+                            full_detail_url, browser_fallback=True):
+    """
+    상세 정보를 캐시 → HTTP(설정 시) → 브라우저 순서로 채웁니다. 성공하면 True.
+    browser_fallback=False 이면 HTTP 로 처리하지 못한 논문을 브라우저로 다시 시도하지 않습니다.
+    논문 한 건 전체 시간은 'article' 단계로, 결과와 비어 있는 항목은 카운터로 기록합니다.
+    """
+    if not full_detail_url:
+        return True
+
+    with metrics.span('article', article_id=temp_article_data['논문ID']) as fields:
+        cached_html = page_cache.get(full_detail_url) if page_cache is not None else None
+        if cached_html is not None:
+            # 캐시에 저장된 상세 페이지가 있으면 네트워크 없이 파싱
+            fields['source'] = 'cache'
+            temp_article_data['초록'], temp_article_data['저자_상세'], temp_article_data['키워드_상세'] = \
+                parse_detail_html(cached_html)
+            print(f"    📦 [{index+1}] 캐시된 상세 페이지 사용: '{temp_article_data['제목']}'")
+            succeeded = True
+        elif http_client is not None:
+            fields['source'] = 'http'
+            succeeded = await fetch_article_detail_http(
+                http_client, browser, page_pool, index, temp_article_data, full_detail_url, page_cache, rate_limiter,
+                browser_fallback)
+        else:
+            fields['source'] = 'playwright'
+            succeeded = await fetch_article_detail(
+                browser, page_pool, index, temp_article_data, full_detail_url, page_cache, rate_limiter)
+        fields['succeeded'] = succeeded
+    record_article_metrics(temp_article_data, succeeded, fields['source'])
+    return succeeded
+
+def record_crawl_state(crawl_state, temp_article_data, full_detail_url, succeeded):
+    """추출이 끝나는 즉시 상태 저장소에 기록합니다. (중단되어도 다음 실행에서 이어서 진행)"""
+    article_id = temp_article_data['논문ID']
+    if crawl_state is None or not article_id:
+        return
+    if succeeded:
+        crawl_state.mark_done(article_id, temp_article_data, full_detail_url)
+    else:
+        crawl_state.mark_failed(article_id, temp_article_data, full_detail_url, error='상세 페이지 추출 실패')
+
+async def extract_page_articles(page, browser, page_pool=None, http_client=None, crawl_state=None, writer=None,
+                                page_cache=None, year_range=None, rate_limiter=None, retry_queue=None): 
+    """
+    검색 결과 한 페이지의 논문을 추출해 검색 순서대로 writer 에 기록하고, 해당 페이지의 레코드 목록을 반환합니다.
+    year_range=(시작년도, 끝년도)를 주면 범위 밖의 논문은 상세 페이지를 열지 않고 건너뜁니다.
+    retry_queue 를 주면 실패한 논문은 건너뛰지 않고 큐에 넣어 수집이 끝난 뒤 다시 처리합니다.
+    """
+    with metrics.span('search.rows') as fields:
+        rows = page.locator(SEARCH_ROWS_SELECTOR)
+        count = await rows.count()
+        print(f"📄 페이지 내 논문 수: {count}")
+
+        # --- 1. 검색 결과 행에서 기본 정보와 상세 페이지 URL을 검색 순서대로 수집 ---
+        collected = []
+        if count > 0:
+            # 링크 엘리먼트가 화면에 나타날 때까지 확실히 대기한 뒤, 모든 행을 한 번에 읽음
+            await rows.locator('a.subject, a[href*="ciSereArtiView"]').first.wait_for(state='visible', timeout=20000)
+            row_fields = await rows.evaluate_all(SEARCH_ROWS_JS)
+        else:
+            row_fields = []
+        fields['rows'] = len(row_fields)
 
-async def extract_page_articles(page, browser): 
-    rows = page.locator('table.search-answer-tbl > tbody > tr')
-    count = await rows.count()
-    print(f"📄 페이지 내 논문 수: {count}")
+    for i, fields in enumerate(row_fields):
+        if fields['href'] is None and fields['title'] is None:
+            print(f"  ❌ [{i+1}] 논문 상세 페이지 링크를 찾을 수 없습니다. 건너뜁니다.")
+            continue
 
-    for i in range(count):
-        detail_page = None 
-        try:
-            row = rows.nth(i)
-            # 논문 상세 페이지로 연결되는 링크 찾기
-            article_link_locator = row.locator('a.subject')
-            
-            if await article_link_locator.count() == 0: # 대체 셀렉터
-                 article_link_locator = row.locator('a[href*="ciSereArtiView"]')
-
-            # 링크 엘리먼트가 화면에 나타날 때까지 확실히 대기 (타임아웃 증가)
-            await article_link_locator.first.wait_for(state='visible', timeout=20000) 
-
-            if await article_link_locator.count() == 0:
-                print(f"  ❌ [{i+1}] 논문 상세 페이지 링크를 찾을 수 없습니다. 건너뜁니다.")
-                continue
-
-            article_link_el = article_link_locator.first
-            article_url_path = await article_link_el.get_attribute('href')
-            article_title_on_search_page = await article_link_el.text_content()
-
-            # --- 검색 결과 페이지에서 기본 정보 추출 ---
-            inputs = row.locator("input[type='hidden']")
-            input_count = await inputs.count()
-            data_dict = {}
-            for j in range(input_count):
-                input_el = inputs.nth(j)
-                name = await input_el.get_attribute('name')
-                value = await input_el.get_attribute('value')
-                data_dict[name] = value
-
-            temp_article_data = {
-                '제목': data_dict.get('R_INDE_TITL', '') or article_title_on_search_page.strip(),
-                '저널명': data_dict.get('R_SERE_NM', ''),
-                '발행기관': data_dict.get('R_PUBI_INSI_NM', ''),
-                '권': data_dict.get('R_VOL', ''),
-                '호': data_dict.get('R_ISSE', ''),
-                '시작페이지': data_dict.get('R_ST_PG', ''),
-                '종료페이지': data_dict.get('R_END_PG', ''),
-                '발행년도': data_dict.get('R_PUBI_DT', '')[:4],
-                '주제분야': data_dict.get('R_MAJOR', ''),
-                '인용횟수': data_dict.get('R_CITATED_IDX', ''),
-                '논문ID': data_dict.get('R_SYST_LOCA_ID1', ''),
-                '초록': '',        
-                '저자_상세': '',   
-                '키워드_상세': '' 
-            }
-            temp_article_data['저자'] = data_dict.get('R_CRET_NM', '')
-
-
-            if article_url_path:
-                full_detail_url = "https://www.kci.go.kr" + article_url_path
-                print(f"    ↗️ 새로운 페이지에서 상세 페이지 이동: '{temp_article_data['제목']}'")
-                
-                detail_page = await browser.new_page() 
-                await detail_page.goto(full_detail_url, wait_until='domcontentloaded', timeout=60000) 
-                await detail_page.wait_for_load_state('networkidle', timeout=60000) 
-                await detail_page.wait_for_timeout(2000) 
-
-                detail_abstract, detail_authors, detail_keywords = await extract_detail_info(detail_page)
-                temp_article_data['초록'] = detail_abstract
-                temp_article_data['저자_상세'] = detail_authors
-                temp_article_data['키워드_상세'] = detail_keywords
-                print(f"    ✅ 상세 정보 추출 완료: 저자_상세='{detail_authors[:50]}...' 키워드='{detail_keywords[:50]}...'")
-
-                await detail_page.close() 
-                detail_page = None 
-            
-            articles_data.append(temp_article_data)
-            print(f"  ✅ [{i+1}] '{temp_article_data.get('제목', '')}' 추출 완료")
+        # --- 검색 결과 페이지에서 기본 정보 추출 ---
+        temp_article_data = build_article_record(fields['inputs'], fields['title'])
+        if not in_year_range(temp_article_data, year_range):
+            continue
+        article_url_path = fields['href']
+        full_detail_url = KCI_BASE_URL + article_url_path if article_url_path else None
+        collected.append((i, temp_article_data, full_detail_url))
+
+    # --- 2. 상세 페이지는 탭 풀(또는 HTTP 클라이언트)을 통해 병렬로 처리 ---
+    owns_pool = page_pool is None
+    if owns_pool:
+        page_pool = await create_page_pool(browser, DETAIL_CONCURRENCY)
+    owns_client = DETAIL_BACKEND == 'http' and http_client is None
+    if owns_client:
+        http_client = create_http_client(DETAIL_CONCURRENCY)
+
+    async def process(i, temp_article_data, full_detail_url):
+        article_id = temp_article_data['논문ID']
+        if crawl_state is not None and article_id and crawl_state.is_done(article_id):
+            temp_article_data.update(crawl_state.get_record(article_id))
+            metrics.incr('articles_skipped')
+            print(f"    ⏭️ [{i+1}] 이미 완료된 논문입니다. 저장된 정보를 사용합니다: '{temp_article_data['제목']}'")
+            return True
+
+        succeeded = await fetch_one_article(
+            browser, page_pool, http_client, page_cache, rate_limiter, i, temp_article_data, full_detail_url)
+        record_crawl_state(crawl_state, temp_article_data, full_detail_url, succeeded)
+        return succeeded
 
-        except Exception as e:
-            print(f"  ❌ [{i+1}] 논문 추출 또는 상세 페이지 이동 실패 (오류: {e})")
-            import traceback
-            traceback.print_exc()
-            if detail_page: 
-                try:
-                    await detail_page.close()
-                except:
-                    pass
+    try:
+        results = await asyncio.gather(*(process(*item) for item in collected))
+    finally:
+        if owns_pool:
+            await close_page_pool(page_pool)
+        if owns_client:
+            await http_client.aclose()
+
+    # --- 3. 병렬 처리 완료 순서와 무관하게 검색 결과 순서대로 저장 ---
+    page_records = []
+    for (i, temp_article_data, full_detail_url), succeeded in zip(collected, results):
+        if not succeeded:
+            if retry_queue is not None:
+                retry_queue.add((i, temp_article_data, full_detail_url))
+                metrics.incr('retries_queued')
+                print(f"  🔁 [{i+1}] 재시도 큐에 추가: '{temp_article_data.get('제목', '')}'")
             continue
+        page_records.append(temp_article_data)
+        if writer is not None:
+            writer.write(temp_article_data)
+        print(f"  ✅ [{i+1}] '{temp_article_data.get('제목', '')}' 추출 완료")
+    return page_records
+
+async def process_retry_queue(retry_queue, browser, page_pool, http_client, crawl_state, writer, page_cache,
+                              rate_limiter):
+    """
+    재시도 큐의 논문을 대기 시간(지수 증가 + 지터)을 두고 다시 처리합니다. 최대 시도 횟수를 넘긴 논문은
+    실패로 남겨 두고 다음 실행에서 다시 시도합니다. 재시도로 성공한 논문은 결과 파일 끝에 추가됩니다.
+    """
+    while len(retry_queue):
+        items = retry_queue.drain()
+        print(f"\n🔁 실패한 논문 {len(items)}건 재시도 중... ({rate_limiter.summary() if rate_limiter else ''})")
+
+        async def retry(item, attempts):
+            i, temp_article_data, full_detail_url = item
+            with metrics.span('retry.backoff', article_id=temp_article_data['논문ID'], attempts=attempts):
+                await asyncio.sleep(retry_queue.backoff_delay(attempts))
+            succeeded = await fetch_one_article(
+                browser, page_pool, http_client, page_cache, rate_limiter, i, temp_article_data, full_detail_url)
+            record_crawl_state(crawl_state, temp_article_data, full_detail_url, succeeded)
+            return succeeded
+
+        results = await asyncio.gather(*(retry(item, attempts) for item, attempts in items))
+        for (item, attempts), succeeded in zip(items, results):
+            temp_article_data = item[1]
+            if succeeded:
+                writer.write(temp_article_data)
+                print(f"  ✅ 재시도 성공: '{temp_article_data.get('제목', '')}'")
+            elif not retry_queue.add(item, attempts + 1):
+                metrics.incr('retries_exhausted')
+                print(f"  ❌ {attempts + 1}회 시도(재시도 {attempts}회) 모두 실패: '{temp_article_data.get('제목', '')}'")
+
+async def run(query=None, year_range=None, max_pages=MAX_PAGES, output_csv=None, crawl_state_path=None):
+    """
+    검색어 하나(와 선택적인 발행년도 범위)를 검색해 결과 페이지를 max_pages 까지 따라가며 수집합니다.
+    인자를 생략하면 모듈 상단의 설정값(SEARCH_KEYWORD1/2, OUTPUT_CSV_PATH, CRAWL_STATE_PATH)을 사용합니다.
+    수집 도중 오류가 나면 그때까지의 결과와 진행 상태를 저장하고 자원을 정리한 뒤 예외를 다시 던집니다.
+    (샤드 수집이 중단된 샤드를 완료로 잘못 보고하지 않도록)
+    """
+    query = query or search_query()
+    output_csv = output_csv or OUTPUT_CSV_PATH
+    crawl_state_path = crawl_state_path or CRAWL_STATE_PATH
+    if year_range:
+        require_year_filter() # 브라우저를 띄우기 전에 확인
 
-async def run():
     async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(headless=False)
-        page = await browser.new_page() # 메인 검색 결과 페이지
+        browser, context = await launch_browser(playwright)
+        page = await context.new_page() # 메인 검색 결과 페이지
+        page_pool = await create_page_pool(context, DETAIL_CONCURRENCY) # 상세 페이지용 재사용 탭 풀
+        http_client = None
+        crawl_state = CrawlStateStore(crawl_state_path) # 논문ID별 진행 상태 (재실행 시 이어서 진행)
+        print(f"💾 진행 상태 저장소: {crawl_state_path} {crawl_state.counts()}")
+        # 진행 상태가 남아 있으면 이어서 수집하는 실행이므로 이전 결과를 지우지 않고 이어 씀
+        writer = StreamingArticleWriter(output_csv, OUTPUT_PARQUET_PATH, batch_size=OUTPUT_BATCH_SIZE,
+                                        append=bool(crawl_state.counts()))
+        if writer.existing:
+            print(f"📎 이전 실행 결과 {writer.existing}건에 이어서 저장합니다: {output_csv}")
+        page_cache = PageCache(PAGE_CACHE_DIR) if USE_PAGE_CACHE else None
+        rate_limiter = AdaptiveRateLimiter(DETAIL_CONCURRENCY) # 사이트 상태에 따라 요청 속도/동시 요청 수 조절
+        retry_queue = RetryQueue()
+        metrics.open(METRICS_PATH, query=query, year_range=year_range, backend=DETAIL_BACKEND,
+                     concurrency=DETAIL_CONCURRENCY, profile=SCRAPE_PROFILE)
 
         try:
-            await page.goto(KCI_URL)
-            await page.wait_for_load_state('load')
-            await page.wait_for_timeout(1000)
+            await page.goto(KCI_URL, wait_until='domcontentloaded')
+            await wait_until_ready('search_form', lambda timeout: page.wait_for_selector(
+                '#topKeyword', state='visible', timeout=timeout))
 
-            await page.fill('#topKeyword', f'{SEARCH_KEYWORD1} {SEARCH_KEYWORD2}')
+            await page.fill('#topKeyword', query)
+            # 검색 전 화면에 남아 있는 표가 있을 수 있으므로 결과 표가 새로 바뀔 때까지 대기
+            previous_first_row = await page.evaluate(FIRST_ROW_JS)
             await page.click('button.searchbtn')
-            await page.wait_for_load_state('networkidle')
-            await page.wait_for_timeout(3000)
+            await wait_for_page_change(page, previous_first_row)
+            if year_range:
+                await apply_year_filter(page, year_range)
 
-            for page_num in range(1, 11): 
+            if DETAIL_BACKEND == 'http':
+                # 브라우저 세션 쿠키를 HTTP 클라이언트와 공유
+                cookies = {c['name']: c['value'] for c in await page.context.cookies()}
+                http_client = create_http_client(DETAIL_CONCURRENCY, cookies=cookies)
+
+            for page_num in range(1, max_pages + 1): 
                 print(f"\n--- 📄 검색 결과 {page_num}페이지 처리 중... ---")
-                await page.wait_for_selector('table.search-answer-tbl > tbody > tr', timeout=40000)
-                
-                await extract_page_articles(page, browser)
+                with metrics.span('search.page', page=page_num) as fields:
+                    await wait_for_search_rows(page)
+                    if page_cache is not None:
+                        page_cache.put(search_cache_key(query, page_num, year_range), await page.content(), KIND_SEARCH, seq=page_num)
+
+                    page_records = await extract_page_articles(
+                        page, context, page_pool, http_client, crawl_state, writer, page_cache, year_range,
+                        rate_limiter, retry_queue)
+                    fields['articles'] = len(page_records)
+                metrics.incr('search_pages')
 
                 next_button = page.get_by_role("link", name=" 다음페이지") 
                 
@@ -241,9 +622,9 @@ async def run():
                 if await next_button.count() > 0:
                     if await next_button.is_enabled() and await next_button.is_visible():
                         print(f"    ➡️ {page_num+1}페이지로 이동 중...")
+                        previous_first_row = await page.evaluate(FIRST_ROW_JS)
                         await next_button.click()
-                        await page.wait_for_load_state('networkidle', timeout=40000)
-                        await page.wait_for_timeout(2000)
+                        await wait_for_page_change(page, previous_first_row)
                     else:
                         print("🔚 다음 페이지 버튼이 비활성화되었거나 숨겨져 있습니다. 스크래핑을 종료합니다.")
                         break
@@ -251,25 +632,83 @@ async def run():
                     print("🔚 다음 페이지 링크를 찾을 수 없습니다. 스크래핑을 종료합니다.")
                     break
 
-            df = pd.DataFrame(articles_data)
-            final_columns = [
-                '제목', '저자_상세', '초록', '키워드_상세', '저자', 
-                '저널명', '발행기관', '권', '호', '시작페이지', '종료페이지',
-                '발행년도', '주제분야', '인용횟수', '논문ID'
-            ]
-            existing_cols = [col for col in final_columns if col in df.columns]
-            df = df[existing_cols]
+            await process_retry_queue(
+                retry_queue, context, page_pool, http_client, crawl_state, writer, page_cache, rate_limiter)
 
-            df.to_csv('kci_articles_all_fields_with_details.csv', index=False, encoding='utf-8-sig')
-            print(f"\n✅ 저장 완료: kci_articles_all_fields_with_details.csv (총 {len(df)}건)")
+            writer.flush()
+            print(f"\n✅ 저장 완료: {output_csv} (총 {writer.existing + writer.count}건, 이번 실행 {writer.count}건)")
 
         except Exception as e:
+            metrics.incr('crawl_errors', error=type(e).__name__)
             print(f"\n🚨 전체 스크립트 실행 중 치명적인 오류 발생: {e}")
             import traceback
             traceback.print_exc()
+            raise
 
         finally:
+            writer.close()
+            metrics.print_summary()
+            metrics.close(METRICS_PROMETHEUS_PATH)
+            print(f"🚦 요청 속도 조절: {rate_limiter.summary()}")
+            print(f"💾 진행 상태: {crawl_state.counts()} (다시 실행하면 완료된 논문은 건너뛰고 실패한 논문만 재시도합니다)")
+            crawl_state.close()
+            if page_cache is not None:
+                page_cache.evict()
+                page_cache.close()
+            if http_client is not None:
+                await http_client.aclose()
+            await close_page_pool(page_pool)
             await browser.close()
 
+def replay_from_cache(query=None, output_csv=REPLAY_OUTPUT_CSV_PATH):
+    """
+    네트워크 없이 페이지 캐시에 저장된 검색 결과/상세 페이지만으로 추출을 다시 실행해 CSV로 저장합니다.
+    파싱 규칙(kci_detail_parser)을 바꾼 뒤 결과를 다시 만들 때 사용합니다.
+    """
+    query = query or search_query()
+    started = time.perf_counter()
+    missing_details = duplicates = 0
+    seen_ids = set()
+    with PageCache(PAGE_CACHE_DIR) as page_cache, StreamingArticleWriter(output_csv) as writer:
+        # 샤드 없이 수집한 페이지와 발행년도 샤드별 페이지를 범위별로 묶어 페이지 순서대로 재생
+        search_pages = sorted(
+            ((parse_search_cache_key(url), search_html)
+             for url, _, search_html in page_cache.iter_pages(KIND_SEARCH, search_cache_prefix(query))),
+            key=lambda item: (item[0][0] or (0, 0), item[0][1]),
+        )
+        for (year_range, _), search_html in search_pages:
+            for fields in parse_search_rows_html(search_html):
+                if fields['href'] is None and fields['title'] is None:
+                    continue
+                record = build_article_record(fields['inputs'], fields['title'])
+                if not in_year_range(record, year_range):
+                    continue
+                # 여러 범위(샤드, 샤드 없는 수집)에 함께 저장된 논문은 한 번만 기록 (kci_sharded_crawl 병합과 같음)
+                if record['논문ID']:
+                    if record['논문ID'] in seen_ids:
+                        duplicates += 1
+                        continue
+                    seen_ids.add(record['논문ID'])
+                detail_html = page_cache.get(KCI_BASE_URL + fields['href'], touch=False) if fields['href'] else None
+                if detail_html is None:
+                    missing_details += 1
+                else:
+                    record['초록'], record['저자_상세'], record['키워드_상세'] = parse_detail_html(detail_html)
+                writer.write(record)
+
+    print(f"✅ 캐시 재생 완료: {output_csv} (총 {writer.count}건, 중복 제거 {duplicates}건, 상세 페이지 없음 {missing_details}건, "
+          f"{time.perf_counter() - started:.2f}초)")
+
 if __name__ == '__main__':
-    asyncio.run(run())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='KCI 논문 상세 정보 스크래퍼')
+    parser.add_argument('--replay', action='store_true', help='네트워크 없이 페이지 캐시만으로 추출을 다시 실행')
+    parser.add_argument('--output', default=REPLAY_OUTPUT_CSV_PATH, help='--replay 결과 CSV 경로')
+    args = parser.parse_args()
+
+    if args.replay:
+        replay_from_cache(output_csv=args.output)
+    else:
+        try:
+            asyncio.run(run())
+        except Exception:
+            sys.exit(1) # 오류 내용은 run() 이 이미 출력함
\ No newline at end of file
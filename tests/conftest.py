@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# 테스트에서 저장소 최상위의 kci_* 모듈을 바로 import 할 수 있게 함
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 데이터셋/색인 캐시는 저장소의 .kci_cache 대신 임시 디렉토리에 만듦 (kci_* 모듈을 import 하기 전에 지정해야 함)
+os.environ['KCI_CACHE_DIR'] = tempfile.mkdtemp(prefix='kci_test_cache_')
+os.environ.pop('KCI_SEARCH_INDEX', None)
@@ -0,0 +1,30 @@
+"""
+조각 단위(스트리밍) 분석이 전체를 읽어 계산한 결과와 같은지 확인합니다.
+(번들 CSV 와, 논문ID 가 중복된 행이 섞인 kci_synthetic 가상 데이터)
+"""
+
+import pandas as pd
+import pytest
+
+from analyze_kci import summarize_in_memory, summarize_stream
+from kci_dataset import DATASET_CSV_PATH
+from kci_synthetic import synthetic_csv
+
+
+def assert_same_summary(path, chunk_rows):
+    expected = summarize_in_memory(path)
+    actual = summarize_stream(path, chunk_rows=chunk_rows)
+    pd.testing.assert_series_equal(actual.yearly_counts, expected.yearly_counts, check_names=False, check_index_type=False)
+    pd.testing.assert_series_equal(actual.ai_xr_counts, expected.ai_xr_counts, check_names=False, check_index_type=False)
+    assert actual.densities == pytest.approx(expected.densities)
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 37])
+def test_stream_matches_in_memory_on_bundled_csv(chunk_rows):
+    assert_same_summary(DATASET_CSV_PATH, chunk_rows)
+
+
+def test_stream_matches_in_memory_with_duplicate_ids(tmp_path):
+    path = synthetic_csv(400, seed=7, corpus_dir=str(tmp_path))
+    assert pd.read_csv(path, encoding='utf-8-sig')['논문ID'].duplicated().any()
+    assert_same_summary(path, chunk_rows=29)
@@ -0,0 +1,50 @@
+"""
+StreamingArticleWriter 로 이어 쓸 때, 중단된 마지막 레코드만 잘라 내고 여러 줄 초록은 보존하는지 확인합니다.
+"""
+
+import csv
+
+from kci_output import StreamingArticleWriter
+
+
+def record(article_id, abstract):
+    return {'제목': f'제목 {article_id}', '초록': abstract, '논문ID': article_id, '발행년도': '2024'}
+
+
+def read_rows(path):
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_resume_keeps_multiline_abstract(tmp_path):
+    path = tmp_path / 'articles.csv'
+    with StreamingArticleWriter(str(path), batch_size=1) as writer:
+        writer.write(record('ART1', '첫 문단입니다.\n둘째 문단, "인용"도 있습니다.'))
+        writer.write(record('ART2', '한 줄 초록'))
+
+    # 따옴표 안의 줄바꿈 직후에 중단된 레코드를 흉내 냄
+    with open(path, 'ab') as f:
+        f.write('제목 ART3,,"중단된 초록\n뒷부분'.encode('utf-8'))
+
+    with StreamingArticleWriter(str(path), append=True) as writer:
+        assert writer.existing == 2
+        assert writer.existing_ids == {'ART1', 'ART2'}
+        writer.write(record('ART1', '다시 전달된 논문'))
+        writer.write(record('ART3', '새 초록\n두 줄'))
+
+    rows = read_rows(path)
+    assert [row['논문ID'] for row in rows] == ['ART1', 'ART2', 'ART3']
+    assert rows[0]['초록'] == '첫 문단입니다.\n둘째 문단, "인용"도 있습니다.'
+    assert rows[2]['초록'] == '새 초록\n두 줄'
+
+
+def test_resume_on_complete_file_keeps_everything(tmp_path):
+    path = tmp_path / 'articles.csv'
+    with StreamingArticleWriter(str(path)) as writer:
+        writer.write(record('ART1', '줄바꿈으로\n끝나는 초록\n'))
+    size = path.stat().st_size
+
+    with StreamingArticleWriter(str(path), append=True) as writer:
+        assert writer.existing_ids == {'ART1'}
+    assert path.stat().st_size == size
+    assert read_rows(path)[0]['초록'] == '줄바꿈으로\n끝나는 초록\n'
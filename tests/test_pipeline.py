@@ -0,0 +1,35 @@
+"""
+빈 캐시 디렉토리에서 kci_pipeline 을 여러 작업 프로세스로 실행해 보는 테스트입니다.
+(metrics 와 tech_ratio 처럼 전문 검색 색인을 쓰는 단계가 동시에 실행되어도 실패하지 않아야 함)
+
+    python -m pytest tests
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_pipeline(cache_dir, out_dir, workers):
+    env = {**os.environ, 'KCI_CACHE_DIR': str(cache_dir), 'MPLBACKEND': 'Agg'}
+    env.pop('KCI_SEARCH_INDEX', None)
+    return subprocess.run(
+        [sys.executable, 'kci_pipeline.py', '--workers', str(workers), '--out', str(out_dir)],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=600,
+    )
+
+
+def test_parallel_run_on_empty_cache(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    result = run_pipeline(cache_dir, tmp_path / 'report', workers=4)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert '파이프라인 완료' in result.stdout
+    assert 'AI/XR 키워드 포함 논문' in result.stdout
+    assert (cache_dir / 'pipeline' / 'search.sqlite').exists()
+
+    # 다시 실행하면 원천 단계(scrape) 외에는 모두 저장된 결과를 사용
+    again = run_pipeline(cache_dir, tmp_path / 'report', workers=4)
+    assert again.returncode == 0, again.stdout + again.stderr
+    assert '실행 1개' in again.stdout
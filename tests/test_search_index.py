@@ -0,0 +1,79 @@
+"""
+전문 검색 색인의 연도별 포함 논문 수가 DataFrame 에서 str.contains 로 센 값과 같은지 확인합니다.
+(trigram 을 쓰지 않는 2글자 키워드, 증분 sync, 논문ID 중복 행)
+"""
+
+import pandas as pd
+import pytest
+
+from analyze_kci import AI_XR_KEYWORDS
+from kci_dataset import load_articles
+from kci_search_index import INDEX_COLUMNS, ArticleIndex
+
+
+def contains_counts(df, keywords):
+    text = df[list(INDEX_COLUMNS)].fillna('').astype(str).apply(lambda column: column.str.lower())
+    mask = pd.Series(False, index=df.index)
+    for keyword in keywords:
+        for column in text:
+            mask |= text[column].str.contains(keyword.lower(), regex=False)
+    years = pd.to_numeric(df['발행년도'], errors='coerce').fillna(0).astype(int)
+    return years[mask].value_counts().sort_index()
+
+
+def assert_counts_match(index, df, keywords):
+    actual = index.year_counts(keywords)
+    expected = contains_counts(df, keywords)
+    assert actual.to_dict() == expected.to_dict(), keywords
+
+
+def article(article_id, year, title, abstract='', keywords=''):
+    return {'논문ID': article_id, '발행년도': year, '제목': title, '초록': abstract, '키워드_상세': keywords}
+
+
+@pytest.fixture
+def index(tmp_path):
+    with ArticleIndex(str(tmp_path / 'search.sqlite')) as index:
+        yield index
+
+
+@pytest.mark.parametrize('keywords', [AI_XR_KEYWORDS, ['ai'], ['ar'], ['메타버스'], ['digital twin', 'vr']])
+def test_bundled_csv_matches_str_contains(index, keywords):
+    df = load_articles()
+    index.sync(df)
+    assert_counts_match(index, df, keywords)
+
+
+def test_short_keywords_and_duplicate_ids(index):
+    df = pd.DataFrame([
+        article('A1', 2020, 'AR 기반 전시', 'Augmented Reality'),
+        article('A2', 2020, 'Art Museum', '현대 미술관'),
+        article('A3', 2021, '도서관 서비스', '', 'AI; 챗봇'),
+        article('A3', 2021, '도서관 서비스', '', 'AI; 챗봇'),     # 같은 논문이 두 번 수집된 행
+        article('A4', 2022, 'Research data', 'fair 원칙'),
+        article('', 2022, '논문ID 없는 행', 'VR 체험'),
+    ])
+    index.sync(df)
+    assert len(index) == 5
+    for keywords in (['ai'], ['ar'], ['vr', 'ar'], ['augmented reality'], ['도서관']):
+        assert_counts_match(index, df, keywords)
+    assert index.year_counts(['ai'], distinct=True).to_dict() == {2021: 1, 2022: 1}
+
+
+def test_incremental_sync_after_change_and_removal(index):
+    df = pd.DataFrame([
+        article('A1', 2020, '메타버스 전시', 'vr 체험'),
+        article('A2', 2021, '디지털 아카이브', 'ai 분류'),
+        article('A3', 2022, '박물관 교육', '메타버스 플랫폼'),
+    ])
+    assert index.sync(df) == (3, 0)
+
+    changed = df.drop(index=2).copy()
+    changed.loc[0, '초록'] = '현장 체험'               # 'vr' 제거
+    changed.loc[1, '제목'] = '메타버스 아카이브'        # '메타버스' 추가
+    changed = pd.concat([changed, pd.DataFrame([article('A4', 2023, 'XR 콘텐츠')])], ignore_index=True)
+    assert index.sync(changed) == (3, 1)
+    assert index.sync(changed) == (0, 0)
+
+    for keywords in (['vr'], ['메타버스'], ['ai', 'xr'], AI_XR_KEYWORDS):
+        assert_counts_match(index, changed, keywords)
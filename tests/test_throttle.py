@@ -0,0 +1,35 @@
+"""
+AdaptiveRateLimiter 의 동시 요청 슬롯이 취소된 요청에서도 반환되는지 확인합니다.
+"""
+
+import asyncio
+
+from kci_throttle import AdaptiveRateLimiter, limited
+
+
+def test_cancel_while_waiting_for_token_releases_slot():
+    async def scenario():
+        limiter = AdaptiveRateLimiter(max_concurrency=2, rate=0.5, burst=1)
+        limiter._tokens = 0.0   # 다음 토큰까지 약 2초
+
+        async def request():
+            async with limiter.slot():
+                pass
+
+        task = asyncio.ensure_future(request())
+        await asyncio.sleep(0.05)
+        assert limiter._in_flight == 1
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert task.cancelled()
+        assert limiter._in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_limited_without_limiter_is_async_context():
+    async def scenario():
+        async with limited(None):
+            return 'done'
+
+    assert asyncio.run(scenario()) == 'done'
@@ -0,0 +1,26 @@
+"""
+정규식 토크나이저가 명사의 끝 글자를 조사로 잘못 떼지 않는지 확인합니다.
+"""
+
+import pandas as pd
+
+from kci_tokenize import merge_particle_variants, regex_tokenize, tokenize_articles
+
+
+def test_regex_tokenize_keeps_ambiguous_endings():
+    assert regex_tokenize('연구에서는 연구결과 민주주의 교육효과') == ['연구에서는', '연구결과', '민주주의', '교육효과']
+    assert regex_tokenize('플랫폼으로 큐레이션까지') == ['플랫폼', '큐레이션']
+
+
+def test_merge_strips_only_when_stem_occurs():
+    docs = ['연구결과를 연구결과의 연구에서는 민주주의', '연구결과 연구 교육효과']
+    assert merge_particle_variants(docs) == ['연구결과 연구결과 연구 민주주의', '연구결과 연구 교육효과']
+
+
+def test_tokenize_articles_merges_across_columns(tmp_path):
+    df = pd.DataFrame({'논문ID': ['A1', 'A2'], '키워드': ['연구결과', '민주주의'], '초록': ['연구결과를 보고함', '민주주의의 위기']})
+    result = tokenize_articles(df, ['키워드', '초록'], tokenizer='regex', cache_path=str(tmp_path / 'tokens.sqlite'))
+    assert result['초록'].tolist() == ['연구결과 보고함', '민주주의 위기']
+    # 캐시에서 다시 읽어도 같은 결과
+    again = tokenize_articles(df, ['키워드', '초록'], tokenizer='regex', cache_path=str(tmp_path / 'tokens.sqlite'))
+    assert again.equals(result)
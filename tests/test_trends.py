@@ -0,0 +1,42 @@
+"""
+TrendEngine 의 키워드 빈도가 불용어까지 포함해 원문에서 센 값과 같은지 확인합니다.
+"""
+
+import pandas as pd
+
+from kci_tokenize import PRETOKENIZED_PATTERN
+from kci_trends import TREND_STOP_WORDS, TrendEngine
+
+TEXTS = [
+    '디지털 큐레이션 연구 분석 연구',
+    '메타버스 연구 방법 분석 데이터분석',
+    'ai 큐레이션 서비스 분석',
+    '디지털 아카이브 연구 대상',
+]
+YEARS = ['2022', '2022', '2023', '2024']
+
+
+def expected_counts(keywords):
+    frame = pd.DataFrame({'text': TEXTS, 'year': YEARS})
+    return pd.DataFrame({keyword: frame['text'].str.count(keyword).groupby(frame['year']).sum() for keyword in keywords})
+
+
+def test_keyword_counts_include_stop_words():
+    engine = TrendEngine(TEXTS, YEARS, token_pattern=PRETOKENIZED_PATTERN)
+    keywords = ['분석', '연구', '큐레이션', 'ai']
+    counts = engine.keyword_counts(keywords)
+    assert (counts.values == expected_counts(keywords).values).all()
+
+
+def test_stop_words_excluded_from_tfidf():
+    engine = TrendEngine(TEXTS, YEARS, token_pattern=PRETOKENIZED_PATTERN)
+    assert not set(TREND_STOP_WORDS) & set(engine.terms.tolist())
+    assert not set(TREND_STOP_WORDS) & set(engine.top_terms('2022', k=20, max_features=3).index)
+    assert (engine.term_series(['분석'])['분석'] == 0).all()
+
+
+def test_add_documents_keeps_counts_unfiltered():
+    engine = TrendEngine(TEXTS[:2], YEARS[:2], token_pattern=PRETOKENIZED_PATTERN)
+    engine.add_documents(TEXTS[2:], YEARS[2:])
+    keywords = ['분석', '연구']
+    assert (engine.keyword_counts(keywords).values == expected_counts(keywords).values).all()